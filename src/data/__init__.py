@@ -2,15 +2,27 @@
 Data modules for Pokémon information.
 """
 
-from .pokemon_data import POKEMON_DATA, ALL_TYPES, TYPE_CHART
-from .move_data import MOVE_DATA, POKEMON_MOVES, get_moves_for_pokemon, get_move_info
+from .pokemon_data import POKEMON_DATA, ALL_TYPES, TYPE_CHART, get_pokemon_types
+from .move_data import MOVE_DATA, POKEMON_MOVES, get_moves_for_pokemon, get_move_info, REVERSE_INDEX
+from .records import Species, Move
+from .base_stats import Stats, get_base_stat_table
+from .versioning import get_data_version, notify_data_changed, register_invalidation_hook
 
 __all__ = [
     'POKEMON_DATA',
     'ALL_TYPES', 
     'TYPE_CHART',
+    'get_pokemon_types',
     'MOVE_DATA',
     'POKEMON_MOVES',
     'get_moves_for_pokemon',
-    'get_move_info'
+    'get_move_info',
+    'REVERSE_INDEX',
+    'Species',
+    'Move',
+    'Stats',
+    'get_base_stat_table',
+    'get_data_version',
+    'notify_data_changed',
+    'register_invalidation_hook'
 ] 
\ No newline at end of file
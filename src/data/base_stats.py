@@ -0,0 +1,517 @@
+"""
+Base stats for every species.
+The six base stats are compiled into one contiguous unsigned-short array
+indexed by species id, and final stats for a level, EV/IV spread and nature
+are computed a whole stat column at a time for the entire roster.
+"""
+
+from array import array
+from collections import namedtuple
+
+from .pokemon_data import POKEMON_DATA
+from .versioning import register_invalidation_hook
+
+# Battle stats of one Pokémon, in the order they are stored
+Stats = namedtuple('Stats', ['hp', 'attack', 'defense', 'sp_attack', 'sp_defense', 'speed'])
+
+STAT_NAMES = Stats._fields
+NUM_STATS = len(STAT_NAMES)
+HP, ATTACK, DEFENSE, SP_ATTACK, SP_DEFENSE, SPEED = range(NUM_STATS)
+
+# Nature -> (raised stat, lowered stat); neutral natures have neither
+NATURES = {
+    "Hardy": (None, None), "Docile": (None, None), "Serious": (None, None),
+    "Bashful": (None, None), "Quirky": (None, None),
+    "Lonely": (ATTACK, DEFENSE), "Brave": (ATTACK, SPEED),
+    "Adamant": (ATTACK, SP_ATTACK), "Naughty": (ATTACK, SP_DEFENSE),
+    "Bold": (DEFENSE, ATTACK), "Relaxed": (DEFENSE, SPEED),
+    "Impish": (DEFENSE, SP_ATTACK), "Lax": (DEFENSE, SP_DEFENSE),
+    "Timid": (SPEED, ATTACK), "Hasty": (SPEED, DEFENSE),
+    "Jolly": (SPEED, SP_ATTACK), "Naive": (SPEED, SP_DEFENSE),
+    "Modest": (SP_ATTACK, ATTACK), "Mild": (SP_ATTACK, DEFENSE),
+    "Quiet": (SP_ATTACK, SPEED), "Rash": (SP_ATTACK, SP_DEFENSE),
+    "Calm": (SP_DEFENSE, ATTACK), "Gentle": (SP_DEFENSE, DEFENSE),
+    "Sassy": (SP_DEFENSE, SPEED), "Careful": (SP_DEFENSE, SP_ATTACK),
+}
+
+DEFAULT_IVS = (31,) * NUM_STATS
+DEFAULT_EVS = (0,) * NUM_STATS
+
+# Base stats: HP, Attack, Defense, Sp. Atk, Sp. Def, Speed
+# Only used to compile BaseStatTable; read stats through get_base_stat_table()
+_BASE_STAT_SOURCE = {
+    "Bulbasaur": (45, 49, 49, 65, 65, 45),
+    "Charmander": (39, 52, 43, 60, 50, 65),
+    "Squirtle": (44, 48, 65, 50, 64, 43),
+    "Pikachu": (35, 55, 40, 50, 50, 90),
+    "Jigglypuff": (115, 45, 20, 45, 25, 20),
+    "Machamp": (90, 130, 80, 65, 85, 55),
+    "Gengar": (60, 65, 60, 130, 75, 110),
+    "Onix": (35, 45, 160, 30, 45, 70),
+    "Eevee": (55, 55, 50, 45, 65, 55),
+    "Snorlax": (160, 110, 65, 65, 110, 30),
+    "Dragonite": (91, 134, 95, 100, 100, 80),
+    "Lucario": (70, 110, 70, 115, 70, 90),
+    "Gardevoir": (68, 65, 65, 125, 115, 80),
+    "Tyranitar": (100, 134, 110, 95, 100, 61),
+    "Metagross": (80, 135, 130, 95, 90, 70),
+    "Togekiss": (85, 50, 95, 120, 115, 80),
+    "Mimikyu": (55, 90, 80, 50, 105, 96),
+    "Charizard": (78, 84, 78, 109, 85, 100),
+    "Blastoise": (79, 83, 100, 85, 105, 78),
+    "Venusaur": (80, 82, 83, 100, 100, 80),
+    "Alakazam": (55, 50, 45, 135, 95, 120),
+    "Arcanine": (90, 110, 80, 100, 80, 95),
+    "Gyarados": (95, 125, 79, 60, 100, 81),
+    "Jolteon": (65, 65, 60, 110, 95, 130),
+    "Vaporeon": (130, 65, 60, 110, 95, 65),
+    "Flareon": (65, 130, 60, 95, 110, 65),
+    "Rhydon": (105, 130, 120, 45, 45, 40),
+    "Lapras": (130, 85, 80, 85, 95, 60),
+    "Articuno": (90, 85, 100, 95, 125, 85),
+    "Zapdos": (90, 90, 85, 125, 90, 100),
+    "Moltres": (90, 100, 90, 125, 85, 90),
+    "Mewtwo": (106, 110, 90, 154, 90, 130),
+    "Mew": (100, 100, 100, 100, 100, 100),
+    "Typhlosion": (78, 84, 78, 109, 85, 100),
+    "Feraligatr": (85, 105, 100, 79, 83, 78),
+    "Meganium": (80, 82, 100, 83, 100, 80),
+    "Ampharos": (90, 75, 85, 115, 90, 55),
+    "Scizor": (70, 130, 100, 55, 80, 65),
+    "Heracross": (80, 125, 75, 40, 95, 85),
+    "Umbreon": (95, 65, 110, 60, 130, 65),
+    "Espeon": (65, 65, 60, 130, 95, 110),
+    "Donphan": (90, 120, 120, 60, 60, 50),
+    "Sceptile": (70, 85, 65, 105, 85, 120),
+    "Blaziken": (80, 120, 70, 110, 70, 80),
+    "Swampert": (100, 110, 90, 85, 90, 60),
+    "Salamence": (95, 135, 80, 110, 80, 100),
+    "Groudon": (100, 150, 140, 100, 90, 90),
+    "Kyogre": (100, 100, 90, 150, 140, 90),
+    "Rayquaza": (105, 150, 90, 150, 90, 95),
+    "Staraptor": (85, 120, 70, 50, 60, 100),
+    "Luxray": (80, 120, 79, 95, 79, 70),
+    "Garchomp": (108, 130, 95, 80, 85, 102),
+    "Weavile": (70, 120, 65, 45, 85, 125),
+    "Porygon-Z": (85, 80, 70, 135, 75, 90),
+    "Heatran": (91, 90, 106, 130, 106, 77),
+    "Giratina": (150, 100, 120, 100, 120, 90),
+    "Dialga": (100, 120, 120, 150, 100, 90),
+    "Palkia": (90, 120, 100, 150, 120, 100),
+    "Darkrai": (70, 90, 90, 135, 90, 125),
+    "Shaymin": (100, 100, 100, 100, 100, 100),
+    "Arceus": (120, 120, 120, 120, 120, 120),
+    "Zoroark": (60, 105, 60, 120, 60, 105),
+    "Chandelure": (60, 55, 90, 145, 90, 80),
+    "Haxorus": (76, 147, 90, 60, 70, 97),
+    "Hydreigon": (92, 105, 90, 125, 90, 98),
+    "Volcarona": (85, 60, 65, 135, 105, 100),
+    "Reshiram": (100, 120, 100, 150, 120, 90),
+    "Zekrom": (100, 150, 120, 120, 100, 90),
+    "Kyurem": (125, 130, 90, 130, 90, 95),
+    "Greninja": (72, 95, 67, 103, 71, 122),
+    "Talonflame": (78, 81, 71, 74, 69, 126),
+    "Aegislash": (60, 50, 140, 50, 140, 60),
+    "Sylveon": (95, 65, 65, 110, 130, 60),
+    "Hawlucha": (78, 92, 75, 74, 63, 118),
+    "Goodra": (90, 100, 70, 110, 150, 80),
+    "Decidueye": (78, 107, 75, 100, 100, 70),
+    "Incineroar": (95, 115, 90, 80, 90, 60),
+    "Primarina": (80, 74, 74, 126, 116, 60),
+    "Lycanroc": (75, 115, 65, 55, 65, 112),
+    "Kommo-o": (75, 110, 125, 100, 105, 85),
+    "Necrozma": (97, 107, 101, 127, 89, 79),
+    "Corviknight": (98, 87, 105, 53, 85, 67),
+    "Cinderace": (80, 116, 75, 65, 75, 119),
+    "Inteleon": (70, 85, 65, 125, 65, 120),
+    "Rillaboom": (100, 125, 90, 60, 70, 85),
+    "Dragapult": (88, 120, 75, 100, 75, 142),
+    "Toxtricity": (75, 98, 70, 114, 70, 75),
+    "Urshifu": (100, 130, 100, 63, 60, 97),
+    "Zacian": (92, 120, 115, 80, 115, 138),
+    "Zamazenta": (92, 120, 115, 80, 115, 138),
+    "Calyrex": (100, 80, 80, 80, 100, 80),
+    "Flutter Mane": (55, 55, 55, 135, 135, 135),
+    "Iron Hands": (154, 140, 108, 50, 68, 50),
+    "Gholdengo": (87, 60, 95, 133, 91, 84),
+    "Skeledirge": (104, 75, 100, 110, 75, 66),
+    "Quaquaval": (85, 120, 80, 85, 75, 85),
+    "Meowscarada": (76, 110, 70, 81, 70, 123),
+    "Abra": (25, 20, 15, 105, 55, 90),
+    "Kadabra": (40, 35, 30, 120, 70, 105),
+    "Diglett": (10, 55, 25, 35, 45, 95),
+    "Dugtrio": (35, 100, 50, 50, 70, 120),
+    "Meowth": (40, 45, 35, 40, 40, 90),
+    "Persian": (65, 70, 60, 65, 65, 115),
+    "Poliwag": (40, 50, 40, 40, 40, 90),
+    "Poliwhirl": (65, 65, 65, 50, 50, 90),
+    "Poliwrath": (90, 95, 95, 70, 90, 70),
+    "Machop": (70, 80, 50, 35, 35, 35),
+    "Machoke": (80, 100, 70, 50, 60, 45),
+    "Bellsprout": (50, 75, 35, 70, 30, 40),
+    "Weepinbell": (65, 90, 50, 85, 45, 55),
+    "Victreebel": (80, 105, 65, 100, 70, 70),
+    "Tentacool": (40, 40, 35, 50, 100, 70),
+    "Tentacruel": (80, 70, 65, 80, 120, 100),
+    "Geodude": (40, 80, 100, 30, 30, 20),
+    "Graveler": (55, 95, 115, 45, 45, 35),
+    "Golem": (80, 120, 130, 55, 65, 45),
+    "Ponyta": (50, 85, 55, 65, 65, 90),
+    "Rapidash": (65, 100, 70, 80, 80, 105),
+    "Slowpoke": (90, 65, 65, 40, 40, 15),
+    "Slowbro": (95, 75, 110, 100, 80, 30),
+    "Magnemite": (25, 35, 70, 95, 55, 45),
+    "Magneton": (50, 60, 95, 120, 70, 70),
+    "Farfetch'd": (52, 90, 55, 58, 62, 60),
+    "Doduo": (35, 85, 45, 35, 35, 75),
+    "Dodrio": (60, 110, 70, 60, 60, 110),
+    "Seel": (65, 45, 55, 45, 70, 45),
+    "Dewgong": (90, 70, 80, 70, 95, 70),
+    "Grimer": (80, 80, 50, 40, 50, 25),
+    "Muk": (105, 105, 75, 65, 100, 50),
+    "Shellder": (30, 65, 100, 45, 25, 40),
+    "Cloyster": (50, 95, 180, 85, 45, 70),
+    "Gastly": (30, 35, 30, 100, 35, 80),
+    "Haunter": (45, 50, 45, 115, 55, 95),
+    "Drowzee": (60, 48, 45, 43, 90, 42),
+    "Hypno": (85, 73, 70, 73, 115, 67),
+    "Krabby": (30, 105, 90, 25, 25, 50),
+    "Kingler": (55, 130, 115, 50, 50, 75),
+    "Voltorb": (40, 30, 50, 55, 55, 100),
+    "Electrode": (60, 50, 70, 80, 80, 150),
+    "Exeggcute": (60, 40, 80, 60, 45, 40),
+    "Exeggutor": (95, 95, 85, 125, 75, 55),
+    "Cubone": (50, 50, 95, 40, 50, 35),
+    "Marowak": (60, 80, 110, 50, 80, 45),
+    "Hitmonlee": (50, 120, 53, 35, 110, 87),
+    "Hitmonchan": (50, 105, 79, 35, 110, 76),
+    "Lickitung": (90, 55, 75, 60, 75, 30),
+    "Koffing": (40, 65, 95, 60, 45, 35),
+    "Weezing": (65, 90, 120, 85, 70, 60),
+    "Rhyhorn": (80, 85, 95, 30, 30, 25),
+    "Chansey": (250, 5, 5, 35, 105, 50),
+    "Tangela": (65, 55, 115, 100, 40, 60),
+    "Kangaskhan": (105, 95, 80, 40, 80, 90),
+    "Horsea": (30, 40, 70, 70, 25, 60),
+    "Seadra": (55, 65, 95, 95, 45, 85),
+    "Goldeen": (45, 67, 60, 35, 50, 63),
+    "Seaking": (80, 92, 65, 65, 80, 68),
+    "Staryu": (30, 45, 55, 70, 55, 85),
+    "Starmie": (60, 75, 85, 100, 85, 115),
+    "Mr. Mime": (40, 45, 65, 100, 120, 90),
+    "Scyther": (70, 110, 80, 55, 80, 105),
+    "Jynx": (65, 50, 35, 115, 95, 95),
+    "Electabuzz": (65, 83, 57, 95, 85, 105),
+    "Magmar": (65, 95, 57, 100, 85, 93),
+    "Pinsir": (65, 125, 100, 55, 70, 85),
+    "Tauros": (75, 100, 95, 40, 70, 110),
+    "Magikarp": (20, 10, 55, 15, 20, 80),
+    "Ditto": (48, 48, 48, 48, 48, 48),
+    "Porygon": (65, 60, 70, 85, 75, 40),
+    "Omanyte": (35, 40, 100, 90, 55, 35),
+    "Omastar": (70, 60, 125, 115, 70, 55),
+    "Kabuto": (30, 80, 90, 55, 45, 55),
+    "Kabutops": (60, 115, 105, 65, 70, 80),
+    "Aerodactyl": (80, 105, 65, 60, 75, 130),
+    "Dratini": (41, 64, 45, 50, 50, 50),
+    "Dragonair": (61, 84, 65, 70, 70, 70),
+    "Chikorita": (45, 49, 65, 49, 65, 45),
+    "Bayleef": (60, 62, 80, 63, 80, 60),
+    "Cyndaquil": (39, 52, 43, 60, 50, 65),
+    "Quilava": (58, 64, 58, 80, 65, 80),
+    "Totodile": (50, 65, 64, 44, 48, 43),
+    "Croconaw": (65, 80, 80, 59, 63, 58),
+    "Sentret": (35, 46, 34, 35, 45, 20),
+    "Furret": (85, 76, 64, 45, 55, 90),
+    "Hoothoot": (60, 30, 30, 36, 56, 50),
+    "Noctowl": (100, 50, 50, 86, 96, 70),
+    "Ledyba": (40, 20, 30, 40, 80, 55),
+    "Ledian": (55, 35, 50, 55, 110, 85),
+    "Spinarak": (40, 60, 40, 40, 40, 30),
+    "Ariados": (70, 90, 70, 60, 70, 40),
+    "Crobat": (85, 90, 80, 70, 80, 130),
+    "Chinchou": (75, 38, 38, 56, 56, 67),
+    "Lanturn": (125, 58, 58, 76, 76, 67),
+    "Pichu": (20, 40, 15, 35, 35, 60),
+    "Cleffa": (50, 25, 28, 45, 55, 15),
+    "Igglybuff": (90, 30, 15, 40, 20, 15),
+    "Togepi": (35, 20, 65, 40, 65, 20),
+    "Togetic": (55, 40, 85, 80, 105, 40),
+    "Natu": (40, 50, 45, 70, 45, 70),
+    "Xatu": (65, 75, 70, 95, 70, 95),
+    "Mareep": (55, 40, 40, 65, 45, 35),
+    "Flaaffy": (70, 55, 55, 80, 60, 45),
+    "Sudowoodo": (70, 100, 115, 30, 65, 30),
+    "Politoed": (90, 75, 75, 90, 100, 70),
+    "Hoppip": (35, 35, 40, 35, 55, 50),
+    "Skiploom": (55, 45, 50, 45, 65, 80),
+    "Jumpluff": (75, 55, 70, 55, 95, 110),
+    "Aipom": (55, 70, 55, 40, 55, 85),
+    "Sunkern": (30, 30, 30, 30, 30, 30),
+    "Sunflora": (75, 75, 55, 105, 85, 30),
+    "Yanma": (65, 65, 45, 75, 45, 95),
+    "Wooper": (55, 45, 45, 25, 25, 15),
+    "Quagsire": (95, 85, 85, 65, 65, 35),
+    "Murkrow": (60, 85, 42, 85, 42, 91),
+    "Slowking": (95, 75, 80, 100, 110, 30),
+    "Misdreavus": (60, 60, 60, 85, 85, 85),
+    "Unown": (48, 72, 48, 72, 48, 48),
+    "Wobbuffet": (190, 33, 58, 33, 58, 33),
+    "Girafarig": (70, 80, 65, 90, 65, 85),
+    "Pineco": (50, 65, 90, 35, 35, 15),
+    "Forretress": (75, 90, 140, 60, 60, 40),
+    "Dunsparce": (100, 70, 70, 65, 65, 45),
+    "Gligar": (65, 75, 105, 35, 65, 85),
+    "Steelix": (75, 85, 200, 55, 65, 30),
+    "Snubbull": (60, 80, 50, 40, 40, 30),
+    "Granbull": (90, 120, 75, 60, 60, 45),
+    "Qwilfish": (65, 95, 85, 55, 55, 85),
+    "Shuckle": (20, 10, 230, 10, 230, 5),
+    "Sneasel": (55, 95, 55, 35, 75, 115),
+    "Teddiursa": (60, 80, 50, 50, 50, 40),
+    "Ursaring": (90, 130, 75, 75, 75, 55),
+    "Slugma": (40, 40, 40, 70, 40, 20),
+    "Magcargo": (60, 50, 120, 90, 80, 30),
+    "Swinub": (50, 50, 40, 30, 30, 50),
+    "Piloswine": (100, 100, 80, 60, 60, 50),
+    "Corsola": (65, 55, 95, 65, 95, 35),
+    "Remoraid": (35, 65, 35, 65, 35, 65),
+    "Octillery": (75, 105, 75, 105, 75, 45),
+    "Delibird": (45, 55, 45, 65, 45, 75),
+    "Mantine": (85, 40, 70, 80, 140, 70),
+    "Skarmory": (65, 80, 140, 40, 70, 70),
+    "Houndour": (45, 60, 30, 80, 50, 65),
+    "Houndoom": (75, 90, 50, 110, 80, 95),
+    "Kingdra": (75, 95, 95, 95, 95, 85),
+    "Phanpy": (90, 60, 60, 40, 40, 40),
+    "Porygon2": (85, 80, 90, 105, 95, 60),
+    "Stantler": (73, 95, 62, 85, 65, 85),
+    "Smeargle": (55, 20, 35, 20, 45, 75),
+    "Tyrogue": (35, 35, 35, 35, 35, 35),
+    "Hitmontop": (50, 95, 95, 35, 110, 70),
+    "Smoochum": (45, 30, 15, 85, 65, 65),
+    "Elekid": (45, 63, 37, 65, 55, 95),
+    "Magby": (45, 75, 37, 70, 55, 83),
+    "Miltank": (95, 80, 105, 40, 70, 100),
+    "Blissey": (255, 10, 10, 75, 135, 55),
+    "Raikou": (90, 85, 75, 115, 100, 115),
+    "Entei": (115, 115, 85, 90, 75, 100),
+    "Suicune": (100, 75, 115, 90, 115, 85),
+    "Larvitar": (50, 64, 50, 45, 50, 41),
+    "Pupitar": (70, 84, 70, 65, 70, 51),
+    "Lugia": (106, 90, 130, 90, 154, 110),
+    "Ho-Oh": (106, 130, 90, 110, 154, 90),
+    "Celebi": (100, 100, 100, 100, 100, 100),
+    "Drapion": (70, 90, 110, 60, 75, 95),
+    "Scorbunny": (50, 71, 40, 40, 40, 69),
+    "Grookey": (50, 65, 50, 40, 40, 65),
+    "Sobble": (50, 40, 40, 70, 40, 70),
+    "Cramorant": (70, 85, 55, 85, 95, 85),
+    "Appletun": (110, 85, 80, 100, 80, 30),
+    "Flapple": (70, 110, 80, 95, 60, 70),
+    "Coalossal": (110, 80, 120, 80, 90, 30),
+    "Urshifu (Single Strike)": (100, 130, 100, 63, 60, 97),
+    "Urshifu (Rapid Strike)": (100, 130, 100, 63, 60, 97),
+    "Zarude": (105, 120, 105, 70, 95, 105),
+    "Regieleki": (80, 100, 50, 100, 50, 200),
+    "Regidrago": (200, 100, 50, 100, 50, 80),
+    "Glastrier": (100, 145, 130, 65, 110, 30),
+    "Spectrier": (100, 65, 60, 145, 80, 130),
+    "Iron Bundle": (56, 80, 114, 124, 60, 136),
+    "Iron Moth": (80, 70, 60, 140, 110, 110),
+    "Iron Thorns": (100, 134, 110, 70, 84, 72),
+    "Iron Valiant": (74, 130, 90, 120, 60, 116),
+    "Iron Treads": (90, 112, 120, 72, 70, 106),
+    "Iron Jugulis": (94, 80, 86, 122, 80, 108),
+    "Walking Wake": (99, 83, 91, 125, 83, 109),
+    "Slither Wing": (85, 135, 79, 85, 105, 81),
+    "Sandy Shocks": (85, 81, 97, 121, 85, 101),
+    "Great Tusk": (115, 131, 131, 53, 53, 87),
+    "Brute Bonnet": (111, 127, 99, 79, 99, 55),
+    "Scream Tail": (115, 65, 99, 65, 115, 111),
+    "Roaring Moon": (105, 139, 71, 55, 101, 119),
+    "Iron Leaves": (90, 130, 88, 70, 108, 104),
+    "Dudunsparce": (125, 100, 80, 85, 75, 55),
+    "Maushold": (74, 75, 70, 65, 75, 111),
+    "Palafin": (100, 70, 72, 53, 62, 100),
+    "Tatsugiri": (68, 50, 60, 120, 95, 82),
+    "Cyclizar": (70, 95, 65, 85, 65, 121),
+    "Pawmot": (70, 115, 70, 70, 60, 105),
+    "Clodsire": (130, 75, 60, 45, 100, 20),
+    "Dondozo": (150, 100, 115, 65, 65, 35),
+    "Kingambit": (100, 135, 120, 60, 85, 50),
+    "Annihilape": (110, 115, 80, 50, 90, 90),
+    "Farigiraf": (120, 90, 70, 110, 70, 60),
+    "Dachsbun": (57, 80, 115, 50, 80, 95),
+    "Koraidon": (100, 135, 115, 85, 100, 135),
+    "Miraidon": (100, 85, 100, 135, 115, 135),
+}
+
+
+class BaseStatTable:
+    """
+    Base stats of the roster as one flat array.
+
+    Species ids are positions in species_names (POKEMON_DATA order); the
+    stats of species i are values[i * 6:i * 6 + 6], in Stats field order.
+    """
+
+    def __init__(self, species_names, values):
+        """
+        Initialize the table.
+
+        Args:
+            species_names (list): Pokémon names, in species id order
+            values (array): Flat unsigned-short array of size 6*N
+        """
+        self.species_names = list(species_names)
+        self.index = {name: i for i, name in enumerate(self.species_names)}
+        self.values = values
+
+    def __len__(self):
+        return len(self.species_names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def species_id(self, name):
+        """Get a Pokémon's species id, or None if it has no base stats."""
+        return self.index.get(name)
+
+    def base_stats(self, name):
+        """
+        Get a Pokémon's base stats.
+
+        Returns:
+            Stats: The base stats, or None if the Pokémon has none
+        """
+        species_id = self.index.get(name)
+        if species_id is None:
+            return None
+        start = species_id * NUM_STATS
+        return Stats(*self.values[start:start + NUM_STATS])
+
+    def column(self, stat):
+        """
+        Get one base stat of every species.
+
+        Args:
+            stat (int): Stat index (HP, ATTACK, ...)
+
+        Returns:
+            array: The stat, in species id order
+        """
+        return self.values[stat::NUM_STATS]
+
+    def compute_stats(self, level=50, evs=DEFAULT_EVS, ivs=DEFAULT_IVS, nature=None, species_ids=None):
+        """
+        Compute final stats for every species (or a subset) at once.
+
+        Each stat is computed down a whole column of the table with the
+        standard formula, including the nature's 10% raise and cut.
+
+        Args:
+            level (int): Level (1-100)
+            evs (tuple): Effort values, in Stats field order
+            ivs (tuple): Individual values, in Stats field order
+            nature (str): Nature name (None for a neutral nature)
+            species_ids (list): Species ids to compute (defaults to all, in id order)
+
+        Returns:
+            array: Flat unsigned-short array of 6 stats per species, in the
+            order of species_ids
+        """
+        if nature is not None and nature not in NATURES:
+            raise ValueError(f"Unknown nature: {nature}")
+        raised, lowered = NATURES.get(nature, (None, None))
+
+        if species_ids is None:
+            source = self.values
+        else:
+            source = array('H')
+            for species_id in species_ids:
+                start = species_id * NUM_STATS
+                source.extend(self.values[start:start + NUM_STATS])
+
+        result = array('H', bytes(source.itemsize * len(source)))
+        for stat in range(NUM_STATS):
+            bonus = ivs[stat] + evs[stat] // 4
+            column = source[stat::NUM_STATS]
+            if stat == HP:
+                values = [(2 * base + bonus) * level // 100 + level + 10 for base in column]
+            else:
+                multiplier = 110 if stat == raised else 90 if stat == lowered else 100
+                values = [((2 * base + bonus) * level // 100 + 5) * multiplier // 100 for base in column]
+            result[stat::NUM_STATS] = array('H', values)
+        return result
+
+    def stats(self, name, level=50, evs=DEFAULT_EVS, ivs=DEFAULT_IVS, nature=None):
+        """
+        Compute one Pokémon's final stats.
+
+        Returns:
+            Stats: The final stats, or None if the Pokémon has no base stats
+        """
+        species_id = self.index.get(name)
+        if species_id is None:
+            return None
+        return Stats(*self.compute_stats(level, evs, ivs, nature, species_ids=(species_id,)))
+
+
+def build_base_stat_table(pokemon_data=None, base_stats=None):
+    """
+    Compile base stats into a BaseStatTable.
+
+    Args:
+        pokemon_data (dict): Pokémon type data, giving species order (defaults to POKEMON_DATA)
+        base_stats (dict): Pokémon name -> 6 base stats (defaults to the built-in stats)
+
+    Returns:
+        BaseStatTable: Stats of every species in pokemon_data that has base stats
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+    if base_stats is None:
+        base_stats = _BASE_STAT_SOURCE
+
+    names = [name for name, types in pokemon_data.items() if types and name in base_stats]
+    values = array('H')
+    for name in names:
+        stats = base_stats[name]
+        if len(stats) != NUM_STATS:
+            raise ValueError(f"{name} needs {NUM_STATS} base stats, got {len(stats)}")
+        values.extend(stats)
+    return BaseStatTable(names, values)
+
+
+def register_base_stats(name, stats):
+    """
+    Add or replace the base stats of a species.
+
+    Call notify_data_changed() afterwards (as for other data edits) so the
+    compiled table is rebuilt.
+
+    Args:
+        name (str): Pokémon name
+        stats (tuple): HP, Attack, Defense, Sp. Atk, Sp. Def, Speed
+    """
+    _BASE_STAT_SOURCE[name] = tuple(stats)
+
+
+_table = None
+
+
+def get_base_stat_table():
+    """Get the roster's base stat table, compiling it on first use."""
+    global _table
+
+    if _table is None:
+        _table = build_base_stat_table()
+    return _table
+
+
+@register_invalidation_hook
+def clear_base_stat_table():
+    """Drop the compiled table so it is rebuilt from the current data."""
+    global _table
+    _table = None
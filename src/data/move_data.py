@@ -3,6 +3,13 @@ Move data and move recommendation system.
 This module contains move information and logic for suggesting optimal moves.
 """
 
+from .pokemon_data import POKEMON_DATA, ALL_TYPES, TYPE_CHART
+from .records import Move, register_type_names
+from .reverse_index import ReverseIndex
+
+# Keep type codes aligned with ALL_TYPES whichever data module loads first
+register_type_names(ALL_TYPES)
+
 # Move Database: Maps move names to their properties
 # Format: "Move Name": [type, power, accuracy, pp, category, description]
 MOVE_DATA = {
@@ -188,6 +195,9 @@ MOVE_DATA = {
     "Ice Fang": ["Ice", 65, 95, 15, "Physical", "An ice attack that may freeze or cause flinching."],
 }
 
+# Store each entry as an immutable Move record (still a sequence of the fields above)
+MOVE_DATA.update({name: Move.from_sequence(move_info) for name, move_info in MOVE_DATA.items()})
+
 # Pokémon Move Sets: Maps Pokémon names to their available moves
 # This is a simplified version - in a full implementation, you'd have complete move sets
 POKEMON_MOVES = {
@@ -238,26 +248,71 @@ POKEMON_MOVES = {
     "Meowscarada": ["Flower Trick", "Knock Off", "U-turn", "Play Rough", "Swords Dance", "Spiky Shield"],
 }
 
+# Inverse maps (type -> species, move -> learners, ...) over the live tables
+REVERSE_INDEX = ReverseIndex(POKEMON_DATA, MOVE_DATA, POKEMON_MOVES, TYPE_CHART)
+
+# Optional read-only mappings answering the lookups below (see
+# snapshot.use_snapshot); None means MOVE_DATA and POKEMON_MOVES
+_move_table = None
+_learnset_table = None
+
+def set_move_tables(move_table, learnset_table):
+    """
+    Answer get_move_info and get_moves_for_pokemon from other mappings.
+
+    Args:
+        move_table (Mapping): Read-only {name: move info} mapping, or None for MOVE_DATA
+        learnset_table (Mapping): Read-only {species name: [move names]} mapping,
+            or None for POKEMON_MOVES
+    """
+    global _move_table, _learnset_table
+    _move_table = move_table
+    _learnset_table = learnset_table
+
 def get_moves_for_pokemon(pokemon_name):
     """Get the available moves for a specific Pokémon."""
-    return POKEMON_MOVES.get(pokemon_name, [])
+    table = POKEMON_MOVES if _learnset_table is None else _learnset_table
+    return table.get(pokemon_name, [])
 
 def get_move_info(move_name):
     """Get detailed information about a specific move."""
-    return MOVE_DATA.get(move_name, None)
+    table = MOVE_DATA if _move_table is None else _move_table
+    return table.get(move_name, None)
+
+# Optional indexed backend (see sqlite_store); None means use REVERSE_INDEX
+_query_backend = None
+
+def set_query_backend(backend):
+    """
+    Answer the move query helpers from another backend instead of REVERSE_INDEX.
+
+    Args:
+        backend: Object with moves_by_type(move_type) and moves_by_category(category),
+            or None to go back to REVERSE_INDEX
+    """
+    global _query_backend
+    _query_backend = backend
 
 def get_moves_by_type(move_type):
     """Get all moves of a specific type."""
-    return [move for move, data in MOVE_DATA.items() if data[0] == move_type]
+    if _query_backend is not None:
+        return _query_backend.moves_by_type(move_type)
+    return REVERSE_INDEX.moves(move_type=move_type)
+
+def _get_moves_by_category(category):
+    """Get all moves of a specific category."""
+    if _query_backend is not None:
+        return _query_backend.moves_by_category(category)
+    return REVERSE_INDEX.moves(category=category)
 
 def get_physical_moves():
     """Get all physical moves."""
-    return [move for move, data in MOVE_DATA.items() if data[4] == "Physical"]
+    return _get_moves_by_category("Physical")
 
 def get_special_moves():
     """Get all special moves."""
-    return [move for move, data in MOVE_DATA.items() if data[4] == "Special"]
+    return _get_moves_by_category("Special")
 
 def get_status_moves():
     """Get all status moves."""
-    return [move for move, data in MOVE_DATA.items() if data[4] == "Status"] 
\ No newline at end of file
+    return _get_moves_by_category("Status")
@@ -3,12 +3,15 @@ Pokémon data and type effectiveness information.
 This module contains all the static data used by the application.
 """
 
+from .records import Species, register_type_names
+
 # All standard Pokémon types
 ALL_TYPES = [
     "Normal", "Fire", "Water", "Electric", "Grass", "Ice", "Fighting",
     "Poison", "Ground", "Flying", "Psychic", "Bug", "Rock", "Ghost", "Dragon",
     "Steel", "Dark", "Fairy"
 ]
+register_type_names(ALL_TYPES)
 
 # Pokémon Data: Maps Pokémon names to their primary and (optional) secondary types.
 POKEMON_DATA = {
@@ -322,6 +325,28 @@ POKEMON_DATA = {
     "Miraidon": ["Electric", "Dragon"], # Legendaries
 }
 
+# Store each entry as a shared, immutable Species record (still a sequence of type names)
+POKEMON_DATA.update({name: Species.of(types) for name, types in POKEMON_DATA.items()})
+
+# Optional read-only {name: types} mapping answering get_pokemon_types (see
+# snapshot.use_snapshot); None means POKEMON_DATA
+_species_table = None
+
+def set_species_table(table):
+    """
+    Answer get_pokemon_types from another mapping instead of POKEMON_DATA.
+
+    Args:
+        table (Mapping): Read-only {name: types} mapping, or None to go back to POKEMON_DATA
+    """
+    global _species_table
+    _species_table = table
+
+def get_pokemon_types(pokemon_name):
+    """Get the types of a specific Pokémon, or None if it isn't known."""
+    table = POKEMON_DATA if _species_table is None else _species_table
+    return table.get(pokemon_name)
+
 # Type Effectiveness Chart (Attacking Type -> Defending Type -> Multiplier)
 # 2.0 = Super Effective (2x damage)
 # 1.0 = Normal Effectiveness (1x damage)
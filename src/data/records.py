@@ -0,0 +1,180 @@
+"""
+Immutable records for species and moves.
+Both are tuple subclasses holding interned strings, and species records are
+shared by every Pokémon with the same type combination. Integer type and
+category codes are not stored in the records; they are looked up from the
+interned names in TYPE_CODES and CATEGORY_CODES.
+The records still behave as the sequences they replace, so existing code
+that indexes or unpacks POKEMON_DATA and MOVE_DATA values keeps working.
+"""
+
+import sys
+from operator import itemgetter
+
+# Interned type names; codes are positions in this list. Data modules
+# register ALL_TYPES first, so type codes match type matrix indices.
+TYPE_NAMES = []
+TYPE_CODES = {}
+
+# Move categories and their codes
+CATEGORY_NAMES = ("Physical", "Special", "Status")
+CATEGORY_CODES = {name: code for code, name in enumerate(CATEGORY_NAMES)}
+
+
+def intern_type(type_name):
+    """
+    Get the code for a type name, assigning the next free code to new names.
+
+    Args:
+        type_name (str): Type name
+
+    Returns:
+        int: Type code
+    """
+    code = TYPE_CODES.get(type_name)
+    if code is None:
+        code = len(TYPE_NAMES)
+        TYPE_NAMES.append(sys.intern(type_name))
+        TYPE_CODES[type_name] = code
+    return code
+
+
+def register_type_names(type_names):
+    """Intern type names in order, so the first registered names get codes 0, 1, ..."""
+    for type_name in type_names:
+        intern_type(type_name)
+
+
+class Species(tuple):
+    """
+    Type combination of a species, as an immutable tuple of type names.
+
+    Records are shared: Species.of() returns the same object for every
+    Pokémon with the same types in the same order, and the names are the
+    interned TYPE_NAMES strings. Like the lists they replace, records also
+    compare equal to lists of the same type names.
+    """
+
+    __slots__ = ()
+
+    _shared = {}
+    _type_codes = {}
+
+    @classmethod
+    def of(cls, types):
+        """
+        Get the shared record for a list of type names.
+
+        Args:
+            types (list): Type names, primary type first
+
+        Returns:
+            Species: The record
+        """
+        key = tuple(types)
+        record = cls._shared.get(key)
+        if record is None:
+            codes = tuple(intern_type(type_name) for type_name in key)
+            record = cls(TYPE_NAMES[code] for code in codes)
+            cls._shared[key] = record
+            cls._type_codes[record] = codes
+        return record
+
+    @property
+    def type_codes(self):
+        """Get the type codes, primary type first."""
+        return Species._type_codes[self]
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        if isinstance(other, list):
+            return list(self) != other
+        return tuple.__ne__(self, other)
+
+    __hash__ = tuple.__hash__
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class Move(tuple):
+    """
+    Move properties, as an immutable tuple of
+    (type, power, accuracy, pp, category, description).
+
+    The type, category and description strings are interned, so records
+    share them with every other move; type_code and category_code are dict
+    lookups on those names. Like the lists they replace, records compare
+    equal to lists holding the same fields.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, move_type, power, accuracy, pp, category, description):
+        """
+        Create the record.
+
+        Args:
+            move_type (str): Move type name
+            power (int): Base power
+            accuracy (int): Accuracy in percent
+            pp (int): Power points
+            category (str): "Physical", "Special" or "Status"
+            description (str): Move description
+        """
+        code = CATEGORY_CODES.get(category)
+        return tuple.__new__(cls, (
+            TYPE_NAMES[intern_type(move_type)],
+            power,
+            accuracy,
+            pp,
+            CATEGORY_NAMES[code] if code is not None else category,
+            sys.intern(description)
+        ))
+
+    @classmethod
+    def from_sequence(cls, move_info):
+        """Build a record from a [type, power, accuracy, pp, category, description] list."""
+        return move_info if isinstance(move_info, cls) else cls(*move_info)
+
+    type = property(itemgetter(0), doc="Move type name.")
+    power = property(itemgetter(1), doc="Base power.")
+    accuracy = property(itemgetter(2), doc="Accuracy in percent.")
+    pp = property(itemgetter(3), doc="Power points.")
+    category = property(itemgetter(4), doc="Move category name.")
+    description = property(itemgetter(5), doc="Move description.")
+
+    @property
+    def type_code(self):
+        """Get the move type code (looked up in TYPE_CODES)."""
+        return TYPE_CODES[self[0]]
+
+    @property
+    def category_code(self):
+        """Get the move category code from CATEGORY_CODES (or the name if unknown)."""
+        return CATEGORY_CODES.get(self[4], self[4])
+
+    def __eq__(self, other):
+        if isinstance(other, list):
+            return list(self) == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        if isinstance(other, list):
+            return list(self) != other
+        return tuple.__ne__(self, other)
+
+    __hash__ = tuple.__hash__
+
+    def __getnewargs__(self):
+        return tuple(self)
+
+    def __repr__(self):
+        return repr(list(self))
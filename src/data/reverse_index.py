@@ -0,0 +1,276 @@
+"""
+Reverse indexes over the species, move and learnset tables.
+The tables map species to types and moves, and moves to their properties;
+this module keeps the inverse maps (type to species, move to learners,
+attacking type to the species weak to, resisting or immune to it, and type
+and category to moves) so inverted queries cost the size of their result
+instead of a scan of the tables.
+"""
+
+from .versioning import get_data_version, get_changes_since
+
+# Effectiveness classes a species can have against an attacking type
+WEAK, RESISTS, IMMUNE = "weak", "resists", "immune"
+
+
+def _insert(names, name, positions):
+    """Insert a name into an index list, keeping the lists in table order."""
+    position = positions[name]
+    index = len(names)
+    while index and positions[names[index - 1]] > position:
+        index -= 1
+    names.insert(index, name)
+
+
+class ReverseIndex:
+    """
+    Inverse maps over a set of data tables.
+
+    The index is built on first use and brings itself up to date on the
+    next query after the data version moves. Keys reported to
+    notify_data_changed() as added, changed or removed are applied one by
+    one, so an update costs the size of the affected index lists rather
+    than a walk over the tables; an undescribed change or a type chart
+    edit rebuilds the whole index. Result lists follow table order, the
+    same order a scan of the tables would give.
+    """
+
+    def __init__(self, pokemon_data, move_data, pokemon_moves, type_chart):
+        """
+        Initialize the index (it is built lazily).
+
+        Changes reported to notify_data_changed() name the tables by role
+        (see DATA_TABLES), and the index applies them to the tables given here.
+
+        Args:
+            pokemon_data (dict): Pokémon name -> types
+            move_data (dict): Move name -> [type, power, accuracy, pp, category, description]
+            pokemon_moves (dict): Pokémon name -> move names
+            type_chart (dict): Attacking type -> {defending type: multiplier}
+        """
+        self.pokemon_data = pokemon_data
+        self.move_data = move_data
+        self.pokemon_moves = pokemon_moves
+        self.type_chart = type_chart
+
+        # Indexed table entries, and each key's table position (a counter
+        # that only grows, so it sorts like the table's insertion order)
+        self._species = None
+        self._moves = {}
+        self._learnsets = {}
+        self._positions = {'pokemon_data': {}, 'move_data': {}, 'pokemon_moves': {}}
+        self._next_position = 0
+        self._chart = {}
+        self._version = None
+
+        self._species_by_type = {}
+        self._learners_by_move = {}
+        self._defenders = {WEAK: {}, RESISTS: {}, IMMUNE: {}}
+        self._moves_by_type_category = {}
+        self._moves_by_type = {}
+        self._moves_by_category = {}
+
+        # Tuple of defending types -> {attacking type: WEAK/RESISTS/IMMUNE}
+        self._matchups = {}
+
+    def _ensure_current(self):
+        """Build the index, or apply the table changes since the last build."""
+        if self._species is None:
+            self._rebuild()
+        elif self._version != get_data_version():
+            self._update()
+
+    def _rebuild(self):
+        """Build every index from scratch."""
+        self._version = get_data_version()
+        self._species = {}
+        self._moves = {}
+        self._learnsets = {}
+        self._positions = {'pokemon_data': {}, 'move_data': {}, 'pokemon_moves': {}}
+        self._next_position = 0
+        self._chart = {attacking: dict(row) for attacking, row in self.type_chart.items()}
+        self._matchups = {}
+        self._species_by_type = {}
+        self._learners_by_move = {}
+        self._defenders = {WEAK: {}, RESISTS: {}, IMMUNE: {}}
+        self._moves_by_type_category = {}
+        self._moves_by_type = {}
+        self._moves_by_category = {}
+
+        for name, types in self.pokemon_data.items():
+            self._place('pokemon_data', name)
+            self._add_species(name, types)
+        for name, move_info in self.move_data.items():
+            self._place('move_data', name)
+            self._add_move(name, move_info)
+        for name, move_list in self.pokemon_moves.items():
+            self._place('pokemon_moves', name)
+            self._add_learnset(name, move_list)
+
+    def _place(self, table_name, name):
+        """Give a key the next table position (it was just added to the end of its table)."""
+        self._positions[table_name][name] = self._next_position
+        self._next_position += 1
+
+    def _update(self):
+        """Apply the reported table changes, or rebuild if they aren't all known."""
+        changes = get_changes_since(self._version)
+        if changes is None or any(
+                'type_chart' in edits for change in changes for edits in change):
+            self._rebuild()
+            return
+
+        tables = (
+            ('pokemon_data', self.pokemon_data, self._species, self._add_species, self._remove_species),
+            ('move_data', self.move_data, self._moves, self._add_move, self._remove_move),
+            ('pokemon_moves', self.pokemon_moves, self._learnsets, self._add_learnset, self._remove_learnset),
+        )
+        # Values are read from the tables as they are now, so a key touched
+        # again by a later change (or already deleted) is skipped or re-read
+        for change in changes:
+            for table_name, table, indexed, add, remove in tables:
+                positions = self._positions[table_name]
+                for name in change.removed.get(table_name, ()):
+                    if name in indexed:
+                        remove(name)
+                        del positions[name]
+                for name in change.changed.get(table_name, ()):
+                    # An in-place edit keeps the key's table position
+                    if name in indexed:
+                        remove(name)
+                    elif name in table:
+                        self._place(table_name, name)
+                    if name in table:
+                        add(name, table[name])
+                    else:
+                        positions.pop(name, None)
+                for name in change.added.get(table_name, ()):
+                    if name in indexed:
+                        remove(name)
+                    if name in table:
+                        self._place(table_name, name)
+                        add(name, table[name])
+                    else:
+                        positions.pop(name, None)
+        self._version = get_data_version()
+
+    def _matchup(self, types):
+        """Get the effectiveness class of each attacking type against a typing."""
+        key = tuple(types)
+        matchup = self._matchups.get(key)
+        if matchup is None:
+            matchup = {}
+            for attacking, row in self._chart.items():
+                multiplier = 1.0
+                for defending in key:
+                    multiplier *= row.get(defending, 1.0)
+                if multiplier == 0.0:
+                    matchup[attacking] = IMMUNE
+                elif multiplier < 1.0:
+                    matchup[attacking] = RESISTS
+                elif multiplier > 1.0:
+                    matchup[attacking] = WEAK
+            self._matchups[key] = matchup
+        return matchup
+
+    def _add_species(self, name, types):
+        self._species[name] = tuple(types)
+        if not types:
+            return
+        positions = self._positions['pokemon_data']
+        for pokemon_type in dict.fromkeys(types):
+            _insert(self._species_by_type.setdefault(pokemon_type, []), name, positions)
+        for attacking, relation in self._matchup(types).items():
+            _insert(self._defenders[relation].setdefault(attacking, []), name, positions)
+            # Resistances include immunities, matching the team analysis convention
+            if relation == IMMUNE:
+                _insert(self._defenders[RESISTS].setdefault(attacking, []), name, positions)
+
+    def _remove_species(self, name):
+        types = self._species.pop(name)
+        if not types:
+            return
+        for pokemon_type in dict.fromkeys(types):
+            self._species_by_type[pokemon_type].remove(name)
+        for attacking, relation in self._matchup(types).items():
+            self._defenders[relation][attacking].remove(name)
+            if relation == IMMUNE:
+                self._defenders[RESISTS][attacking].remove(name)
+
+    def _add_move(self, name, move_info):
+        self._moves[name] = tuple(move_info)
+        move_type, category = move_info[0], move_info[4]
+        positions = self._positions['move_data']
+        _insert(self._moves_by_type_category.setdefault((move_type, category), []), name, positions)
+        _insert(self._moves_by_type.setdefault(move_type, []), name, positions)
+        _insert(self._moves_by_category.setdefault(category, []), name, positions)
+
+    def _remove_move(self, name):
+        move_info = self._moves.pop(name)
+        move_type, category = move_info[0], move_info[4]
+        self._moves_by_type_category[(move_type, category)].remove(name)
+        self._moves_by_type[move_type].remove(name)
+        self._moves_by_category[category].remove(name)
+
+    def _add_learnset(self, name, move_list):
+        self._learnsets[name] = tuple(move_list)
+        positions = self._positions['pokemon_moves']
+        for move_name in dict.fromkeys(move_list):
+            _insert(self._learners_by_move.setdefault(move_name, []), name, positions)
+
+    def _remove_learnset(self, name):
+        for move_name in dict.fromkeys(self._learnsets.pop(name)):
+            self._learners_by_move[move_name].remove(name)
+
+    def species_with_type(self, pokemon_type):
+        """Get all Pokémon that have a specific type."""
+        self._ensure_current()
+        return list(self._species_by_type.get(pokemon_type, ()))
+
+    def learners(self, move_name):
+        """Get all Pokémon that learn a specific move."""
+        self._ensure_current()
+        return list(self._learners_by_move.get(move_name, ()))
+
+    def species_weak_to(self, attacking_type):
+        """Get all Pokémon that take super effective damage from a type."""
+        self._ensure_current()
+        return list(self._defenders[WEAK].get(attacking_type, ()))
+
+    def species_resisting(self, attacking_type):
+        """Get all Pokémon that resist a type, including those immune to it."""
+        self._ensure_current()
+        return list(self._defenders[RESISTS].get(attacking_type, ()))
+
+    def species_immune_to(self, attacking_type):
+        """Get all Pokémon that take no damage from a type."""
+        self._ensure_current()
+        return list(self._defenders[IMMUNE].get(attacking_type, ()))
+
+    def moves(self, move_type=None, category=None):
+        """
+        Get the moves of a type, a category, or both.
+
+        Args:
+            move_type (str): Move type, or None for any type
+            category (str): "Physical", "Special" or "Status", or None for any
+
+        Returns:
+            list: Move names in MOVE_DATA order
+        """
+        self._ensure_current()
+        if move_type is None and category is None:
+            return list(self.move_data)
+        if category is None:
+            return list(self._moves_by_type.get(move_type, ()))
+        if move_type is None:
+            return list(self._moves_by_category.get(category, ()))
+        return list(self._moves_by_type_category.get((move_type, category), ()))
+
+    def moves_by_type(self, move_type):
+        """Get all moves of a specific type."""
+        return self.moves(move_type=move_type)
+
+    def moves_by_category(self, category):
+        """Get all moves of a specific category."""
+        return self.moves(category=category)
@@ -0,0 +1,573 @@
+"""
+Compiled binary data snapshots.
+This module compiles species, move, learnset and type chart sources (JSON
+or CSV files, or the in-memory tables) into a single versioned binary file
+of fixed-width little-endian columns plus a string table, and reads it back
+through mmap. Opening a snapshot only parses the header, so startup cost
+does not grow with the dataset; records are decoded on access. use_snapshot()
+answers the data lookup helpers straight from the mapping, while installing
+a snapshot into the live data tables copies every record (see
+install_snapshot).
+
+File layout:
+    header        magic, format version, section count, table sizes
+    section table (offset, length) for every section in SECTIONS order
+    sections      8-byte aligned arrays; strings are (offsets, utf-8 data)
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+
+from .pokemon_data import POKEMON_DATA, ALL_TYPES, TYPE_CHART, set_species_table
+from .move_data import MOVE_DATA, POKEMON_MOVES, set_move_tables
+from .records import Species, Move, CATEGORY_NAMES, CATEGORY_CODES
+from .versioning import notify_data_changed
+
+SNAPSHOT_MAGIC = b"PKSNAP\0\0"
+SNAPSHOT_VERSION = 1
+
+# magic, format version, section count, string/type/species/move/learnset counts
+_HEADER = struct.Struct('<8sHHIIIII')
+_SECTION_ENTRY = struct.Struct('<QQ')
+
+# Section name -> array typecode, in file order
+SECTIONS = (
+    ('string_offsets', 'I'),
+    ('string_data', 'B'),
+    ('type_names', 'I'),
+    ('type_chart', 'f'),
+    ('species_names', 'I'),
+    ('species_type1', 'B'),
+    ('species_type2', 'B'),
+    ('species_learn_start', 'I'),
+    ('species_learn_count', 'H'),
+    ('species_by_name', 'I'),
+    ('move_names', 'I'),
+    ('move_types', 'B'),
+    ('move_powers', 'H'),
+    ('move_accuracies', 'B'),
+    ('move_pps', 'B'),
+    ('move_categories', 'B'),
+    ('move_descriptions', 'I'),
+    ('move_by_name', 'I'),
+    ('learnset_moves', 'I'),
+)
+
+# Stored in species_type2 for single-type species
+NO_TYPE = 255
+
+
+def load_source(path):
+    """
+    Read one data source file.
+
+    JSON files hold the same structure as the corresponding Python table.
+    CSV files have a header row and one record per row:
+        species:    name, type1, type2
+        moves:      name, type, power, accuracy, pp, category, description
+        learnsets:  pokemon, move
+        type chart: attacking, defending, multiplier
+
+    Args:
+        path (str): Path to a .json or .csv file
+
+    Returns:
+        dict or list: Parsed JSON, or the CSV rows as lists of strings
+    """
+    if path.endswith('.json'):
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    if path.endswith('.csv'):
+        with open(path, encoding='utf-8', newline='') as f:
+            rows = list(csv.reader(f))
+        return rows[1:]
+    raise ValueError(f"Unsupported data source format: {path}")
+
+
+def _species_source(source):
+    """Normalize a species source to {name: [types]}."""
+    if isinstance(source, str):
+        source = load_source(source)
+    if isinstance(source, Mapping):
+        return {name: list(types) for name, types in source.items()}
+    return {row[0]: [t for t in row[1:3] if t] for row in source}
+
+
+def _moves_source(source):
+    """Normalize a move source to {name: [type, power, accuracy, pp, category, description]}."""
+    if isinstance(source, str):
+        source = load_source(source)
+    if isinstance(source, Mapping):
+        return {name: list(info) for name, info in source.items()}
+    return {
+        row[0]: [row[1], int(row[2]), int(row[3]), int(row[4]), row[5], row[6]]
+        for row in source
+    }
+
+
+def _learnsets_source(source):
+    """Normalize a learnset source to {pokemon: [move names]}."""
+    if isinstance(source, str):
+        source = load_source(source)
+    if isinstance(source, Mapping):
+        return {name: list(moves) for name, moves in source.items()}
+    learnsets = {}
+    for pokemon, move in source:
+        learnsets.setdefault(pokemon, []).append(move)
+    return learnsets
+
+
+def _type_chart_source(source):
+    """Normalize a type chart source to {attacking: {defending: multiplier}}."""
+    if isinstance(source, str):
+        source = load_source(source)
+    if isinstance(source, Mapping):
+        return {attacking: dict(row) for attacking, row in source.items()}
+    chart = {}
+    for attacking, defending, multiplier in source:
+        chart.setdefault(attacking, {})[defending] = float(multiplier)
+    return chart
+
+
+class _StringTable:
+    """Deduplicating string table builder."""
+
+    def __init__(self):
+        self.ids = {}
+        self.offsets = array('I', [0])
+        self.data = bytearray()
+
+    def add(self, text):
+        """Get the id of a string, adding it on first use."""
+        string_id = self.ids.get(text)
+        if string_id is None:
+            string_id = len(self.ids)
+            self.ids[text] = string_id
+            self.data += text.encode('utf-8')
+            self.offsets.append(len(self.data))
+        return string_id
+
+
+def compile_snapshot(output_path, species=None, moves=None, learnsets=None, type_chart=None):
+    """
+    Compile data sources into a binary snapshot file.
+
+    Each source may be a path to a JSON or CSV file, an in-memory table, or
+    None to use the current POKEMON_DATA, MOVE_DATA, POKEMON_MOVES or
+    TYPE_CHART. Species without types (such as the dropdown placeholder)
+    are skipped.
+
+    Args:
+        output_path (str): File to write
+        species: Species source
+        moves: Move source
+        learnsets: Learnset source
+        type_chart: Type chart source
+
+    Returns:
+        dict: Counts of the records written
+    """
+    species = _species_source(POKEMON_DATA if species is None else species)
+    moves = _moves_source(MOVE_DATA if moves is None else moves)
+    learnsets = _learnsets_source(POKEMON_MOVES if learnsets is None else learnsets)
+    type_chart = _type_chart_source(TYPE_CHART if type_chart is None else type_chart)
+
+    strings = _StringTable()
+    type_names = list(ALL_TYPES)
+    for type_name in type_chart:
+        if type_name not in type_names:
+            type_names.append(type_name)
+    type_codes = {name: code for code, name in enumerate(type_names)}
+
+    def type_code(type_name, owner):
+        if type_name not in type_codes:
+            raise ValueError(f"Unknown type '{type_name}' in {owner}")
+        return type_codes[type_name]
+
+    columns = {name: array(typecode) for name, typecode in SECTIONS}
+    columns['type_names'].extend(strings.add(name) for name in type_names)
+    for attacking in type_names:
+        row = type_chart.get(attacking, {})
+        columns['type_chart'].extend(float(row.get(defending, 1.0)) for defending in type_names)
+
+    for name, info in moves.items():
+        move_type, power, accuracy, pp, category, description = info
+        if category not in CATEGORY_CODES:
+            raise ValueError(f"Unknown category '{category}' for move '{name}'")
+        columns['move_names'].append(strings.add(name))
+        columns['move_types'].append(type_code(move_type, f"move '{name}'"))
+        columns['move_powers'].append(power)
+        columns['move_accuracies'].append(accuracy)
+        columns['move_pps'].append(pp)
+        columns['move_categories'].append(CATEGORY_CODES[category])
+        columns['move_descriptions'].append(strings.add(description))
+
+    species_names = [name for name, types in species.items() if types]
+    for name in species_names:
+        types = species[name]
+        if len(types) > 2:
+            raise ValueError(f"Species '{name}' has more than two types")
+        # Learnsets keep move names, including moves missing from the move table
+        learnset = learnsets.get(name, [])
+        columns['species_names'].append(strings.add(name))
+        columns['species_type1'].append(type_code(types[0], f"species '{name}'"))
+        columns['species_type2'].append(type_code(types[1], f"species '{name}'") if len(types) > 1 else NO_TYPE)
+        columns['species_learn_start'].append(len(columns['learnset_moves']))
+        columns['species_learn_count'].append(len(learnset))
+        columns['learnset_moves'].extend(strings.add(move) for move in learnset)
+
+    # Name-sorted permutations for binary search lookups
+    columns['species_by_name'].extend(
+        sorted(range(len(species_names)), key=lambda i: species_names[i].encode('utf-8'))
+    )
+    move_names = list(moves)
+    columns['move_by_name'].extend(sorted(range(len(move_names)), key=lambda i: move_names[i].encode('utf-8')))
+
+    columns['string_offsets'] = strings.offsets
+    columns['string_data'] = array('B', strings.data)
+
+    header_size = _HEADER.size + _SECTION_ENTRY.size * len(SECTIONS)
+    offset = _align(header_size)
+    section_table = []
+    payloads = []
+    for name, _ in SECTIONS:
+        column = columns[name]
+        if sys.byteorder != 'little':
+            column = array(column.typecode, column)
+            column.byteswap()
+        payload = column.tobytes()
+        section_table.append((offset, len(payload)))
+        payloads.append((offset, payload))
+        offset = _align(offset + len(payload))
+
+    with open(output_path, 'wb') as f:
+        f.write(_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(SECTIONS), len(strings.ids),
+            len(type_names), len(species_names), len(move_names), len(columns['learnset_moves'])
+        ))
+        for section_offset, length in section_table:
+            f.write(_SECTION_ENTRY.pack(section_offset, length))
+        for section_offset, payload in payloads:
+            f.write(b'\0' * (section_offset - f.tell()))
+            f.write(payload)
+
+    return {
+        'types': len(type_names),
+        'species': len(species_names),
+        'moves': len(move_names),
+        'learnset_entries': len(columns['learnset_moves']),
+        'strings': len(strings.ids)
+    }
+
+
+def _align(offset):
+    """Round an offset up to a multiple of 8."""
+    return (offset + 7) & ~7
+
+
+class Snapshot:
+    """Read-only view of a compiled snapshot file."""
+
+    def __init__(self, path):
+        """
+        Open a snapshot.
+
+        Args:
+            path (str): Snapshot file written by compile_snapshot()
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not a snapshot file") from None
+        self._view = memoryview(self._map)
+
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"{path} is not a snapshot file")
+        (magic, version, section_count, self.string_count, self.type_count,
+         self.species_count, self.move_count, self.learnset_count) = _HEADER.unpack_from(self._map, 0)
+        if magic != SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a snapshot file")
+        if version != SNAPSHOT_VERSION or section_count != len(SECTIONS):
+            self.close()
+            raise ValueError(f"{path} has unsupported snapshot version {version}")
+
+        # Zero-copy typed views over each section (copied only on big-endian hosts)
+        self._columns = {}
+        for index, (name, typecode) in enumerate(SECTIONS):
+            offset, length = _SECTION_ENTRY.unpack_from(self._map, _HEADER.size + index * _SECTION_ENTRY.size)
+            raw = self._view[offset:offset + length]
+            if sys.byteorder == 'little':
+                column = raw.cast(typecode) if typecode != 'B' else raw
+            else:
+                column = array(typecode, raw.tobytes())
+                column.byteswap()
+            self._columns[name] = column
+
+    def close(self):
+        """Release the mapping and the file; later reads raise ValueError."""
+        self._columns = _ClosedColumns(self.path)
+        if getattr(self, '_view', None) is not None:
+            self._view.release()
+            self._view = None
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    def string(self, string_id):
+        """Decode one entry of the string table."""
+        offsets = self._columns['string_offsets']
+        return str(self._columns['string_data'][offsets[string_id]:offsets[string_id + 1]], 'utf-8')
+
+    def _string_bytes(self, string_id):
+        offsets = self._columns['string_offsets']
+        return self._columns['string_data'][offsets[string_id]:offsets[string_id + 1]].tobytes()
+
+    def _find(self, name, names_column, order_column):
+        """Binary search a name-sorted permutation; returns the record index or None."""
+        key = name.encode('utf-8')
+        names = self._columns[names_column]
+        order = self._columns[order_column]
+        low, high = 0, len(order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._string_bytes(names[order[middle]]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order) and self._string_bytes(names[order[low]]) == key:
+            return order[low]
+        return None
+
+    def type_names(self):
+        """Get the type names in code order."""
+        return [self.string(string_id) for string_id in self._columns['type_names']]
+
+    def type_chart(self):
+        """Get the type chart as {attacking: {defending: multiplier}}."""
+        names = self.type_names()
+        chart = self._columns['type_chart']
+        size = len(names)
+        return {
+            attacking: {defending: chart[a * size + d] for d, defending in enumerate(names)}
+            for a, attacking in enumerate(names)
+        }
+
+    def species_name(self, index):
+        """Get the name of the species at an index."""
+        return self.string(self._columns['species_names'][index])
+
+    def species_index(self, name):
+        """Get the index of a species by name, or None."""
+        return self._find(name, 'species_names', 'species_by_name')
+
+    def species_types(self, index):
+        """Get the types of the species at an index as a Species record."""
+        type_names = self._columns['type_names']
+        types = [self.string(type_names[self._columns['species_type1'][index]])]
+        secondary = self._columns['species_type2'][index]
+        if secondary != NO_TYPE:
+            types.append(self.string(type_names[secondary]))
+        return Species.of(types)
+
+    def learnset(self, index):
+        """Get the move names learned by the species at an index."""
+        start = self._columns['species_learn_start'][index]
+        count = self._columns['species_learn_count'][index]
+        moves = self._columns['learnset_moves']
+        return [self.string(moves[i]) for i in range(start, start + count)]
+
+    def move_name(self, index):
+        """Get the name of the move at an index."""
+        return self.string(self._columns['move_names'][index])
+
+    def move_index(self, name):
+        """Get the index of a move by name, or None."""
+        return self._find(name, 'move_names', 'move_by_name')
+
+    def move(self, index):
+        """Get the move at an index as a Move record."""
+        columns = self._columns
+        return Move(
+            self.string(columns['type_names'][columns['move_types'][index]]),
+            columns['move_powers'][index],
+            columns['move_accuracies'][index],
+            columns['move_pps'][index],
+            CATEGORY_NAMES[columns['move_categories'][index]],
+            self.string(columns['move_descriptions'][index])
+        )
+
+    def species(self):
+        """Get a read-only {name: Species} mapping backed by the snapshot."""
+        return _SnapshotTable(self, self.species_count, self.species_name, self.species_index, self.species_types)
+
+    def moves(self):
+        """Get a read-only {name: Move} mapping backed by the snapshot."""
+        return _SnapshotTable(self, self.move_count, self.move_name, self.move_index, self.move)
+
+    def learnsets(self):
+        """Get a read-only {species name: [move names]} mapping backed by the snapshot."""
+        return _SnapshotTable(self, self.species_count, self.species_name, self.species_index, self.learnset)
+
+
+class _ClosedColumns(Mapping):
+    """Stands in for the column views of a closed snapshot."""
+
+    def __init__(self, path):
+        self._path = path
+
+    def __getitem__(self, name):
+        raise ValueError(f"snapshot {self._path} is closed")
+
+    def __iter__(self):
+        return iter(())
+
+    def __len__(self):
+        return 0
+
+
+class _SnapshotTable(Mapping):
+    """Mapping over snapshot records that decodes entries on access."""
+
+    def __init__(self, snapshot, count, name_at, index_of, value_at):
+        self._snapshot = snapshot
+        self._count = count
+        self._name_at = name_at
+        self._index_of = index_of
+        self._value_at = value_at
+
+    def __getitem__(self, name):
+        index = self._index_of(name)
+        if index is None:
+            raise KeyError(name)
+        return self._value_at(index)
+
+    def __contains__(self, name):
+        return self._index_of(name) is not None
+
+    def __iter__(self):
+        return (self._name_at(index) for index in range(self._count))
+
+    def __len__(self):
+        return self._count
+
+    def items(self):
+        return [(self._name_at(index), self._value_at(index)) for index in range(self._count)]
+
+
+def install_snapshot(path):
+    """
+    Replace the contents of the live data tables with a snapshot's data.
+
+    This is not a zero-copy load: every record is decoded from the mapping
+    and copied into the POKEMON_DATA, MOVE_DATA, POKEMON_MOVES and
+    TYPE_CHART dicts, so it costs time and memory in proportion to the
+    dataset. The rest of the package holds references to those dicts and
+    edits them in place, so they can't be swapped for snapshot-backed
+    views. For read-only access without the copy, use use_snapshot(), or
+    open a Snapshot and use its species(), moves() and learnsets()
+    mappings directly.
+
+    POKEMON_DATA keeps its placeholder entry, and notify_data_changed() is
+    called so derived tables are rebuilt.
+
+    Args:
+        path (str): Snapshot file
+
+    Returns:
+        int: The new data version
+    """
+    with Snapshot(path) as snapshot:
+        if set(snapshot.type_names()) != set(ALL_TYPES):
+            raise ValueError(f"{path} was compiled for a different set of types")
+        species = snapshot.species().items()
+        learnsets = snapshot.learnsets().items()
+        moves = snapshot.moves().items()
+        type_chart = snapshot.type_chart()
+
+    placeholders = {name: types for name, types in POKEMON_DATA.items() if not types}
+    POKEMON_DATA.clear()
+    POKEMON_DATA.update(placeholders)
+    POKEMON_DATA.update(species)
+    POKEMON_MOVES.clear()
+    POKEMON_MOVES.update((name, moves_learned) for name, moves_learned in learnsets if moves_learned)
+    MOVE_DATA.clear()
+    MOVE_DATA.update(moves)
+    TYPE_CHART.clear()
+    TYPE_CHART.update(type_chart)
+    return notify_data_changed()
+
+
+_active_snapshot = None
+
+
+def use_snapshot(path):
+    """
+    Answer get_pokemon_types, get_move_info and get_moves_for_pokemon from a snapshot.
+
+    Only the header is read, so the cost doesn't grow with the dataset;
+    each lookup decodes its record from the mapping. The live tables are
+    left untouched, so code that iterates POKEMON_DATA, MOVE_DATA or
+    POKEMON_MOVES still sees the built-in data (use install_snapshot() to
+    replace them). The previously used snapshot, if any, is closed.
+
+    Args:
+        path (str): Snapshot file
+
+    Returns:
+        Snapshot: The opened snapshot
+    """
+    global _active_snapshot
+
+    snapshot = Snapshot(path)
+    stop_using_snapshot()
+    _active_snapshot = snapshot
+    set_species_table(snapshot.species())
+    set_move_tables(snapshot.moves(), snapshot.learnsets())
+    return _active_snapshot
+
+
+def stop_using_snapshot():
+    """Go back to answering the data lookup helpers from the live tables."""
+    global _active_snapshot
+
+    if _active_snapshot is not None:
+        set_species_table(None)
+        set_move_tables(None, None)
+        _active_snapshot.close()
+        _active_snapshot = None
+
+
+def main(argv=None):
+    """Command-line entry point: compile sources into a snapshot."""
+    parser = argparse.ArgumentParser(description="Compile Pokémon data sources into a binary snapshot.")
+    parser.add_argument('output', help="Snapshot file to write")
+    parser.add_argument('--species', help="Species JSON/CSV (default: built-in POKEMON_DATA)")
+    parser.add_argument('--moves', help="Moves JSON/CSV (default: built-in MOVE_DATA)")
+    parser.add_argument('--learnsets', help="Learnsets JSON/CSV (default: built-in POKEMON_MOVES)")
+    parser.add_argument('--type-chart', help="Type chart JSON/CSV (default: built-in TYPE_CHART)")
+    args = parser.parse_args(argv)
+
+    counts = compile_snapshot(args.output, args.species, args.moves, args.learnsets, args.type_chart)
+    print(f"Wrote {args.output}: " + ", ".join(f"{count} {name}" for name, count in counts.items()))
+
+
+if __name__ == '__main__':
+    main()
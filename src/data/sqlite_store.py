@@ -0,0 +1,254 @@
+"""
+Optional SQLite backend for species, move and learnset queries.
+The data is loaded from the in-memory tables into a SQLite database (a local
+file or :memory:) with indexes on type, category, power and learner, so
+filtered and inverted queries run through an index instead of scanning the
+dicts. Once enabled with use_sqlite_store(), the move_data query helpers
+delegate to it; the dicts themselves remain the source of truth. A database
+file records a digest of the data it holds, so reopening it for the same
+data skips the reload.
+"""
+
+import sqlite3
+
+from .pokemon_data import POKEMON_DATA
+from .move_data import MOVE_DATA, POKEMON_MOVES, set_query_backend
+from .versioning import get_data_version, data_digest
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS species (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS species_types (
+    species_id INTEGER NOT NULL REFERENCES species(id),
+    slot INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    PRIMARY KEY (species_id, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS species_types_by_type ON species_types (type, species_id);
+CREATE TABLE IF NOT EXISTS moves (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    power INTEGER NOT NULL,
+    accuracy INTEGER NOT NULL,
+    pp INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    description TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS moves_by_type_power ON moves (type, power);
+CREATE INDEX IF NOT EXISTS moves_by_category ON moves (category, power);
+CREATE INDEX IF NOT EXISTS moves_by_power ON moves (power);
+CREATE TABLE IF NOT EXISTS learnsets (
+    species_id INTEGER NOT NULL REFERENCES species(id),
+    slot INTEGER NOT NULL,
+    move_name TEXT NOT NULL,
+    PRIMARY KEY (species_id, slot)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS learnsets_by_move ON learnsets (move_name, species_id);
+CREATE TABLE IF NOT EXISTS store_info (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+class SQLiteStore:
+    """SQLite-backed query layer over the species, move and learnset tables."""
+
+    def __init__(self, path=":memory:", pokemon_data=None, move_data=None, pokemon_moves=None):
+        """
+        Open (or create) a store and load the tables into it.
+
+        Args:
+            path (str): Database file, or ":memory:"
+            pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+            move_data (dict): Move data (defaults to MOVE_DATA)
+            pokemon_moves (dict): Learnsets (defaults to POKEMON_MOVES)
+        """
+        # The live tables can change at runtime; explicit ones are fixed
+        self._follows_live_data = pokemon_data is None and move_data is None and pokemon_moves is None
+        self.pokemon_data = POKEMON_DATA if pokemon_data is None else pokemon_data
+        self.move_data = MOVE_DATA if move_data is None else move_data
+        self.pokemon_moves = POKEMON_MOVES if pokemon_moves is None else pokemon_moves
+
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(_SCHEMA)
+        self._loaded_version = None
+        self.refresh()
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def refresh(self, force=False):
+        """
+        Reload the database from the tables if the data changed.
+
+        When the data version moved (or the store was just opened), the
+        tables' digest is compared with the one stored in the database, and
+        the reload is skipped if they match.
+
+        Args:
+            force (bool): Reload even if the data is unchanged
+        """
+        version = get_data_version()
+        if not force and self._loaded_version is not None and (
+                not self._follows_live_data or version == self._loaded_version):
+            return
+
+        # The store holds no type chart, so it isn't part of the digest
+        digest = data_digest(self.pokemon_data, self.move_data, self.pokemon_moves, {})
+        if not force:
+            row = self.connection.execute("SELECT value FROM store_info WHERE key = 'data_digest'").fetchone()
+            if row is not None and row[0] == digest:
+                self._loaded_version = version
+                return
+
+        with self.connection:
+            for table in ('learnsets', 'species_types', 'species', 'moves', 'store_info'):
+                self.connection.execute(f"DELETE FROM {table}")
+
+            species_rows = [
+                (species_id, name)
+                for species_id, (name, types) in enumerate(self.pokemon_data.items())
+                if types
+            ]
+            self.connection.executemany("INSERT INTO species (id, name) VALUES (?, ?)", species_rows)
+            species_ids = {name: species_id for species_id, name in species_rows}
+            self.connection.executemany(
+                "INSERT INTO species_types (species_id, slot, type) VALUES (?, ?, ?)",
+                (
+                    (species_id, slot, pokemon_type)
+                    for species_id, name in species_rows
+                    for slot, pokemon_type in enumerate(self.pokemon_data[name])
+                )
+            )
+
+            self.connection.executemany(
+                "INSERT INTO moves (id, name, type, power, accuracy, pp, category, description) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                ((move_id, name, *move_info) for move_id, (name, move_info) in enumerate(self.move_data.items()))
+            )
+
+            # Learnsets may name moves missing from the move table, so keep names
+            self.connection.executemany(
+                "INSERT INTO learnsets (species_id, slot, move_name) VALUES (?, ?, ?)",
+                (
+                    (species_ids[name], slot, move_name)
+                    for name, move_list in self.pokemon_moves.items() if name in species_ids
+                    for slot, move_name in enumerate(move_list)
+                )
+            )
+            self.connection.execute(
+                "INSERT INTO store_info (key, value) VALUES ('data_digest', ?)", (digest,)
+            )
+        self._loaded_version = version
+
+    def _names(self, query, parameters=()):
+        """Run a query returning one name per row."""
+        self.refresh()
+        return [row[0] for row in self.connection.execute(query, parameters)]
+
+    def moves_by_type(self, move_type):
+        """Get all moves of a specific type."""
+        return self._names("SELECT name FROM moves WHERE type = ? ORDER BY id", (move_type,))
+
+    def moves_by_category(self, category):
+        """Get all moves of a specific category."""
+        return self._names("SELECT name FROM moves WHERE category = ? ORDER BY id", (category,))
+
+    def species_with_type(self, pokemon_type):
+        """Get all Pokémon that have a specific type."""
+        return self._names(
+            "SELECT s.name FROM species_types t JOIN species s ON s.id = t.species_id "
+            "WHERE t.type = ? ORDER BY s.id",
+            (pokemon_type,)
+        )
+
+    def learners(self, move_name):
+        """Get all Pokémon that learn a specific move."""
+        return self._names(
+            "SELECT DISTINCT s.name FROM learnsets l JOIN species s ON s.id = l.species_id "
+            "WHERE l.move_name = ? ORDER BY s.id",
+            (move_name,)
+        )
+
+    def find_moves(self, move_type=None, category=None, min_power=None, max_power=None, learner_type=None):
+        """
+        Find moves matching all of the given filters.
+
+        For example, find_moves(move_type="Fire", min_power=90, learner_type="Water")
+        gives every Fire move with at least 90 power that some Water-type
+        Pokémon learns.
+
+        Args:
+            move_type (str): Move type
+            category (str): "Physical", "Special" or "Status"
+            min_power (int): Minimum base power
+            max_power (int): Maximum base power
+            learner_type (str): Type of at least one Pokémon that learns the move
+
+        Returns:
+            list: Move names in MOVE_DATA order
+        """
+        conditions = []
+        parameters = []
+        if move_type is not None:
+            conditions.append("m.type = ?")
+            parameters.append(move_type)
+        if category is not None:
+            conditions.append("m.category = ?")
+            parameters.append(category)
+        if min_power is not None:
+            conditions.append("m.power >= ?")
+            parameters.append(min_power)
+        if max_power is not None:
+            conditions.append("m.power <= ?")
+            parameters.append(max_power)
+        if learner_type is not None:
+            conditions.append(
+                "m.name IN (SELECT l.move_name FROM species_types t "
+                "JOIN learnsets l ON l.species_id = t.species_id WHERE t.type = ?)"
+            )
+            parameters.append(learner_type)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._names(f"SELECT m.name FROM moves m{where} ORDER BY m.id", parameters)
+
+
+_active_store = None
+
+
+def use_sqlite_store(path=":memory:"):
+    """
+    Route the move_data query helpers through a SQLite store.
+
+    Args:
+        path (str): Database file, or ":memory:"
+
+    Returns:
+        SQLiteStore: The active store
+    """
+    global _active_store
+
+    disable_sqlite_store()
+    _active_store = SQLiteStore(path)
+    set_query_backend(_active_store)
+    return _active_store
+
+
+def get_sqlite_store():
+    """Get the active store, or None if it is not enabled."""
+    return _active_store
+
+
+def disable_sqlite_store():
+    """Go back to answering move_data queries from the in-memory reverse index."""
+    global _active_store
+
+    if _active_store is not None:
+        set_query_backend(None)
+        _active_store.close()
+        _active_store = None
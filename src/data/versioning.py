@@ -0,0 +1,144 @@
+"""
+Data version tracking.
+POKEMON_DATA, MOVE_DATA, POKEMON_MOVES and TYPE_CHART are plain mutable dicts,
+so code that edits them at runtime calls notify_data_changed() to bump the
+data version and let derived tables and caches drop stale entries. Callers
+can also say which keys they added, changed or removed, so incremental
+consumers (see get_changes_since) only touch those entries.
+The version counter restarts with every process; anything persisted across
+runs is keyed on data_digest() instead.
+"""
+
+import hashlib
+import json
+from collections import deque, namedtuple
+
+# Table names a change can be reported against
+DATA_TABLES = ('pokemon_data', 'move_data', 'pokemon_moves', 'type_chart')
+
+# Keys touched by one notify_data_changed() call: each field maps a table
+# name from DATA_TABLES to a tuple of keys
+DataChange = namedtuple('DataChange', ['added', 'changed', 'removed'])
+
+# Number of recent changes kept for get_changes_since()
+CHANGE_LOG_SIZE = 256
+
+_data_version = 0
+_invalidation_hooks = []
+# (version, DataChange or None) for the most recent notify_data_changed() calls
+_change_log = deque(maxlen=CHANGE_LOG_SIZE)
+
+
+def get_data_version():
+    """Get the current data version number."""
+    return _data_version
+
+
+def notify_data_changed(added=None, changed=None, removed=None):
+    """
+    Record that the static data was modified.
+
+    Bumps the data version and calls every registered invalidation hook.
+    Describing the edit is optional; without a description, incremental
+    consumers treat every entry as changed. A key that was deleted and
+    added again (moving it to the end of its table) counts as removed and
+    added, while changed means its value was replaced in place.
+
+    Args:
+        added (dict): Table name (see DATA_TABLES) -> keys added to that table
+        changed (dict): Table name -> keys whose values were replaced
+        removed (dict): Table name -> keys deleted from that table
+
+    Returns:
+        int: The new data version
+    """
+    global _data_version
+
+    if added is None and changed is None and removed is None:
+        change = None
+    else:
+        fields = [
+            {table: tuple(keys) for table, keys in (edits or {}).items()}
+            for edits in (added, changed, removed)
+        ]
+        for edits in fields:
+            for table in edits:
+                if table not in DATA_TABLES:
+                    raise ValueError(f"Unknown data table '{table}'")
+        change = DataChange(*fields)
+
+    _data_version += 1
+    _change_log.append((_data_version, change))
+    for hook in list(_invalidation_hooks):
+        hook()
+    return _data_version
+
+
+def register_invalidation_hook(hook):
+    """
+    Register a callable to run whenever the data changes.
+
+    Args:
+        hook (callable): Function taking no arguments
+
+    Returns:
+        callable: The hook, so this can be used as a decorator
+    """
+    if hook not in _invalidation_hooks:
+        _invalidation_hooks.append(hook)
+    return hook
+
+
+def get_changes_since(version):
+    """
+    Get the described changes made after a data version, oldest first.
+
+    Args:
+        version (int): Data version the caller is up to date with
+
+    Returns:
+        list: DataChange entries, or None if some change in between wasn't
+        described or is too old to still be logged
+    """
+    if version == _data_version:
+        return []
+    if not _change_log or _change_log[0][0] > version + 1:
+        return None
+    changes = []
+    for change_version, change in _change_log:
+        if change_version > version:
+            if change is None:
+                return None
+            changes.append(change)
+    return changes
+
+
+def unregister_invalidation_hook(hook):
+    """Remove a previously registered invalidation hook."""
+    if hook in _invalidation_hooks:
+        _invalidation_hooks.remove(hook)
+
+
+def data_digest(pokemon_data, move_data, pokemon_moves, type_chart):
+    """
+    Fingerprint the contents of the static data tables.
+
+    Unlike the data version, the digest only depends on the data itself, so
+    it stays the same across processes for the same data.
+
+    Args:
+        pokemon_data (dict): Species type data
+        move_data (dict): Move properties
+        pokemon_moves (dict): Learnsets
+        type_chart (dict): Type effectiveness chart
+
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    encoded = json.dumps([
+        list(pokemon_data.items()),
+        list(move_data.items()),
+        list(pokemon_moves.items()),
+        list(type_chart.items())
+    ]).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
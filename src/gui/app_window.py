@@ -8,9 +8,9 @@ from tkinter import messagebox, scrolledtext
 import tkinter.font as tkfont
 
 from ..data.pokemon_data import POKEMON_DATA
-from ..utils.type_calculator import analyze_matchup
 from ..utils.music_manager import MusicManager
-from ..utils.move_recommender import recommend_moves, analyze_move_coverage
+from ..utils.result_cache import cached_analyze_matchup, cached_recommend_moves, get_move_coverage
+from ..utils.move_search import search_best_move
 from .team_builder_window import TeamBuilderWindow
 
 
@@ -309,7 +309,7 @@ class PokemonOpponentApp:
             return
         
         # Analyze matchup
-        analysis = analyze_matchup(your_pokemon_name, opponent_pokemon_name, POKEMON_DATA)
+        analysis = cached_analyze_matchup(your_pokemon_name, opponent_pokemon_name)
         
         if analysis is None:
             messagebox.showerror("Data Error", "Could not find type data for selected Pokémon. Please try again.")
@@ -318,7 +318,7 @@ class PokemonOpponentApp:
             return
         
         # Get move recommendations
-        move_recommendations = recommend_moves(your_pokemon_name, opponent_pokemon_name, POKEMON_DATA)
+        move_recommendations = cached_recommend_moves(your_pokemon_name, opponent_pokemon_name)
         
         # Play battle sound during analysis
         self._play_battle_sound()
@@ -377,6 +377,13 @@ class PokemonOpponentApp:
             output_text += f"   {move['recommendation']}\n"
             output_text += f"   Description: {move['description']}\n\n"
         
+        # Lookahead pick, searched within a small budget to keep the window responsive
+        lookahead = search_best_move(move_recommendations['pokemon'], move_recommendations['opponent'], time_budget=0.15)
+        if lookahead and lookahead.move:
+            output_text += "🧠 LOOKAHEAD PICK:\n"
+            output_text += f"• {lookahead.move} has the best expected outcome looking {lookahead.depth} turn(s) ahead "
+            output_text += f"at the opponent's replies (outlook {lookahead.value:+.2f} on a -1 to +1 scale)\n\n"
+        
         # Strategy tips
         if move_recommendations.get('strategy_tips'):
             output_text += "💡 STRATEGY TIPS:\n"
@@ -385,7 +392,7 @@ class PokemonOpponentApp:
             output_text += "\n"
         
         # Move coverage analysis
-        coverage_analysis = analyze_move_coverage(move_recommendations['pokemon'], POKEMON_DATA)
+        coverage_analysis = get_move_coverage(move_recommendations['pokemon'])
         if coverage_analysis and coverage_analysis.get('coverage_quality'):
             output_text += f"📊 MOVE COVERAGE ANALYSIS:\n"
             output_text += f"• Coverage Quality: {coverage_analysis['coverage_quality']}\n"
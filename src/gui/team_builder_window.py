@@ -3,6 +3,8 @@ Team Builder Window for the Pokémon Advisor.
 This module provides a GUI for building and analyzing teams.
 """
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import messagebox, scrolledtext, ttk
 import tkinter.font as tkfont
@@ -10,6 +12,9 @@ import tkinter.font as tkfont
 from ..data.pokemon_data import POKEMON_DATA
 from ..utils.team_builder import TeamBuilder
 
+# How often the window checks a background team search for updates
+SEARCH_POLL_MS = 50
+
 
 class TeamBuilderWindow:
     """Team Builder window for creating and analyzing Pokémon teams."""
@@ -23,6 +28,8 @@ class TeamBuilderWindow:
         """
         self.parent = parent
         self.team_builder = TeamBuilder()
+        # Update queue of the running background team search, if any
+        self._search_updates = None
         
         # Create the window
         self.window = tk.Toplevel(parent)
@@ -218,6 +225,18 @@ class TeamBuilderWindow:
             bd=2
         )
         suggest_button.pack(pady=5)
+        
+        self.complete_button = tk.Button(
+            suggestions_frame,
+            text="Complete Team",
+            command=self._complete_team,
+            font=self.button_font,
+            bg="#28a745",
+            fg="black",
+            relief=tk.RAISED,
+            bd=2
+        )
+        self.complete_button.pack(pady=5)
     
     def _create_analysis_panel(self, parent):
         """Create the team analysis panel."""
@@ -323,6 +342,83 @@ class TeamBuilderWindow:
             types_str = " / ".join(types)
             self.suggestions_text.insert(tk.END, f"{i}. {suggestion} ({types_str})\n")
     
+    def _complete_team(self):
+        """
+        Search for good team completions, showing the best team as it improves.
+        
+        The search runs on a worker thread so the window stays responsive;
+        its progress and results are passed back through a queue that the
+        Tk main loop polls.
+        """
+        if self._search_updates is not None:
+            return
+        if len(self.team_builder.get_team()) >= 6:
+            messagebox.showinfo("Info", "Team is already complete.")
+            return
+        
+        updates = queue.Queue()
+        
+        def show_progress(result, elapsed):
+            updates.put(('progress', result, elapsed))
+        
+        def search():
+            try:
+                results = self.team_builder.complete_team(time_budget=2.0, progress=show_progress)
+            except Exception as e:
+                updates.put(('error', str(e), None))
+            else:
+                updates.put(('done', results, None))
+        
+        self.suggestions_text.delete(1.0, tk.END)
+        self.suggestions_text.insert(tk.END, "Searching...")
+        self.complete_button.config(state=tk.DISABLED)
+        self._search_updates = updates
+        threading.Thread(target=search, daemon=True).start()
+        self.window.after(SEARCH_POLL_MS, self._poll_team_search)
+    
+    def _poll_team_search(self):
+        """Show queued updates from the background team search."""
+        if not self.window.winfo_exists():
+            return
+        
+        while True:
+            try:
+                kind, value, elapsed = self._search_updates.get_nowait()
+            except queue.Empty:
+                break
+            
+            if kind == 'progress':
+                self.suggestions_text.delete(1.0, tk.END)
+                self.suggestions_text.insert(tk.END, f"Searching... best so far ({elapsed:.1f}s):\n\n")
+                self.suggestions_text.insert(tk.END, self._format_team_result(value))
+                continue
+            
+            self._search_updates = None
+            self.complete_button.config(state=tk.NORMAL)
+            if kind == 'error':
+                self.suggestions_text.delete(1.0, tk.END)
+                messagebox.showerror("Error", value)
+            else:
+                self._show_team_completions(value)
+            return
+        
+        self.window.after(SEARCH_POLL_MS, self._poll_team_search)
+    
+    def _show_team_completions(self, results):
+        """Show the final results of a team search."""
+        self.suggestions_text.delete(1.0, tk.END)
+        if not results:
+            self.suggestions_text.insert(tk.END, "No team completions available.")
+            return
+        
+        self.suggestions_text.insert(tk.END, "Best team completions:\n\n")
+        for i, result in enumerate(results, 1):
+            self.suggestions_text.insert(tk.END, f"{i}. {self._format_team_result(result)}\n")
+    
+    def _format_team_result(self, result):
+        """Format a team search result for display."""
+        return f"{', '.join(result.members)} (Score: {result.score:.3f})\n"
+    
     def _analyze_team(self):
         """Analyze the current team."""
         analysis = self.team_builder.analyze_team()
@@ -5,7 +5,13 @@ Utility modules for Pokémon analysis and management.
 from .type_calculator import analyze_matchup, calculate_type_effectiveness
 from .music_manager import MusicManager
 from .move_recommender import recommend_moves, analyze_move_coverage, get_counter_moves
+from .damage_calculator import calculate_damage, calculate_all_damage, batch_damage
+from .battle_simulator import simulate_matchup
+from .batch_simulator import simulate_batch, roster_win_rates
+from .move_search import search_best_move
 from .team_builder import TeamBuilder, analyze_team_from_list, get_team_suggestions
+from .team_optimizer import find_best_teams, find_good_teams
+from .result_cache import cached_analyze_matchup, cached_recommend_moves, get_move_coverage, result_cache_info
 
 __all__ = [
     'analyze_matchup',
@@ -14,7 +20,20 @@ __all__ = [
     'recommend_moves',
     'analyze_move_coverage',
     'get_counter_moves',
+    'calculate_damage',
+    'calculate_all_damage',
+    'batch_damage',
+    'simulate_matchup',
+    'simulate_batch',
+    'roster_win_rates',
+    'search_best_move',
     'TeamBuilder',
     'analyze_team_from_list',
-    'get_team_suggestions'
+    'get_team_suggestions',
+    'find_best_teams',
+    'find_good_teams',
+    'cached_analyze_matchup',
+    'cached_recommend_moves',
+    'get_move_coverage',
+    'result_cache_info'
 ] 
\ No newline at end of file
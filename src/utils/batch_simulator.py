@@ -0,0 +1,216 @@
+"""
+Batch battle simulation.
+This module runs many independent 1v1 matchups (many battles each) through
+run_battles(), compiling each species' stats once per batch, and builds
+roster-wide win-rate tables whose rows can be spread over worker processes.
+"""
+
+import multiprocessing
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from ..data.pokemon_data import POKEMON_DATA
+from .battle_simulator import DEFAULT_MAX_TURNS, SimulationResult, compile_attacker, run_battles, wilson_interval
+from .damage_calculator import DEFAULT_LEVEL, species_stats
+
+
+def run_matchups(matchups, battles, rng, pokemon_data=None, level=DEFAULT_LEVEL, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Play out battles for a list of matchups, one matchup after another.
+
+    Args:
+        matchups (list): (Pokémon A, Pokémon B) name pairs
+        battles (int): Number of battles per matchup
+        rng (random.Random): Random number source, shared by all matchups in order
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        level (int): Level of all Pokémon
+        max_turns (int): Turn limit, after which a battle is a draw
+
+    Returns:
+        list: (A wins, B wins, draws, total turns) for each matchup, in order
+    """
+    stats = {}
+    results = []
+    for name_a, name_b in matchups:
+        for name in (name_a, name_b):
+            if name not in stats:
+                stats[name] = species_stats(name, level)
+        side_a = compile_attacker(name_a, name_b, pokemon_data, level, stats[name_a], stats[name_b])
+        side_b = compile_attacker(name_b, name_a, pokemon_data, level, stats[name_b], stats[name_a])
+        results.append(run_battles(side_a, side_b, battles, rng, max_turns))
+    return results
+
+
+def simulate_batch(matchups, battles=1000, seed=None, pokemon_data=None, level=DEFAULT_LEVEL,
+                   max_turns=DEFAULT_MAX_TURNS, confidence=0.95):
+    """
+    Simulate many matchups in one call.
+
+    Args:
+        matchups (list): (Pokémon, opponent) name pairs
+        battles (int): Number of battles per matchup
+        seed: Seed for the random number generator (None for a random seed)
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        level (int): Level of all Pokémon
+        max_turns (int): Turn limit, after which a battle is a draw
+        confidence (float): Confidence level of the win rate intervals
+
+    Returns:
+        list: SimulationResult for each matchup, in order
+    """
+    matchups = list(matchups)
+    started = time.perf_counter()
+    results = run_matchups(matchups, battles, random.Random(seed), pokemon_data, level, max_turns)
+    elapsed = time.perf_counter() - started
+    total_turns = sum(turns for _, _, _, turns in results)
+    turns_per_second = total_turns / elapsed if elapsed > 0 else float('inf')
+
+    return [
+        SimulationResult(
+            pokemon=name_a,
+            opponent=name_b,
+            battles=battles,
+            wins=wins,
+            losses=losses,
+            draws=draws,
+            win_rate=wins / battles if battles else 0.0,
+            confidence_interval=wilson_interval(wins, battles, confidence),
+            average_turns=turns / battles if battles else 0.0,
+            turns_per_second=turns_per_second
+        )
+        for (name_a, name_b), (wins, losses, draws, turns) in zip(matchups, results)
+    ]
+
+
+class WinRateTable:
+    """
+    Roster-vs-roster 1v1 results.
+
+    wins[i * N + j] counts battles species i won against species j, and
+    draws[i * N + j] the battles between them that timed out. The diagonal
+    holds each species' mirror match: wins[i * N + i] counts the battles
+    one copy won against the other.
+    """
+
+    def __init__(self, names, battles, wins, draws):
+        """
+        Initialize the table.
+
+        Args:
+            names (list): Pokémon names, in row/column order
+            battles (int): Battles simulated per pair
+            wins (array): Flat N*N win counts
+            draws (array): Flat N*N draw counts
+        """
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.battles = battles
+        self.wins = wins
+        self.draws = draws
+
+    def __len__(self):
+        return len(self.names)
+
+    def win_rate(self, pokemon, opponent):
+        """Get the fraction of battles pokemon won against opponent."""
+        return self.wins[self.index[pokemon] * len(self.names) + self.index[opponent]] / self.battles
+
+    def confidence_interval(self, pokemon, opponent, confidence=0.95):
+        """Get the Wilson confidence interval of a win rate."""
+        wins = self.wins[self.index[pokemon] * len(self.names) + self.index[opponent]]
+        return wilson_interval(wins, self.battles, confidence)
+
+    def row(self, pokemon):
+        """
+        Get one Pokémon's win rates against the whole roster.
+
+        Returns:
+            list: Win rates in name order
+        """
+        size = len(self.names)
+        start = self.index[pokemon] * size
+        return [wins / self.battles for wins in self.wins[start:start + size]]
+
+
+def roster_win_rates(names=None, battles=100, seed=None, pokemon_data=None, level=DEFAULT_LEVEL,
+                     max_turns=DEFAULT_MAX_TURNS, parallel=False, max_workers=None):
+    """
+    Simulate every pair of Pokémon in a roster, including mirror matches.
+
+    Each unordered pair is simulated once and fills both cells. Row i
+    (species i against itself and every later species) has its own random
+    stream, so a seeded table comes out the same whether the rows run in one
+    process or in a pool. The pool only pays off for large rosters or many
+    battles per pair: each worker re-imports the data and compiles its
+    species, which takes longer than a small table on its own.
+
+    Args:
+        names (list): Pokémon names (defaults to every species in pokemon_data)
+        battles (int): Battles per pair
+        seed: Seed for the random number generator (None for a random seed)
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        level (int): Level of all Pokémon
+        max_turns (int): Turn limit, after which a battle is a draw
+        parallel (bool): Spread rows over worker processes
+        max_workers (int): Number of worker processes (CPU count by default)
+
+    Returns:
+        WinRateTable: The results
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+    if names is None:
+        names = [name for name, types in pokemon_data.items() if types]
+    names = list(names)
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    # The default data is reloaded by workers; custom data is sent once each
+    config = (names, battles, seed, None if pokemon_data is POKEMON_DATA else pokemon_data, level, max_turns)
+    rows = range(len(names))
+    if parallel and len(names) > 1:
+        context = multiprocessing.get_context()
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                 initializer=_init_row_worker, initargs=(config,)) as executor:
+            row_results = list(executor.map(_simulate_row, rows))
+    else:
+        _init_row_worker(config)
+        row_results = [_simulate_row(row) for row in rows]
+
+    size = len(names)
+    wins = array('I', bytes(4 * size * size))
+    draws = array('I', bytes(4 * size * size))
+    for row, row_result in enumerate(row_results):
+        for column, (row_wins, row_losses, row_draws, _) in enumerate(row_result, start=row):
+            # The mirror match fills its cell once, from the first copy's side
+            wins[column * size + row] = row_losses
+            wins[row * size + column] = row_wins
+            draws[row * size + column] = draws[column * size + row] = row_draws
+    return WinRateTable(names, battles, wins, draws)
+
+
+# Per-process roster simulation settings set up by _init_row_worker
+_row_config = None
+
+
+def _init_row_worker(config):
+    """Store the table settings once per worker, before it runs any row."""
+    global _row_config
+    _row_config = config
+
+
+def _simulate_row(row):
+    """
+    Simulate species `row` against itself and every later species.
+
+    Returns:
+        list: (wins, losses, draws, turns) per opponent, starting with the mirror match
+    """
+    names, battles, seed, pokemon_data, level, max_turns = _row_config
+    name = names[row]
+    return run_matchups(
+        [(name, opponent) for opponent in names[row:]], battles, random.Random(f"{seed}:{row}"),
+        pokemon_data, level, max_turns
+    )
@@ -0,0 +1,294 @@
+"""
+Monte Carlo 1v1 battle simulator.
+This module plays out many randomized single battles between two Pokémon,
+using their types, stats and learnsets, and reports how often each side
+wins. Every per-matchup quantity (damage rolls, accuracy, move order) is
+compiled before the first battle, so the turn loop only draws random
+numbers and updates two integers.
+"""
+
+import random
+import time
+from collections import namedtuple
+from math import sqrt
+from statistics import NormalDist
+
+from ..data.pokemon_data import POKEMON_DATA
+from .damage_calculator import DEFAULT_LEVEL, ROLLS, damage_rolls, species_stats
+from .defensive_profiles import get_defensive_profile
+from .learnset_store import get_compiled_learnset, PHYSICAL, SPECIAL
+
+# Battles still undecided after this many turns are draws
+DEFAULT_MAX_TURNS = 100
+
+NUM_ROLLS = len(ROLLS)
+
+# One side's damaging moves against a specific opponent. Per move: the 16
+# damage rolls, accuracy in percent and lowest roll. by_expected lists move
+# positions by expected damage (best first); by_accuracy lists them by
+# accuracy (most accurate first), for picking a sure knockout.
+CompiledAttacker = namedtuple(
+    'CompiledAttacker',
+    ['pokemon', 'hp', 'speed', 'move_names', 'rolls', 'accuracies', 'lowest',
+     'by_expected', 'by_accuracy', 'max_lowest']
+)
+
+SimulationResult = namedtuple(
+    'SimulationResult',
+    ['pokemon', 'opponent', 'battles', 'wins', 'losses', 'draws', 'win_rate',
+     'confidence_interval', 'average_turns', 'turns_per_second']
+)
+
+
+def compile_attacker(attacking_pokemon, defending_pokemon, pokemon_data=None,
+                     level=DEFAULT_LEVEL, attacker_stats=None, defender_stats=None):
+    """
+    Compile one side of a matchup for simulation.
+
+    Status moves and moves without a base power are left out; a side with
+    no damaging moves can't hurt its opponent.
+
+    Args:
+        attacking_pokemon (str): Name of the attacking Pokémon
+        defending_pokemon (str): Name of its opponent
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        level (int): Level of both Pokémon
+        attacker_stats (Stats): Attacker's stats (defaults to species_stats())
+        defender_stats (Stats): Defender's stats (defaults to species_stats())
+
+    Returns:
+        CompiledAttacker: The compiled side
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+    attacking_types = pokemon_data.get(attacking_pokemon, [])
+    defending_types = pokemon_data.get(defending_pokemon, [])
+    if not attacking_types or not defending_types:
+        raise ValueError(f"Unknown matchup: {attacking_pokemon} vs {defending_pokemon}")
+
+    attacker_stats = attacker_stats or species_stats(attacking_pokemon, level)
+    defender_stats = defender_stats or species_stats(defending_pokemon, level)
+    multipliers = get_defensive_profile(defending_types).multipliers
+    learnset = get_compiled_learnset(attacking_pokemon)
+
+    move_names = []
+    rolls = []
+    accuracies = []
+    for position, move_name in enumerate(learnset.move_names):
+        category = learnset.categories[position]
+        power = learnset.powers[position]
+        if power <= 0 or category not in (PHYSICAL, SPECIAL):
+            continue
+        type_index = learnset.type_indices[position]
+        if category == PHYSICAL:
+            attack, defense = attacker_stats.attack, defender_stats.defense
+        else:
+            attack, defense = attacker_stats.sp_attack, defender_stats.sp_defense
+        move_rolls = damage_rolls(
+            level, power, attack, defense,
+            learnset.move_info[position][0] in attacking_types,
+            multipliers[type_index] if type_index >= 0 else 1.0
+        )
+        if not move_rolls[-1]:
+            continue
+        move_names.append(move_name)
+        rolls.append(move_rolls)
+        accuracies.append(learnset.accuracies[position])
+
+    lowest = [move_rolls[0] for move_rolls in rolls]
+    count = len(move_names)
+    by_expected = sorted(
+        range(count), key=lambda i: (-sum(rolls[i]) * accuracies[i], i)
+    )
+    by_accuracy = sorted(range(count), key=lambda i: (-accuracies[i], -lowest[i], i))
+    return CompiledAttacker(
+        pokemon=attacking_pokemon,
+        hp=attacker_stats.hp,
+        speed=attacker_stats.speed,
+        move_names=tuple(move_names),
+        rolls=tuple(rolls),
+        accuracies=tuple(accuracies),
+        lowest=tuple(lowest),
+        by_expected=tuple(by_expected),
+        by_accuracy=tuple(by_accuracy),
+        max_lowest=max(lowest, default=0)
+    )
+
+
+def choose_move(side, opponent_hp):
+    """
+    Pick a move: the most accurate sure knockout if there is one, otherwise
+    the move with the highest expected damage.
+
+    Args:
+        side (CompiledAttacker): The attacking side
+        opponent_hp (int): Opponent's remaining HP
+
+    Returns:
+        int: Move position in side.move_names, or -1 if the side has no moves
+    """
+    if not side.move_names:
+        return -1
+    if opponent_hp <= side.max_lowest:
+        lowest = side.lowest
+        for move in side.by_accuracy:
+            if lowest[move] >= opponent_hp:
+                return move
+    return side.by_expected[0]
+
+
+def move_choice_table(side, opponent_hp):
+    """
+    Precompute choose_move() for every opponent HP value.
+
+    Returns:
+        list: Move position (or -1) indexed by the opponent's remaining HP
+    """
+    return [choose_move(side, hp) for hp in range(opponent_hp + 1)]
+
+
+def run_battles(side_a, side_b, battles, rng, max_turns=DEFAULT_MAX_TURNS):
+    """
+    Play out battles between two compiled sides.
+
+    Each turn the faster side attacks first (speed ties are decided at
+    random every turn), and a side that faints doesn't attack back.
+
+    Args:
+        side_a (CompiledAttacker): Side A, compiled against side B
+        side_b (CompiledAttacker): Side B, compiled against side A
+        battles (int): Number of battles
+        rng (random.Random): Random number source
+        max_turns (int): Turn limit, after which a battle is a draw
+
+    Returns:
+        tuple: (side A wins, side B wins, draws, total turns played)
+    """
+    random_value = rng.random
+    hp_a_start, hp_b_start = side_a.hp, side_b.hp
+
+    # Per HP value move choice, then per side flat (rolls, accuracy) lookups
+    choice_a = move_choice_table(side_a, hp_b_start)
+    choice_b = move_choice_table(side_b, hp_a_start)
+    rolls_a, accuracy_a = side_a.rolls, [a / 100 for a in side_a.accuracies]
+    rolls_b, accuracy_b = side_b.rolls, [a / 100 for a in side_b.accuracies]
+    speed_a, speed_b = side_a.speed, side_b.speed
+
+    wins_a = wins_b = draws = total_turns = 0
+    if not side_a.move_names and not side_b.move_names:
+        return 0, 0, battles, battles * max_turns
+
+    for _ in range(battles):
+        hp_a = hp_a_start
+        hp_b = hp_b_start
+        turn = 0
+        while turn < max_turns:
+            turn += 1
+            a_first = speed_a > speed_b or (speed_a == speed_b and random_value() < 0.5)
+
+            if a_first:
+                move = choice_a[hp_b]
+                if move >= 0 and random_value() < accuracy_a[move]:
+                    hp_b -= rolls_a[move][int(random_value() * NUM_ROLLS)]
+                    if hp_b <= 0:
+                        break
+                move = choice_b[hp_a]
+                if move >= 0 and random_value() < accuracy_b[move]:
+                    hp_a -= rolls_b[move][int(random_value() * NUM_ROLLS)]
+                    if hp_a <= 0:
+                        break
+            else:
+                move = choice_b[hp_a]
+                if move >= 0 and random_value() < accuracy_b[move]:
+                    hp_a -= rolls_b[move][int(random_value() * NUM_ROLLS)]
+                    if hp_a <= 0:
+                        break
+                move = choice_a[hp_b]
+                if move >= 0 and random_value() < accuracy_a[move]:
+                    hp_b -= rolls_a[move][int(random_value() * NUM_ROLLS)]
+                    if hp_b <= 0:
+                        break
+
+        total_turns += turn
+        if hp_b <= 0:
+            wins_a += 1
+        elif hp_a <= 0:
+            wins_b += 1
+        else:
+            draws += 1
+
+    return wins_a, wins_b, draws, total_turns
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """
+    Wilson score interval for a binomial proportion.
+
+    Args:
+        successes (int): Number of successes
+        trials (int): Number of trials
+        confidence (float): Confidence level, e.g. 0.95
+
+    Returns:
+        tuple: (low, high) bounds of the proportion
+    """
+    if trials <= 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denominator
+    margin = z * sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+def simulate_matchup(attacking_pokemon, defending_pokemon, pokemon_data=None, battles=1000,
+                     seed=None, level=DEFAULT_LEVEL, attacker_stats=None, defender_stats=None,
+                     max_turns=DEFAULT_MAX_TURNS, confidence=0.95):
+    """
+    Estimate a Pokémon's chance of winning a 1v1 battle.
+
+    Both sides use their damaging moves from POKEMON_MOVES, picking a sure
+    knockout when one is available and their highest expected damage move
+    otherwise. Critical hits, status moves and secondary effects are not
+    simulated.
+
+    Args:
+        attacking_pokemon (str): Name of the Pokémon to evaluate
+        defending_pokemon (str): Name of its opponent
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        battles (int): Number of battles to simulate
+        seed: Seed for the random number generator (None for a random seed)
+        level (int): Level of both Pokémon
+        attacker_stats (Stats): Attacker's stats (defaults to species_stats())
+        defender_stats (Stats): Defender's stats (defaults to species_stats())
+        max_turns (int): Turn limit, after which a battle is a draw
+        confidence (float): Confidence level of the win rate interval
+
+    Returns:
+        SimulationResult: Win/loss/draw counts, the win rate and its Wilson
+        confidence interval
+    """
+    attacker_stats = attacker_stats or species_stats(attacking_pokemon, level)
+    defender_stats = defender_stats or species_stats(defending_pokemon, level)
+    side_a = compile_attacker(attacking_pokemon, defending_pokemon, pokemon_data, level,
+                              attacker_stats, defender_stats)
+    side_b = compile_attacker(defending_pokemon, attacking_pokemon, pokemon_data, level,
+                              defender_stats, attacker_stats)
+
+    started = time.perf_counter()
+    wins, losses, draws, turns = run_battles(side_a, side_b, battles, random.Random(seed), max_turns)
+    elapsed = time.perf_counter() - started
+
+    return SimulationResult(
+        pokemon=attacking_pokemon,
+        opponent=defending_pokemon,
+        battles=battles,
+        wins=wins,
+        losses=losses,
+        draws=draws,
+        win_rate=wins / battles if battles else 0.0,
+        confidence_interval=wilson_interval(wins, battles, confidence),
+        average_turns=turns / battles if battles else 0.0,
+        turns_per_second=turns / elapsed if elapsed > 0 else float('inf')
+    )
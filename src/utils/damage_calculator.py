@@ -0,0 +1,484 @@
+"""
+Damage calculation for Pokémon battles.
+This module applies the main-series damage formula (level, power, attacking
+and defending stats, STAB, type effectiveness and the 85-100% random roll)
+to give each move's full damage range and its chance to knock out the
+defender, for single moves and in batch over the whole roster.
+"""
+
+from array import array
+from collections import namedtuple
+
+from ..data.pokemon_data import POKEMON_DATA
+from ..data.base_stats import Stats, NUM_STATS, get_base_stat_table
+from ..data.versioning import register_invalidation_hook
+from .defensive_profiles import get_defensive_profile
+from .learnset_store import get_compiled_learnset, PHYSICAL, SPECIAL
+from .type_masks import type_mask
+
+DEFAULT_LEVEL = 50
+
+# Stats for species without base stats: a level-50 Pokémon with base 80 in
+# every stat, 31 IVs and no EVs
+DEFAULT_STATS = Stats(hp=155, attack=100, defense=100, sp_attack=100, sp_defense=100, speed=100)
+
+# The random roll multiplies damage by 85% to 100%, in 16 equally likely steps
+ROLLS = tuple(range(85, 101))
+
+# One move's damage against one defender. rolls holds the damage of each of
+# the 16 random rolls, lowest first; ko_chance includes the accuracy check.
+DamageResult = namedtuple(
+    'DamageResult',
+    ['move', 'move_type', 'category', 'effectiveness', 'stab', 'rolls',
+     'min_damage', 'max_damage', 'min_percent', 'max_percent', 'ko_chance', 'hits_to_ko']
+)
+
+
+def damage_rolls(level, power, attack, defense, stab, effectiveness):
+    """
+    Compute the damage of every random roll.
+
+    Critical hits, weather, abilities, items and burns are not modelled.
+
+    Args:
+        level (int): Level of both Pokémon
+        power (int): Move base power
+        attack (int): Attacker's Attack or Sp. Atk stat
+        defense (int): Defender's Defense or Sp. Def stat
+        stab (bool): Whether the move gets the same-type attack bonus
+        effectiveness (float): Type effectiveness multiplier
+
+    Returns:
+        tuple: Damage for each of the 16 rolls, lowest first
+    """
+    if power <= 0 or effectiveness == 0.0:
+        return (0,) * len(ROLLS)
+
+    base = (2 * level // 5 + 2) * power * attack // defense // 50 + 2
+    rolls = []
+    for roll in ROLLS:
+        damage = base * roll // 100
+        if stab:
+            damage = damage * 3 // 2
+        # A hit that connects always does at least 1 damage
+        rolls.append(max(int(damage * effectiveness), 1))
+    return tuple(rolls)
+
+
+def _damage_range(level_factor, power, attack, defense, stab, effectiveness):
+    """Compute only the lowest and highest roll of damage_rolls()."""
+    if power <= 0 or effectiveness == 0.0:
+        return 0, 0
+
+    base = level_factor * power * attack // defense // 50 + 2
+    low = base * 85 // 100
+    high = base
+    if stab:
+        low = low * 3 // 2
+        high = high * 3 // 2
+    return max(int(low * effectiveness), 1), max(int(high * effectiveness), 1)
+
+
+def _ko_chance(level, power, accuracy, attack, defense, stab, effectiveness, hp, low, high):
+    """Chance that one use of a move knocks out a defender with hp HP."""
+    if high < hp:
+        return 0.0
+    if low >= hp:
+        return accuracy / 100
+    # Only a partial KO needs the individual rolls
+    rolls = damage_rolls(level, power, attack, defense, stab, effectiveness)
+    return accuracy / 100 * sum(1 for damage in rolls if damage >= hp) / len(rolls)
+
+
+def species_stats(pokemon_name, level=DEFAULT_LEVEL):
+    """
+    Get a Pokémon's stats at a level, with 31 IVs, no EVs and a neutral nature.
+
+    Args:
+        pokemon_name (str): Name of the Pokémon
+        level (int): Level
+
+    Returns:
+        Stats: The stats (DEFAULT_STATS if the Pokémon has no base stats)
+    """
+    stats = get_base_stat_table().stats(pokemon_name, level)
+    return DEFAULT_STATS if stats is None else stats
+
+
+def _resolve_stats(names, stats, level):
+    """
+    Get the stats of many Pokémon at once.
+
+    Args:
+        names (list): Pokémon names
+        stats: Stats shared by all, a dict of Pokémon name -> Stats, or None;
+            names without given stats use species_stats()
+        level (int): Level
+
+    Returns:
+        list: Stats for each name
+    """
+    if stats is not None and not isinstance(stats, dict):
+        return [stats] * len(names)
+
+    overrides = stats or {}
+    table = get_base_stat_table()
+    # One column pass computes the whole roster's stats
+    roster = table.compute_stats(level)
+    resolved = []
+    for name in names:
+        species_id = table.species_id(name)
+        if name in overrides:
+            resolved.append(overrides[name])
+        elif species_id is None:
+            resolved.append(DEFAULT_STATS)
+        else:
+            start = species_id * NUM_STATS
+            resolved.append(Stats(*roster[start:start + NUM_STATS]))
+    return resolved
+
+
+def _hits_to_ko(low, high, hp):
+    """Get (fewest, most) hits needed to knock out a defender, ignoring misses."""
+    if high <= 0:
+        return None
+    return -(-hp // high), -(-hp // low)
+
+
+def calculate_damage(attacking_pokemon, defending_pokemon, move_name, pokemon_data,
+                     attacker_stats=None, defender_stats=None, level=DEFAULT_LEVEL, defender_hp=None):
+    """
+    Calculate a move's damage range and KO chance against a Pokémon.
+
+    Args:
+        attacking_pokemon (str): Name of the attacking Pokémon
+        defending_pokemon (str): Name of the defending Pokémon
+        move_name (str): Name of the move (must be in the attacker's learnset)
+        pokemon_data (dict): Dictionary containing Pokémon type data
+        attacker_stats (Stats): Attacker's stats (defaults to species_stats())
+        defender_stats (Stats): Defender's stats (defaults to species_stats())
+        level (int): Level of both Pokémon
+        defender_hp (int): Defender's current HP (defaults to full HP)
+
+    Returns:
+        DamageResult: The damage analysis, or None if a Pokémon or the move is unknown
+    """
+    attacking_types = pokemon_data.get(attacking_pokemon, [])
+    defending_types = pokemon_data.get(defending_pokemon, [])
+    if not attacking_types or not defending_types:
+        return None
+
+    learnset = get_compiled_learnset(attacking_pokemon)
+    if move_name not in learnset.move_names:
+        return None
+    position = learnset.move_names.index(move_name)
+
+    return _analyze_move(
+        learnset, position, attacking_types,
+        get_defensive_profile(defending_types).multipliers,
+        attacker_stats or species_stats(attacking_pokemon, level),
+        defender_stats or species_stats(defending_pokemon, level), level, defender_hp
+    )
+
+
+def calculate_all_damage(attacking_pokemon, defending_pokemon, pokemon_data,
+                         attacker_stats=None, defender_stats=None, level=DEFAULT_LEVEL, defender_hp=None):
+    """
+    Calculate the damage of every move an attacker knows against a Pokémon.
+
+    Args:
+        attacking_pokemon (str): Name of the attacking Pokémon
+        defending_pokemon (str): Name of the defending Pokémon
+        pokemon_data (dict): Dictionary containing Pokémon type data
+        attacker_stats (Stats): Attacker's stats (defaults to species_stats())
+        defender_stats (Stats): Defender's stats (defaults to species_stats())
+        level (int): Level of both Pokémon
+        defender_hp (int): Defender's current HP (defaults to full HP)
+
+    Returns:
+        list: DamageResult for each move, highest maximum damage first
+    """
+    attacking_types = pokemon_data.get(attacking_pokemon, [])
+    defending_types = pokemon_data.get(defending_pokemon, [])
+    if not attacking_types or not defending_types:
+        return []
+
+    learnset = get_compiled_learnset(attacking_pokemon)
+    multipliers = get_defensive_profile(defending_types).multipliers
+    attacker_stats = attacker_stats or species_stats(attacking_pokemon, level)
+    defender_stats = defender_stats or species_stats(defending_pokemon, level)
+    results = [
+        _analyze_move(learnset, position, attacking_types, multipliers,
+                      attacker_stats, defender_stats, level, defender_hp)
+        for position in range(len(learnset))
+    ]
+    results.sort(key=lambda result: (result.max_damage, result.ko_chance), reverse=True)
+    return results
+
+
+def _analyze_move(learnset, position, attacking_types, multipliers,
+                  attacker_stats, defender_stats, level, defender_hp):
+    """Build the DamageResult for one learnset move."""
+    move_type, power, accuracy, pp, category, description = learnset.move_info[position]
+    type_index = learnset.type_indices[position]
+    effectiveness = multipliers[type_index] if type_index >= 0 else 1.0
+    stab = move_type in attacking_types
+    attack, defense = _attack_and_defense(learnset.categories[position], attacker_stats, defender_stats)
+    hp = defender_stats.hp if defender_hp is None else defender_hp
+
+    if attack is None:
+        rolls = (0,) * len(ROLLS)
+    else:
+        rolls = damage_rolls(level, power, attack, defense, stab, effectiveness)
+    low, high = rolls[0], rolls[-1]
+
+    return DamageResult(
+        move=learnset.move_names[position],
+        move_type=move_type,
+        category=category,
+        effectiveness=effectiveness,
+        stab=stab,
+        rolls=rolls,
+        min_damage=low,
+        max_damage=high,
+        min_percent=100 * low / defender_stats.hp,
+        max_percent=100 * high / defender_stats.hp,
+        ko_chance=accuracy / 100 * sum(1 for damage in rolls if damage >= hp) / len(rolls) if high else 0.0,
+        hits_to_ko=_hits_to_ko(low, high, hp)
+    )
+
+
+def _attack_and_defense(category_code, attacker_stats, defender_stats):
+    """Pick the stats a move category uses; status moves get (None, None)."""
+    if category_code == PHYSICAL:
+        return attacker_stats.attack, defender_stats.defense
+    if category_code == SPECIAL:
+        return attacker_stats.sp_attack, defender_stats.sp_defense
+    return None, None
+
+
+class RosterMoves:
+    """
+    Every damaging move of every species, as flat parallel columns.
+
+    Entry i is one move of species species_names[species[i]]; powers,
+    accuracies, type indices, categories and STAB flags are stored in arrays
+    so batch damage runs over contiguous columns.
+    """
+
+    def __init__(self, pokemon_data=None):
+        """
+        Compile the table.
+
+        Args:
+            pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        """
+        if pokemon_data is None:
+            pokemon_data = POKEMON_DATA
+
+        self.species_names = []
+        self.move_names = []
+        self.species = array('H')
+        self.positions = array('H')
+        self.powers = array('H')
+        self.accuracies = array('B')
+        self.type_indices = array('b')
+        self.categories = array('B')
+        self.stabs = array('B')
+
+        for name, types in pokemon_data.items():
+            if not types:
+                continue
+            learnset = get_compiled_learnset(name)
+            species_index = len(self.species_names)
+            self.species_names.append(name)
+            attacking_mask = type_mask(types)
+            for position, move_name in enumerate(learnset.move_names):
+                power = learnset.powers[position]
+                category = learnset.categories[position]
+                if power <= 0 or category not in (PHYSICAL, SPECIAL):
+                    continue
+                type_index = learnset.type_indices[position]
+                self.move_names.append(move_name)
+                self.species.append(species_index)
+                self.positions.append(position)
+                self.powers.append(power)
+                self.accuracies.append(learnset.accuracies[position])
+                self.type_indices.append(type_index)
+                self.categories.append(category)
+                self.stabs.append(1 if type_index >= 0 and attacking_mask >> type_index & 1 else 0)
+
+    def __len__(self):
+        return len(self.move_names)
+
+
+# Batch damage of many moves against one defender, or one attacker's moves
+# against many defenders. Column i describes entry i: attackers[i] uses
+# moves[i] on defenders[i].
+BatchDamage = namedtuple(
+    'BatchDamage',
+    ['attackers', 'defenders', 'moves', 'min_damage', 'max_damage', 'ko_chance']
+)
+
+
+_roster_moves = None
+
+
+def get_roster_moves():
+    """Get the roster-wide move table, compiling it on first use."""
+    global _roster_moves
+
+    if _roster_moves is None:
+        _roster_moves = RosterMoves()
+    return _roster_moves
+
+
+@register_invalidation_hook
+def clear_roster_moves():
+    """Drop the roster move table so it is rebuilt from the current data."""
+    global _roster_moves
+    _roster_moves = None
+
+
+def batch_damage(defending_pokemon, pokemon_data=None, attacker_stats=None,
+                 defender_stats=None, level=DEFAULT_LEVEL):
+    """
+    Calculate the damage of every move of every species against one defender.
+
+    Args:
+        defending_pokemon (str): Name of the defending Pokémon
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        attacker_stats: Stats shared by all attackers, or a dict mapping
+            Pokémon names to Stats (missing names use species_stats())
+        defender_stats (Stats): Defender's stats (defaults to species_stats())
+        level (int): Level of both Pokémon
+
+    Returns:
+        BatchDamage: One entry per damaging roster move, or None if the
+        defender is unknown
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+    defending_types = pokemon_data.get(defending_pokemon, [])
+    if not defending_types:
+        return None
+
+    table = get_roster_moves() if pokemon_data is POKEMON_DATA else RosterMoves(pokemon_data)
+    defender_stats = defender_stats or species_stats(defending_pokemon, level)
+    multipliers = get_defensive_profile(defending_types).multipliers
+
+    # Attack stat columns per species, resolved once
+    attacker_column = _resolve_stats(table.species_names, attacker_stats, level)
+    physical_attack = [stats.attack for stats in attacker_column]
+    special_attack = [stats.sp_attack for stats in attacker_column]
+
+    return _run_batch(
+        table.powers, table.accuracies, table.type_indices, table.categories, table.stabs,
+        attack_columns=(physical_attack, special_attack),
+        attack_keys=table.species,
+        multiplier_rows=(multipliers,),
+        defender_keys=None,
+        defense_columns=((defender_stats.defense,), (defender_stats.sp_defense,)),
+        hp_column=(defender_stats.hp,),
+        level=level,
+        attackers=[table.species_names[s] for s in table.species],
+        defenders=[defending_pokemon] * len(table),
+        moves=list(table.move_names)
+    )
+
+
+def learnset_damage_vs_roster(attacking_pokemon, pokemon_data=None, attacker_stats=None,
+                              defender_stats=None, level=DEFAULT_LEVEL):
+    """
+    Calculate the damage of every move a Pokémon knows against every species.
+
+    Args:
+        attacking_pokemon (str): Name of the attacking Pokémon
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        attacker_stats (Stats): Attacker's stats (defaults to species_stats())
+        defender_stats: Stats shared by all defenders, or a dict mapping
+            Pokémon names to Stats (missing names use species_stats())
+        level (int): Level of both Pokémon
+
+    Returns:
+        BatchDamage: One entry per (damaging move, defender) pair, grouped by
+        defender, or None if the attacker is unknown
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+    attacking_types = pokemon_data.get(attacking_pokemon, [])
+    if not attacking_types:
+        return None
+
+    learnset = get_compiled_learnset(attacking_pokemon)
+    attacker_stats = attacker_stats or species_stats(attacking_pokemon, level)
+    attacking_mask = type_mask(attacking_types)
+    moves = [
+        position for position in range(len(learnset))
+        if learnset.powers[position] > 0 and learnset.categories[position] in (PHYSICAL, SPECIAL)
+    ]
+    defenders = [name for name, types in pokemon_data.items() if types]
+
+    stats = _resolve_stats(defenders, defender_stats, level)
+
+    # Entries run defender-major: every move against defender 0, then defender 1, ...
+    move_count = len(moves)
+    defender_keys = array('H', (d for d in range(len(defenders)) for _ in range(move_count)))
+    repeat = len(defenders)
+    return _run_batch(
+        array('H', [learnset.powers[p] for p in moves]) * repeat,
+        array('B', [learnset.accuracies[p] for p in moves]) * repeat,
+        array('b', [learnset.type_indices[p] for p in moves]) * repeat,
+        array('B', [learnset.categories[p] for p in moves]) * repeat,
+        array('B', [
+            1 if learnset.type_indices[p] >= 0 and attacking_mask >> learnset.type_indices[p] & 1 else 0
+            for p in moves
+        ]) * repeat,
+        attack_columns=((attacker_stats.attack,), (attacker_stats.sp_attack,)),
+        attack_keys=None,
+        multiplier_rows=[get_defensive_profile(pokemon_data[name]).multipliers for name in defenders],
+        defender_keys=defender_keys,
+        defense_columns=([s.defense for s in stats], [s.sp_defense for s in stats]),
+        hp_column=[s.hp for s in stats],
+        level=level,
+        attackers=[attacking_pokemon] * (move_count * repeat),
+        defenders=[name for name in defenders for _ in range(move_count)],
+        moves=[learnset.move_names[p] for p in moves] * repeat
+    )
+
+
+def _run_batch(powers, accuracies, type_indices, categories, stabs,
+               attack_columns, attack_keys, multiplier_rows, defender_keys,
+               defense_columns, hp_column, level, attackers, defenders, moves):
+    """
+    Evaluate a batch of (attacker, move, defender) entries column by column.
+
+    Attack stats are looked up by attack_keys (None: all entries use index
+    0), and multipliers, defenses and HP by defender_keys likewise.
+    """
+    level_factor = 2 * level // 5 + 2
+    size = len(powers)
+    zeros = array('H', [0]) * size
+    attack_keys = zeros if attack_keys is None else attack_keys
+    defender_keys = zeros if defender_keys is None else defender_keys
+    physical_attack, special_attack = attack_columns
+    physical_defense, special_defense = defense_columns
+
+    min_damage = array('I', [0]) * size
+    max_damage = array('I', [0]) * size
+    ko_chance = array('d', [0.0]) * size
+    for i, (power, accuracy, type_index, category, stab, attacker, defender) in enumerate(
+            zip(powers, accuracies, type_indices, categories, stabs, attack_keys, defender_keys)):
+        effectiveness = multiplier_rows[defender][type_index] if type_index >= 0 else 1.0
+        if category == PHYSICAL:
+            attack, defense = physical_attack[attacker], physical_defense[defender]
+        else:
+            attack, defense = special_attack[attacker], special_defense[defender]
+        low, high = _damage_range(level_factor, power, attack, defense, stab, effectiveness)
+        min_damage[i] = low
+        max_damage[i] = high
+        ko_chance[i] = _ko_chance(
+            level, power, accuracy, attack, defense, stab, effectiveness, hp_column[defender], low, high
+        )
+
+    return BatchDamage(attackers, defenders, moves, min_damage, max_damage, ko_chance)
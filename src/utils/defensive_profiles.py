@@ -0,0 +1,132 @@
+"""
+Precomputed defensive profiles for every type combination.
+There are only 18 single types and 153 dual-type pairs, so the full defensive
+vector for each combination is computed once and shared by every lookup.
+"""
+
+from collections import namedtuple
+from itertools import combinations
+
+from ..data.pokemon_data import ALL_TYPES
+from .type_matrix import NUM_TYPES, TYPE_INDEX, get_type_matrix, encode_types
+from .type_masks import indices_mask
+
+# multipliers: 18 multipliers, indexed by attacking type index
+# weaknesses / resistances / immunities: frozensets of attacking type names
+# (resistances include immunities, matching the team analysis convention)
+# weak_mask / resist_mask / immune_mask: the same sets as type bitmasks
+DefensiveProfile = namedtuple(
+    'DefensiveProfile',
+    ['types', 'multipliers', 'weaknesses', 'resistances', 'immunities',
+     'weak_mask', 'resist_mask', 'immune_mask']
+)
+
+# Sorted type-index tuple -> DefensiveProfile
+_PROFILES = {}
+
+# Tuple of type names as given by callers -> DefensiveProfile
+_PROFILES_BY_NAMES = {}
+
+# Matrix the tables were built from, used to detect TYPE_CHART rebuilds
+_built_from = None
+
+
+def _make_profile(type_indices):
+    """Build the defensive profile for a sorted tuple of type indices."""
+    matrix = get_type_matrix()
+    multipliers = []
+    for attacking_index in range(NUM_TYPES):
+        row = matrix[attacking_index]
+        multiplier = 1.0
+        for defending_index in type_indices:
+            multiplier *= row[defending_index]
+        multipliers.append(multiplier)
+
+    return DefensiveProfile(
+        types=tuple(ALL_TYPES[i] for i in type_indices),
+        multipliers=tuple(multipliers),
+        weaknesses=frozenset(ALL_TYPES[i] for i, m in enumerate(multipliers) if m > 1.0),
+        resistances=frozenset(ALL_TYPES[i] for i, m in enumerate(multipliers) if m < 1.0),
+        immunities=frozenset(ALL_TYPES[i] for i, m in enumerate(multipliers) if m == 0.0),
+        weak_mask=indices_mask(i for i, m in enumerate(multipliers) if m > 1.0),
+        resist_mask=indices_mask(i for i, m in enumerate(multipliers) if m < 1.0),
+        immune_mask=indices_mask(i for i, m in enumerate(multipliers) if m == 0.0)
+    )
+
+
+def _ensure_built():
+    """Build (or rebuild after a TYPE_CHART change) the profile table."""
+    global _built_from
+
+    matrix = get_type_matrix()
+    if _built_from is matrix:
+        return
+
+    _PROFILES.clear()
+    _PROFILES_BY_NAMES.clear()
+    _PROFILES[()] = _make_profile(())
+    for index in range(NUM_TYPES):
+        _PROFILES[(index,)] = _make_profile((index,))
+    for pair in combinations(range(NUM_TYPES), 2):
+        _PROFILES[pair] = _make_profile(pair)
+    _built_from = matrix
+
+
+def get_defensive_profile(defending_types):
+    """
+    Get the defensive profile for a list of defending types.
+
+    Args:
+        defending_types (list): List of defending Pokémon's types
+
+    Returns:
+        DefensiveProfile: The precomputed profile for that type combination
+    """
+    _ensure_built()
+    key = tuple(defending_types)
+    profile = _PROFILES_BY_NAMES.get(key)
+    if profile is None:
+        profile = get_defensive_profile_for_indices(tuple(sorted(encode_types(defending_types))))
+        _PROFILES_BY_NAMES[key] = profile
+    return profile
+
+
+def get_defensive_profile_for_indices(type_indices):
+    """
+    Get the defensive profile for a sorted tuple of type indices.
+
+    Args:
+        type_indices (tuple): Sorted defending type indices
+
+    Returns:
+        DefensiveProfile: The precomputed profile for that type combination
+    """
+    _ensure_built()
+    profile = _PROFILES.get(type_indices)
+    if profile is None:
+        profile = _make_profile(type_indices)
+        _PROFILES[type_indices] = profile
+    return profile
+
+
+def get_all_defensive_profiles():
+    """Get every single- and dual-type profile keyed by sorted type indices."""
+    _ensure_built()
+    return dict(_PROFILES)
+
+
+def defensive_multiplier(attacking_type, defending_types):
+    """
+    Look up the multiplier an attacking type deals to a type combination.
+
+    Args:
+        attacking_type (str): The type of the attacking move
+        defending_types (list): List of defending Pokémon's types
+
+    Returns:
+        float: The effectiveness multiplier
+    """
+    attacking_index = TYPE_INDEX.get(attacking_type)
+    if attacking_index is None:
+        return 1.0
+    return get_defensive_profile(defending_types).multipliers[attacking_index]
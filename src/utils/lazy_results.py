@@ -0,0 +1,149 @@
+"""
+Result records with lazily rendered text fields.
+Analysis functions store numeric data directly and register a renderer for
+each descriptive string; the string is only built the first time it is read.
+"""
+
+
+class LazyRecord(dict):
+    """
+    Dict whose text fields are rendered on first access.
+
+    Indexing, get() and membership tests render (or skip) a single lazy
+    field. Anything that looks at the record as a whole (iteration, len(),
+    items(), comparison, copy(), json.dumps and so on) renders the remaining
+    fields first, so records behave exactly like the plain dicts they
+    replace.
+    """
+
+    __slots__ = ('_renderers',)
+
+    def __init__(self, values, renderers=None):
+        """
+        Initialize the record.
+
+        Args:
+            values (dict): Eagerly computed fields
+            renderers (dict): Maps lazy field names to callables taking no
+                arguments that build the field's value
+        """
+        dict.__init__(self, values)
+        self._renderers = dict(renderers or {})
+
+    def __missing__(self, key):
+        try:
+            renderer = self._renderers.pop(key)
+        except KeyError:
+            raise KeyError(key) from None
+        value = renderer()
+        dict.__setitem__(self, key, value)
+        return value
+
+    def _render_all(self):
+        """Render every field that hasn't been built yet, in registration order."""
+        while self._renderers:
+            self.__missing__(next(iter(self._renderers)))
+
+    def is_rendered(self, key):
+        """Check whether a lazy field has already been built."""
+        return key not in self._renderers
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self._renderers
+
+    def __setitem__(self, key, value):
+        self._renderers.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        if self._renderers.pop(key, None) is None:
+            dict.__delitem__(self, key)
+
+    def __iter__(self):
+        self._render_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        return dict.__len__(self) + len(self._renderers)
+
+    def __eq__(self, other):
+        self._render_all()
+        if isinstance(other, LazyRecord):
+            other._render_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    __hash__ = None
+
+    def __repr__(self):
+        self._render_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+    def keys(self):
+        self._render_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._render_all()
+        return dict.values(self)
+
+    def items(self):
+        self._render_all()
+        return dict.items(self)
+
+    def copy(self):
+        """Get a plain dict copy with every field rendered."""
+        return dict(self.items())
+
+    def pop(self, key, *default):
+        if key in self:
+            value = self[key]
+            dict.__delitem__(self, key)
+            return value
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._render_all()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        dict.__setitem__(self, key, default)
+        return default
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self._renderers.clear()
+        dict.clear(self)
+
+    def frozen(self, freeze):
+        """
+        Get a copy whose eager and (future) lazy values pass through freeze.
+
+        Args:
+            freeze (callable): Function converting a value to an immutable form
+        """
+        return LazyRecord(
+            {key: freeze(value) for key, value in dict.items(self)},
+            {key: _frozen_renderer(renderer, freeze) for key, renderer in self._renderers.items()}
+        )
+
+
+def _frozen_renderer(renderer, freeze):
+    """Wrap a renderer so its output is frozen."""
+    return lambda: freeze(renderer())
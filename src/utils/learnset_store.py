@@ -0,0 +1,124 @@
+"""
+Compiled per-species learnsets.
+This module turns each species' move list from POKEMON_MOVES into parallel
+arrays of move type index, power, accuracy and category code, plus a bitmask
+of the move types it covers, so move-based analyses read contiguous arrays
+instead of looking up and unpacking MOVE_DATA entries on every call.
+"""
+
+from array import array
+
+from ..data.move_data import POKEMON_MOVES, MOVE_DATA
+from ..data.versioning import register_invalidation_hook
+from .type_matrix import TYPE_INDEX
+
+# Category codes used in the compiled arrays
+CATEGORY_NAMES = ("Physical", "Special", "Status")
+CATEGORY_CODES = {name: code for code, name in enumerate(CATEGORY_NAMES)}
+PHYSICAL, SPECIAL, STATUS = 0, 1, 2
+UNKNOWN_CATEGORY = 255
+
+# Type index stored for move types outside ALL_TYPES (treated as neutral)
+UNKNOWN_TYPE = -1
+
+
+class CompiledLearnset:
+    """Struct-of-arrays view of one species' known moves."""
+
+    __slots__ = (
+        'pokemon', 'total_moves', 'move_names', 'move_info', 'move_types',
+        'type_indices', 'powers', 'accuracies', 'categories', 'type_mask'
+    )
+
+    def __init__(self, pokemon, move_list):
+        """
+        Compile a learnset.
+
+        Args:
+            pokemon (str): Name of the Pokémon
+            move_list (list): Move names as listed in POKEMON_MOVES
+        """
+        self.pokemon = pokemon
+        # Moves missing from MOVE_DATA are skipped but still counted here
+        self.total_moves = len(move_list)
+
+        names = []
+        infos = []
+        seen_types = []
+        self.type_indices = array('b')
+        self.powers = array('H')
+        self.accuracies = array('B')
+        self.categories = array('B')
+        self.type_mask = 0
+
+        for move_name in move_list:
+            move_info = MOVE_DATA.get(move_name)
+            if not move_info:
+                continue
+            move_type, power, accuracy, pp, category, description = move_info
+            type_index = TYPE_INDEX.get(move_type, UNKNOWN_TYPE)
+
+            names.append(move_name)
+            infos.append((move_type, power, accuracy, pp, category, description))
+            self.type_indices.append(type_index)
+            self.powers.append(power)
+            self.accuracies.append(accuracy)
+            self.categories.append(CATEGORY_CODES.get(category, UNKNOWN_CATEGORY))
+            if type_index != UNKNOWN_TYPE:
+                self.type_mask |= 1 << type_index
+            if move_type not in seen_types:
+                seen_types.append(move_type)
+
+        self.move_names = tuple(names)
+        self.move_info = tuple(infos)
+        self.move_types = tuple(seen_types)
+
+    def __len__(self):
+        return len(self.move_names)
+
+    def category_counts(self):
+        """Get (physical, special, status) move counts."""
+        categories = self.categories
+        return categories.count(PHYSICAL), categories.count(SPECIAL), categories.count(STATUS)
+
+
+_EMPTY_LEARNSET = CompiledLearnset(None, [])
+
+_compiled = {}
+
+
+def get_compiled_learnset(pokemon_name):
+    """
+    Get the compiled learnset for a Pokémon, compiling it on first use.
+
+    Args:
+        pokemon_name (str): Name of the Pokémon
+
+    Returns:
+        CompiledLearnset: The compiled moves (empty if none are known)
+    """
+    learnset = _compiled.get(pokemon_name)
+    if learnset is None:
+        move_list = POKEMON_MOVES.get(pokemon_name)
+        learnset = CompiledLearnset(pokemon_name, move_list) if move_list else _EMPTY_LEARNSET
+        _compiled[pokemon_name] = learnset
+    return learnset
+
+
+def compile_all_learnsets():
+    """
+    Compile every learnset in POKEMON_MOVES up front.
+
+    Returns:
+        dict: Pokémon name -> CompiledLearnset
+    """
+    for pokemon_name in POKEMON_MOVES:
+        get_compiled_learnset(pokemon_name)
+    return dict(_compiled)
+
+
+@register_invalidation_hook
+def clear_compiled_learnsets():
+    """Drop compiled learnsets so they are rebuilt from the current data."""
+    _compiled.clear()
+
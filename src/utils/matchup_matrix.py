@@ -0,0 +1,182 @@
+"""
+All-pairs matchup matrix for the Pokémon roster.
+This module computes the best-case offensive and defensive multipliers for
+every (attacker, defender) pair in one pass, without building per-pair
+analysis dictionaries or description strings.
+"""
+
+from array import array
+
+from ..data.pokemon_data import POKEMON_DATA
+from ..data.versioning import register_invalidation_hook
+from .type_matrix import encode_types
+from .defensive_profiles import get_defensive_profile_for_indices
+from .matrix_cache import load_or_build, read_matrix_file, write_matrix_file
+
+_FILE_MAGIC = b"PKMXv2\n"
+
+
+class MatchupMatrix:
+    """
+    Dense N×N matchup table over a list of Pokémon names.
+
+    offensive[i * N + j] is the best multiplier attacker i deals to defender j
+    (the 'offensive_multiplier' of analyze_matchup); defensive[i * N + j] is the
+    best multiplier defender j deals back to attacker i.
+    """
+
+    def __init__(self, names, offensive, defensive):
+        """
+        Initialize the matrix.
+
+        Args:
+            names (list): Pokémon names, in row/column order
+            offensive (array): Flat float array of size N*N
+            defensive (array): Flat float array of size N*N
+        """
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.offensive = offensive
+        self.defensive = defensive
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def offensive_multiplier(self, attacker, defender):
+        """Get the best multiplier attacker deals to defender."""
+        return self.offensive[self.index[attacker] * len(self.names) + self.index[defender]]
+
+    def defensive_multiplier(self, attacker, defender):
+        """Get the best multiplier defender deals back to attacker."""
+        return self.defensive[self.index[attacker] * len(self.names) + self.index[defender]]
+
+    def row(self, attacker):
+        """
+        Get one attacker's matchups against the whole roster.
+
+        Returns:
+            list: (defender, offensive_multiplier, defensive_multiplier) tuples
+        """
+        size = len(self.names)
+        start = self.index[attacker] * size
+        return [
+            (defender, self.offensive[start + j], self.defensive[start + j])
+            for j, defender in enumerate(self.names)
+        ]
+
+    def favorable_matchups(self, attacker):
+        """Get defenders the attacker hits super effectively while taking at most neutral damage."""
+        return [
+            defender for defender, offensive, defensive in self.row(attacker)
+            if offensive >= 2.0 and defensive <= 1.0
+        ]
+
+    def counters(self, defender):
+        """Get attackers that hit the defender super effectively and resist its best attack."""
+        size = len(self.names)
+        column = self.index[defender]
+        return [
+            attacker for i, attacker in enumerate(self.names)
+            if self.offensive[i * size + column] >= 2.0 and self.defensive[i * size + column] < 1.0
+        ]
+
+    def save(self, path, key=None):
+        """Write the matrix to a binary file, recording the data key (data_key() by default)."""
+        write_matrix_file(path, _FILE_MAGIC, self.names, [self.offensive, self.defensive], key)
+
+    @classmethod
+    def load(cls, path, key=None):
+        """Read a matrix previously written with save(), optionally requiring a data key."""
+        names, (offensive, defensive) = read_matrix_file(path, _FILE_MAGIC, 'ff', key)
+        return cls(names, offensive, defensive)
+
+
+def build_matchup_matrix(pokemon_data=None):
+    """
+    Compute offensive and defensive multipliers for every roster pair.
+
+    Species sharing a type combination share one row of work, so the cost
+    scales with the number of distinct typings rather than species.
+
+    Args:
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+
+    Returns:
+        MatchupMatrix: The all-pairs matrix
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+
+    names = [name for name, types in pokemon_data.items() if types]
+
+    # Group species by their (unordered) type combination
+    class_keys = []
+    class_of = {}
+    species_class = []
+    for name in names:
+        key = tuple(sorted(encode_types(pokemon_data[name])))
+        if key not in class_of:
+            class_of[key] = len(class_keys)
+            class_keys.append(key)
+        species_class.append(class_of[key])
+
+    # Best multiplier between every pair of distinct type combinations
+    class_multipliers = [get_defensive_profile_for_indices(key).multipliers for key in class_keys]
+    class_count = len(class_keys)
+    class_best = [[0.0] * class_count for _ in range(class_count)]
+    for a, attacking_key in enumerate(class_keys):
+        best_row = class_best[a]
+        for d in range(class_count):
+            multipliers = class_multipliers[d]
+            best = 0.0
+            for attacking_index in attacking_key:
+                if multipliers[attacking_index] > best:
+                    best = multipliers[attacking_index]
+            best_row[d] = best
+
+    size = len(names)
+    offensive = array('f', bytes(4 * size * size))
+    defensive = array('f', bytes(4 * size * size))
+    for i, attacker_class in enumerate(species_class):
+        attacking_row = class_best[attacker_class]
+        start = i * size
+        for j, defender_class in enumerate(species_class):
+            offensive[start + j] = attacking_row[defender_class]
+            defensive[start + j] = class_best[defender_class][attacker_class]
+
+    return MatchupMatrix(names, offensive, defensive)
+
+
+_roster_matrix = None
+
+
+def get_matchup_matrix(cache_path=None):
+    """
+    Get the roster-wide matchup matrix, building it on first use.
+
+    Args:
+        cache_path (str): Optional file to load the matrix from, or to write
+            it to after building; a file written for different data is
+            rebuilt
+
+    Returns:
+        MatchupMatrix: The matrix for POKEMON_DATA
+    """
+    global _roster_matrix
+
+    if _roster_matrix is None:
+        if cache_path is not None:
+            _roster_matrix = load_or_build(cache_path, MatchupMatrix.load, build_matchup_matrix)
+        else:
+            _roster_matrix = build_matchup_matrix()
+    return _roster_matrix
+
+
+@register_invalidation_hook
+def clear_matchup_matrix():
+    """Drop the cached roster matrix so it is rebuilt on next use."""
+    global _roster_matrix
+    _roster_matrix = None
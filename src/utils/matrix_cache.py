@@ -0,0 +1,115 @@
+"""
+Disk cache files for roster-wide matrices.
+A cache file holds a magic line, a JSON header and the matrix's flat arrays.
+The header records the species names, the byte order and a digest of the
+data the matrix was built from, so a file written before the data changed
+is rejected and rebuilt instead of silently reused.
+"""
+
+import json
+import sys
+from array import array
+
+from ..data.pokemon_data import POKEMON_DATA, TYPE_CHART
+from ..data.move_data import MOVE_DATA, POKEMON_MOVES
+from ..data.versioning import data_digest
+
+
+def data_key():
+    """
+    Identify the current static data.
+
+    Returns:
+        dict: A SHA-256 digest of POKEMON_DATA, MOVE_DATA, POKEMON_MOVES and
+        TYPE_CHART, which is the same in every process for the same data
+    """
+    return {'digest': data_digest(POKEMON_DATA, MOVE_DATA, POKEMON_MOVES, TYPE_CHART)}
+
+
+def write_matrix_file(path, magic, names, arrays, key=None):
+    """
+    Write flat matrix arrays to a cache file.
+
+    Args:
+        path (str): File to write
+        magic (bytes): File type marker
+        names (list): Pokémon names, in row/column order
+        arrays (list): Flat arrays of size N*N
+        key (dict): Data key to record (defaults to data_key())
+    """
+    header = dict(key or data_key(), names=names, byteorder=sys.byteorder)
+    encoded = json.dumps(header).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(magic)
+        f.write(len(encoded).to_bytes(4, 'little'))
+        f.write(encoded)
+        for values in arrays:
+            values.tofile(f)
+
+
+def read_matrix_file(path, magic, typecodes, key=None):
+    """
+    Read flat matrix arrays from a cache file.
+
+    Args:
+        path (str): File to read
+        magic (bytes): Expected file type marker
+        typecodes (str): Array type code of each stored array, in order
+        key (dict): Data key the file must match (None to accept any data)
+
+    Returns:
+        tuple: (names, list of arrays)
+
+    Raises:
+        ValueError: If the file is of another type, is truncated or was
+            written for different data
+    """
+    with open(path, 'rb') as f:
+        if f.read(len(magic)) != magic:
+            raise ValueError(f"{path} is not a {magic!r} matrix file")
+        header_size = int.from_bytes(f.read(4), 'little')
+        try:
+            header = json.loads(f.read(header_size).decode('utf-8'))
+            names = header['names']
+            byteorder = header['byteorder']
+        except (UnicodeDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"{path} has a damaged header") from e
+        if key is not None and any(header.get(field) != value for field, value in key.items()):
+            raise ValueError(f"{path} was written for different data")
+
+        arrays = []
+        for typecode in typecodes:
+            values = array(typecode)
+            try:
+                values.fromfile(f, len(names) ** 2)
+            except EOFError as e:
+                raise ValueError(f"{path} is truncated") from e
+            if byteorder != sys.byteorder:
+                values.byteswap()
+            arrays.append(values)
+    return names, arrays
+
+
+def load_or_build(cache_path, load, build):
+    """
+    Load a matrix from a cache file, or build it and write the file.
+
+    The file is rebuilt when it is missing, unreadable, truncated or was
+    written for different data.
+
+    Args:
+        cache_path (str): Cache file
+        load (callable): load(path, key) reading a matrix written for key
+        build (callable): build() computing the matrix
+
+    Returns:
+        The matrix
+    """
+    key = data_key()
+    try:
+        return load(cache_path, key)
+    except (OSError, EOFError, ValueError):
+        pass
+    matrix = build()
+    matrix.save(cache_path, key)
+    return matrix
@@ -3,11 +3,17 @@ Move recommendation system for Pokémon battles.
 This module provides intelligent move suggestions based on type effectiveness.
 """
 
+import heapq
+from functools import partial
+
 from ..data.pokemon_data import TYPE_CHART
-from ..data.move_data import get_moves_for_pokemon, get_move_info, MOVE_DATA
+from .defensive_profiles import defensive_multiplier, get_defensive_profile
+from .learnset_store import get_compiled_learnset
+from .type_masks import type_mask, popcount
+from .lazy_results import LazyRecord
 
 
-def recommend_moves(attacking_pokemon, defending_pokemon, pokemon_data):
+def recommend_moves(attacking_pokemon, defending_pokemon, pokemon_data, top_k=4, include_all_moves=True):
     """
     Recommend the best moves for a Pokémon to use against an opponent.
     
@@ -15,9 +21,14 @@ def recommend_moves(attacking_pokemon, defending_pokemon, pokemon_data):
         attacking_pokemon (str): Name of the attacking Pokémon
         defending_pokemon (str): Name of the defending Pokémon
         pokemon_data (dict): Dictionary containing Pokémon type data
+        top_k (int): Number of moves to return in 'recommendations'
+        include_all_moves (bool): Whether to build the full sorted 'all_moves'
+            list; when False, only the top-k move records are created
         
     Returns:
-        dict: Dictionary containing move recommendations and analysis
+        dict: Dictionary containing move recommendations and analysis. The
+        'strategy_tips' list and each move's 'recommendation' text are
+        rendered only when first read.
     """
     attacking_types = pokemon_data.get(attacking_pokemon, [])
     defending_types = pokemon_data.get(defending_pokemon, [])
@@ -25,10 +36,10 @@ def recommend_moves(attacking_pokemon, defending_pokemon, pokemon_data):
     if not attacking_types or not defending_types:
         return None
     
-    # Get available moves for the attacking Pokémon
-    available_moves = get_moves_for_pokemon(attacking_pokemon)
+    # Get the compiled move arrays for the attacking Pokémon
+    learnset = get_compiled_learnset(attacking_pokemon)
     
-    if not available_moves:
+    if not learnset.total_moves:
         return {
             'pokemon': attacking_pokemon,
             'opponent': defending_pokemon,
@@ -36,54 +47,108 @@ def recommend_moves(attacking_pokemon, defending_pokemon, pokemon_data):
             'message': f"No move data available for {attacking_pokemon}"
         }
     
-    # Analyze each move
-    move_analysis = []
-    for move_name in available_moves:
-        move_info = get_move_info(move_name)
-        if move_info:
-            move_type, power, accuracy, pp, category, description = move_info
-            effectiveness = calculate_move_effectiveness(move_type, defending_types)
-            
-            # Calculate move score (effectiveness * power * accuracy)
-            move_score = effectiveness * power * (accuracy / 100)
-            
-            move_analysis.append({
-                'name': move_name,
-                'type': move_type,
-                'power': power,
-                'accuracy': accuracy,
-                'category': category,
-                'description': description,
-                'effectiveness': effectiveness,
-                'score': move_score,
-                'recommendation': get_move_recommendation(effectiveness, move_type, defending_pokemon)
-            })
-    
-    # Sort moves by score (best first)
-    move_analysis.sort(key=lambda x: x['score'], reverse=True)
-    
-    # Get top recommendations
-    top_moves = move_analysis[:4]  # Top 4 moves
-    
-    # Generate strategy tips
-    strategy_tips = generate_strategy_tips(move_analysis, attacking_pokemon, defending_pokemon)
+    # Score every move in one pass, keeping a bounded heap of the best ones
+    # and the aggregates the strategy tips need
+    scored_moves = []
+    heap = []
+    best_super_effective = None
+    best_super_effective_score = -1.0
+    super_effective_count = weak_count = immune_count = high_risk_count = 0
+    defending_multipliers = get_defensive_profile(defending_types).multipliers
+    powers = learnset.powers
+    accuracies = learnset.accuracies
+    for position, type_index in enumerate(learnset.type_indices):
+        power = powers[position]
+        accuracy = accuracies[position]
+        effectiveness = defending_multipliers[type_index] if type_index >= 0 else 1.0
+        
+        # Calculate move score (effectiveness * power * accuracy)
+        move_score = effectiveness * power * (accuracy / 100)
+        
+        # (score, -position) is unique, so entries never compare past it
+        entry = (move_score, -position, position, effectiveness)
+        if include_all_moves:
+            scored_moves.append(entry)
+        elif len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif top_k > 0 and entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+        
+        if effectiveness > 1.0:
+            super_effective_count += 1
+            if move_score > best_super_effective_score:
+                best_super_effective = position
+                best_super_effective_score = move_score
+        elif effectiveness < 1.0:
+            weak_count += 1
+            if effectiveness == 0.0:
+                immune_count += 1
+        if power >= 100 and accuracy < 85:
+            high_risk_count += 1
     
-    return {
-        'pokemon': attacking_pokemon,
-        'opponent': defending_pokemon,
-        'recommendations': top_moves,
-        'all_moves': move_analysis,
-        'strategy_tips': strategy_tips,
-        'best_move': top_moves[0] if top_moves else None
+    if best_super_effective is not None:
+        best_super_effective = (
+            learnset.move_names[best_super_effective],
+            learnset.move_info[best_super_effective][0],
+            powers[best_super_effective],
+            accuracies[best_super_effective]
+        )
+    
+    summary = {
+        'best_super_effective': best_super_effective,
+        'super_effective_count': super_effective_count,
+        'weak_count': weak_count,
+        'immune_count': immune_count,
+        'move_type_mask': learnset.type_mask,
+        'high_risk_count': high_risk_count
     }
+    
+    # Best first; ties keep learnset order like a stable sort would
+    if include_all_moves:
+        scored_moves.sort(reverse=True)
+        move_analysis = [_make_move_record(learnset, entry, defending_pokemon) for entry in scored_moves]
+        top_moves = move_analysis[:top_k]
+    else:
+        heap.sort(reverse=True)
+        move_analysis = None
+        top_moves = [_make_move_record(learnset, entry, defending_pokemon) for entry in heap]
+    
+    # Strategy tips are only generated if a caller reads them
+    return LazyRecord(
+        {
+            'pokemon': attacking_pokemon,
+            'opponent': defending_pokemon,
+            'recommendations': top_moves,
+            'all_moves': move_analysis,
+            'best_move': top_moves[0] if top_moves else None,
+            'move_summary': summary
+        },
+        {'strategy_tips': partial(_build_strategy_tips, summary, attacking_pokemon)}
+    )
+
+
+def _make_move_record(learnset, entry, defending_pokemon):
+    """Build the result record for one scored move."""
+    move_score, _, position, effectiveness = entry
+    move_type, power, accuracy, pp, category, description = learnset.move_info[position]
+    return LazyRecord(
+        {
+            'name': learnset.move_names[position],
+            'type': move_type,
+            'power': power,
+            'accuracy': accuracy,
+            'category': category,
+            'description': description,
+            'effectiveness': effectiveness,
+            'score': move_score
+        },
+        {'recommendation': partial(get_move_recommendation, effectiveness, move_type, defending_pokemon)}
+    )
 
 
 def calculate_move_effectiveness(move_type, defending_types):
     """Calculate the effectiveness of a move against defending types."""
-    effectiveness = 1.0
-    for defending_type in defending_types:
-        effectiveness *= TYPE_CHART.get(move_type, {}).get(defending_type, 1.0)
-    return effectiveness
+    return defensive_multiplier(move_type, defending_types)
 
 
 def get_move_recommendation(effectiveness, move_type, defending_pokemon):
@@ -100,35 +165,49 @@ def get_move_recommendation(effectiveness, move_type, defending_pokemon):
 
 def generate_strategy_tips(move_analysis, attacking_pokemon, defending_pokemon):
     """Generate strategic advice for the matchup."""
-    tips = []
-    
-    # Find best and worst moves
     best_moves = [move for move in move_analysis if move['effectiveness'] > 1.0]
-    weak_moves = [move for move in move_analysis if move['effectiveness'] < 1.0]
-    useless_moves = [move for move in move_analysis if move['effectiveness'] == 0.0]
+    best_move = max(best_moves, key=lambda move: move['score']) if best_moves else None
     
-    if best_moves:
-        best_move = best_moves[0]
-        tips.append(f"🎯 BEST CHOICE: Use {best_move['name']} ({best_move['type']}) - "
-                   f"{best_move['power']} power, {best_move['accuracy']}% accuracy")
+    summary = {
+        'best_super_effective': (
+            (best_move['name'], best_move['type'], best_move['power'], best_move['accuracy'])
+            if best_move else None
+        ),
+        'super_effective_count': len(best_moves),
+        'weak_count': sum(1 for move in move_analysis if move['effectiveness'] < 1.0),
+        'immune_count': sum(1 for move in move_analysis if move['effectiveness'] == 0.0),
+        'move_type_mask': type_mask(move['type'] for move in move_analysis),
+        'high_risk_count': sum(1 for move in move_analysis if move['power'] >= 100 and move['accuracy'] < 85)
+    }
+    return _build_strategy_tips(summary, attacking_pokemon)
+
+
+def _build_strategy_tips(summary, attacking_pokemon):
+    """Render strategy tips from the aggregates of a single scoring pass."""
+    tips = []
+    
+    best_move = summary['best_super_effective']
+    if best_move:
+        name, move_type, power, accuracy = best_move
+        tips.append(f"🎯 BEST CHOICE: Use {name} ({move_type}) - "
+                   f"{power} power, {accuracy}% accuracy")
     
-    if len(best_moves) > 1:
-        tips.append(f"💪 BACKUP OPTIONS: You have {len(best_moves)} super-effective moves available")
+    if summary['super_effective_count'] > 1:
+        tips.append(f"💪 BACKUP OPTIONS: You have {summary['super_effective_count']} super-effective moves available")
     
-    if weak_moves:
-        tips.append(f"⚠️ AVOID: {len(weak_moves)} moves are not very effective")
+    if summary['weak_count']:
+        tips.append(f"⚠️ AVOID: {summary['weak_count']} moves are not very effective")
     
-    if useless_moves:
-        tips.append(f"❌ USELESS: {len(useless_moves)} moves have no effect - don't use them!")
+    if summary['immune_count']:
+        tips.append(f"❌ USELESS: {summary['immune_count']} moves have no effect - don't use them!")
     
     # Type coverage advice
-    move_types = set(move['type'] for move in move_analysis)
-    if len(move_types) >= 3:
-        tips.append(f"🌈 GOOD COVERAGE: Your {attacking_pokemon} has {len(move_types)} different move types")
+    move_type_count = popcount(summary['move_type_mask'])
+    if move_type_count >= 3:
+        tips.append(f"🌈 GOOD COVERAGE: Your {attacking_pokemon} has {move_type_count} different move types")
     
     # Accuracy vs Power trade-off
-    high_power_low_acc = [move for move in move_analysis if move['power'] >= 100 and move['accuracy'] < 85]
-    if high_power_low_acc:
+    if summary['high_risk_count']:
         tips.append("🎲 HIGH RISK: Consider accuracy vs power trade-offs for maximum damage moves")
     
     return tips
@@ -153,17 +232,21 @@ def get_counter_moves(defending_pokemon, pokemon_data):
     for move_type in TYPE_CHART.keys():
         effectiveness = calculate_move_effectiveness(move_type, defending_types)
         if effectiveness > 1.0:
-            effective_moves.append({
-                'type': move_type,
-                'effectiveness': effectiveness,
-                'description': f"{move_type} moves are {effectiveness:.1f}x effective"
-            })
+            effective_moves.append(LazyRecord(
+                {'type': move_type, 'effectiveness': effectiveness},
+                {'description': partial(_get_counter_description, move_type, effectiveness)}
+            ))
     
     # Sort by effectiveness
     effective_moves.sort(key=lambda x: x['effectiveness'], reverse=True)
     return effective_moves
 
 
+def _get_counter_description(move_type, effectiveness):
+    """Generate description for a counter move type."""
+    return f"{move_type} moves are {effectiveness:.1f}x effective"
+
+
 def analyze_move_coverage(pokemon_name, pokemon_data):
     """
     Analyze the type coverage of a Pokémon's moves.
@@ -175,34 +258,19 @@ def analyze_move_coverage(pokemon_name, pokemon_data):
     Returns:
         dict: Analysis of the Pokémon's move coverage
     """
-    available_moves = get_moves_for_pokemon(pokemon_name)
-    if not available_moves:
+    learnset = get_compiled_learnset(pokemon_name)
+    if not learnset.total_moves:
         return {'coverage': 'No move data available'}
     
-    move_types = set()
-    physical_moves = 0
-    special_moves = 0
-    status_moves = 0
-    
-    for move_name in available_moves:
-        move_info = get_move_info(move_name)
-        if move_info:
-            move_type, power, accuracy, pp, category, description = move_info
-            move_types.add(move_type)
-            
-            if category == "Physical":
-                physical_moves += 1
-            elif category == "Special":
-                special_moves += 1
-            elif category == "Status":
-                status_moves += 1
+    move_types = learnset.move_types
+    physical_moves, special_moves, status_moves = learnset.category_counts()
     
     coverage_score = len(move_types)
     coverage_quality = "Excellent" if coverage_score >= 4 else "Good" if coverage_score >= 3 else "Limited"
     
     return {
         'pokemon': pokemon_name,
-        'total_moves': len(available_moves),
+        'total_moves': learnset.total_moves,
         'unique_types': len(move_types),
         'move_types': list(move_types),
         'physical_moves': physical_moves,
@@ -0,0 +1,374 @@
+"""
+Search-based move choice for 1v1 battles.
+This module looks ahead over both sides' moves with expectiminimax: our
+move is a max node, the opponent's reply a min node, and accuracy checks
+and damage rolls are chance nodes. Alpha-beta pruning (Star1 at chance
+nodes), a transposition table keyed on the packed HP pair and iterative
+deepening keep the search within a per-call time budget.
+"""
+
+import time
+from collections import namedtuple
+
+from ..data.pokemon_data import POKEMON_DATA
+from .battle_simulator import compile_attacker
+from .damage_calculator import DEFAULT_LEVEL, species_stats
+
+# Outcome values: a win is 1, a loss -1; unfinished battles score the HP
+# fraction difference, which stays strictly between the two
+WIN, LOSS = 1.0, -1.0
+
+# Transposition table bound types
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Deadline is checked every this many nodes
+_CLOCK_INTERVAL = 32
+
+SearchResult = namedtuple(
+    'SearchResult',
+    ['pokemon', 'opponent', 'move', 'value', 'move_values', 'depth', 'nodes', 'elapsed']
+)
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget runs out."""
+
+
+class MoveSearch:
+    """
+    Expectiminimax over one matchup.
+
+    A node is the pair of remaining HP values with a number of turns left.
+    Each turn we pick a move, the opponent picks a reply knowing it, then
+    chance decides turn order on a speed tie, each attack's hit or miss and
+    its damage roll. The 16 damage rolls are merged into `roll_buckets`
+    equally likely outcomes to keep the branching factor small.
+    """
+
+    def __init__(self, side_a, side_b, roll_buckets=4):
+        """
+        Initialize the search.
+
+        Args:
+            side_a (CompiledAttacker): Our side, compiled against the opponent
+            side_b (CompiledAttacker): The opponent, compiled against us
+            roll_buckets (int): Damage outcomes per hit (a divisor of 16)
+        """
+        if 16 % roll_buckets:
+            raise ValueError("roll_buckets must divide 16")
+        self.side_a = side_a
+        self.side_b = side_b
+        self.max_hp_a = side_a.hp
+        self.max_hp_b = side_b.hp
+        self.damage_a = [self._bucket(rolls, roll_buckets) for rolls in side_a.rolls]
+        self.damage_b = [self._bucket(rolls, roll_buckets) for rolls in side_b.rolls]
+        self.accuracy_a = [a / 100 for a in side_a.accuracies]
+        self.accuracy_b = [a / 100 for a in side_b.accuracies]
+
+        # Moves in expected-damage order, so good moves are searched first
+        self.moves_a = list(side_a.by_expected) or [-1]
+        self.moves_b = list(side_b.by_expected) or [-1]
+        if side_a.speed > side_b.speed:
+            self.orders = ((1.0, True),)
+        elif side_a.speed < side_b.speed:
+            self.orders = ((1.0, False),)
+        else:
+            self.orders = ((0.5, True), (0.5, False))
+
+        self.table = {}
+        # (move_a, move_b, hp_a, hp_b) -> turn outcomes, shared across depths
+        self._outcome_cache = {}
+        self._hit_cache = {}
+        # Same key -> expected value of the turn's outcomes at the horizon
+        self._horizon_cache = {}
+        self.nodes = 0
+        self.deadline = None
+
+    @staticmethod
+    def _bucket(rolls, buckets):
+        """Merge the 16 rolls into equally likely representative damages."""
+        size = len(rolls) // buckets
+        return tuple(rolls[i * size + size // 2] for i in range(buckets))
+
+    def evaluate(self, hp_a, hp_b):
+        """Score a position by the remaining HP fractions."""
+        return 0.5 * (hp_a / self.max_hp_a - hp_b / self.max_hp_b)
+
+    def _hits(self, side, move, hp):
+        """Enumerate (probability, remaining HP) after one attack by side 0 (us) or 1."""
+        key = (side, move, hp)
+        hits = self._hit_cache.get(key)
+        if hits is not None:
+            return hits
+        if move < 0:
+            hits = ((1.0, hp),)
+        else:
+            hit = (self.accuracy_a, self.accuracy_b)[side][move]
+            rolls = (self.damage_a, self.damage_b)[side][move]
+            share = hit / len(rolls)
+            outcomes = {}
+            for roll in rolls:
+                left = max(hp - roll, 0)
+                outcomes[left] = outcomes.get(left, 0.0) + share
+            if hit < 1.0:
+                outcomes[hp] = outcomes.get(hp, 0.0) + 1.0 - hit
+            hits = tuple((probability, left) for left, probability in outcomes.items())
+        self._hit_cache[key] = hits
+        return hits
+
+    def _outcomes(self, move_a, move_b, hp_a, hp_b):
+        """
+        Enumerate the chance outcomes of one turn.
+
+        Returns:
+            list: (probability, hp_a, hp_b) triples, most likely first, with
+            identical HP pairs merged
+        """
+        key = (move_a, move_b, hp_a, hp_b)
+        outcomes = self._outcome_cache.get(key)
+        if outcomes is not None:
+            return outcomes
+
+        merged = {}
+        for order_probability, a_first in self.orders:
+            if a_first:
+                for p1, new_b in self._hits(0, move_a, hp_b):
+                    if new_b == 0:
+                        pair = (hp_a, 0)
+                        merged[pair] = merged.get(pair, 0.0) + order_probability * p1
+                        continue
+                    for p2, new_a in self._hits(1, move_b, hp_a):
+                        pair = (new_a, new_b)
+                        merged[pair] = merged.get(pair, 0.0) + order_probability * p1 * p2
+            else:
+                for p1, new_a in self._hits(1, move_b, hp_a):
+                    if new_a == 0:
+                        pair = (0, hp_b)
+                        merged[pair] = merged.get(pair, 0.0) + order_probability * p1
+                        continue
+                    for p2, new_b in self._hits(0, move_a, hp_b):
+                        pair = (new_a, new_b)
+                        merged[pair] = merged.get(pair, 0.0) + order_probability * p1 * p2
+        outcomes = [(probability, a, b) for (a, b), probability in merged.items()]
+        outcomes.sort(reverse=True)
+        self._outcome_cache[key] = outcomes
+        return outcomes
+
+    def _tick(self):
+        """Count a node and stop the search once the deadline has passed."""
+        self.nodes += 1
+        if self.deadline is not None and not self.nodes % _CLOCK_INTERVAL and time.perf_counter() > self.deadline:
+            raise _SearchTimeout()
+
+    def _max_node(self, hp_a, hp_b, depth, alpha, beta):
+        """Value of a position with `depth` turns left, our move to pick."""
+        if hp_b <= 0:
+            return WIN
+        if hp_a <= 0:
+            return LOSS
+        if depth == 0:
+            return self.evaluate(hp_a, hp_b)
+
+        # The HP pair packs into one int; depth and bound type ride along
+        key = hp_a * (self.max_hp_b + 1) + hp_b
+        entry = self.table.get(key)
+        first_move = None
+        if entry is not None:
+            entry_depth, entry_value, entry_bound, first_move = entry
+            if entry_depth >= depth:
+                if entry_bound == EXACT:
+                    return entry_value
+                if entry_bound == LOWER and entry_value >= beta:
+                    return entry_value
+                if entry_bound == UPPER and entry_value <= alpha:
+                    return entry_value
+
+        moves = self.moves_a
+        if first_move is not None and first_move in moves:
+            moves = [first_move] + [move for move in moves if move != first_move]
+
+        original_alpha = alpha
+        best_value = LOSS - 1.0
+        best_move = moves[0]
+        for move in moves:
+            value = self._min_node(move, hp_a, hp_b, depth, alpha, beta)
+            if value > best_value:
+                best_value = value
+                best_move = move
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+
+        if best_value <= original_alpha:
+            bound = UPPER
+        elif best_value >= beta:
+            bound = LOWER
+        else:
+            bound = EXACT
+        self.table[key] = (depth, best_value, bound, best_move)
+        return best_value
+
+    def _min_node(self, move_a, hp_a, hp_b, depth, alpha, beta):
+        """Value after our move, with the opponent's reply to pick."""
+        best_value = WIN + 1.0
+        for move_b in self.moves_b:
+            value = self._chance_node(move_a, move_b, hp_a, hp_b, depth, alpha, beta)
+            if value < best_value:
+                best_value = value
+            if value < beta:
+                beta = value
+            if alpha >= beta:
+                break
+        return best_value
+
+    def _chance_node(self, move_a, move_b, hp_a, hp_b, depth, alpha, beta):
+        """
+        Expected value over one turn's random outcomes.
+
+        Star1 pruning: since every value lies in [LOSS, WIN], the outcomes
+        not yet searched bound the expectation, so the search stops as soon
+        as it can't end up inside (alpha, beta), and each child gets the
+        narrowest window that could still change that.
+        """
+        self._tick()
+        if depth == 1:
+            return self._horizon_value(move_a, move_b, hp_a, hp_b)
+
+        searched = 0.0
+        remaining = 1.0
+        for probability, new_a, new_b in self._outcomes(move_a, move_b, hp_a, hp_b):
+            rest = remaining - probability
+            child_alpha = max(LOSS, (alpha - searched - rest * WIN) / probability)
+            child_beta = min(WIN, (beta - searched - rest * LOSS) / probability)
+            value = self._max_node(new_a, new_b, depth - 1, child_alpha, child_beta)
+            searched += probability * value
+            remaining = rest
+            if searched + remaining * WIN <= alpha:
+                return searched + remaining * WIN
+            if searched + remaining * LOSS >= beta:
+                return searched + remaining * LOSS
+        return searched
+
+    def _horizon_value(self, move_a, move_b, hp_a, hp_b):
+        """Expected value of the last searched turn, scoring its outcomes directly."""
+        key = (move_a, move_b, hp_a, hp_b)
+        value = self._horizon_cache.get(key)
+        if value is None:
+            value = 0.0
+            for probability, new_a, new_b in self._outcomes(move_a, move_b, hp_a, hp_b):
+                if new_b <= 0:
+                    value += probability * WIN
+                elif new_a <= 0:
+                    value += probability * LOSS
+                else:
+                    value += probability * self.evaluate(new_a, new_b)
+            self._horizon_cache[key] = value
+        return value
+
+    def root_values(self, hp_a, hp_b, depth):
+        """
+        Value every move of ours at the root with a full window.
+
+        Returns:
+            list: (move position, value) pairs, best first
+        """
+        values = []
+        entry = self.table.get(hp_a * (self.max_hp_b + 1) + hp_b)
+        moves = self.moves_a
+        if entry is not None and entry[3] in moves:
+            moves = [entry[3]] + [move for move in moves if move != entry[3]]
+        for move in moves:
+            # Each root move gets an exact value so alternatives can be ranked
+            values.append((move, self._min_node(move, hp_a, hp_b, depth, LOSS, WIN)))
+        values.sort(key=lambda pair: pair[1], reverse=True)
+        best_move, best_value = values[0]
+        self.table[hp_a * (self.max_hp_b + 1) + hp_b] = (depth, best_value, EXACT, best_move)
+        return values
+
+    def search(self, hp_a=None, hp_b=None, time_budget=0.15, max_depth=10):
+        """
+        Iteratively deepen until the time budget or max_depth is reached.
+
+        Args:
+            hp_a (int): Our remaining HP (defaults to full)
+            hp_b (int): Opponent's remaining HP (defaults to full)
+            time_budget (float): Seconds to search (None for no limit)
+            max_depth (int): Maximum number of turns to look ahead
+
+        Returns:
+            tuple: ((move, value) pairs from the deepest finished iteration, depth)
+        """
+        hp_a = self.max_hp_a if hp_a is None else hp_a
+        hp_b = self.max_hp_b if hp_b is None else hp_b
+        started = time.perf_counter()
+        self.deadline = None if time_budget is None else started + time_budget
+        self.nodes = 0
+
+        # Depth 1 always finishes so there is an answer however small the budget
+        deadline, self.deadline = self.deadline, None
+        values = self.root_values(hp_a, hp_b, 1)
+        self.deadline = deadline
+        reached = 1
+        for depth in range(2, max_depth + 1):
+            try:
+                values = self.root_values(hp_a, hp_b, depth)
+            except _SearchTimeout:
+                break
+            reached = depth
+        return values, reached
+
+
+def search_best_move(attacking_pokemon, defending_pokemon, pokemon_data=None, time_budget=0.15,
+                     max_depth=10, attacker_hp=None, defender_hp=None, level=DEFAULT_LEVEL,
+                     attacker_stats=None, defender_stats=None, roll_buckets=4):
+    """
+    Pick the move with the best expected outcome, looking ahead at replies.
+
+    Args:
+        attacking_pokemon (str): Name of the Pokémon choosing a move
+        defending_pokemon (str): Name of the opponent
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+        time_budget (float): Seconds to search (None for no limit)
+        max_depth (int): Maximum number of turns to look ahead
+        attacker_hp (int): Attacker's remaining HP (defaults to full)
+        defender_hp (int): Defender's remaining HP (defaults to full)
+        level (int): Level of both Pokémon
+        attacker_stats (Stats): Attacker's stats (defaults to species_stats())
+        defender_stats (Stats): Defender's stats (defaults to species_stats())
+        roll_buckets (int): Damage outcomes per hit (a divisor of 16)
+
+    Returns:
+        SearchResult: The best move (None if the attacker has no damaging
+        moves), its value in [-1, 1] (1 is a sure win), every move's value,
+        the depth reached and the nodes searched; or None if a Pokémon is
+        unknown
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+    if not pokemon_data.get(attacking_pokemon) or not pokemon_data.get(defending_pokemon):
+        return None
+
+    attacker_stats = attacker_stats or species_stats(attacking_pokemon, level)
+    defender_stats = defender_stats or species_stats(defending_pokemon, level)
+    side_a = compile_attacker(attacking_pokemon, defending_pokemon, pokemon_data, level,
+                              attacker_stats, defender_stats)
+    side_b = compile_attacker(defending_pokemon, attacking_pokemon, pokemon_data, level,
+                              defender_stats, attacker_stats)
+
+    started = time.perf_counter()
+    search = MoveSearch(side_a, side_b, roll_buckets)
+    values, depth = search.search(attacker_hp, defender_hp, time_budget, max_depth)
+    elapsed = time.perf_counter() - started
+
+    move_values = [(side_a.move_names[move], value) for move, value in values if move >= 0]
+    return SearchResult(
+        pokemon=attacking_pokemon,
+        opponent=defending_pokemon,
+        move=move_values[0][0] if move_values else None,
+        value=values[0][1],
+        move_values=move_values,
+        depth=depth,
+        nodes=search.nodes,
+        elapsed=elapsed
+    )
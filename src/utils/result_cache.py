@@ -0,0 +1,197 @@
+"""
+Memoized matchup, move recommendation and move coverage results.
+This module caches analyze_matchup and recommend_moves results per
+(attacker, defender, data version) in a bounded LRU cache, and move coverage
+profiles per species. Cached results are frozen (read-only mappings and
+tuples), so sharing them is safe.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+
+from ..data.pokemon_data import POKEMON_DATA
+from ..data.move_data import POKEMON_MOVES
+from ..data.versioning import get_data_version, register_invalidation_hook
+from .type_calculator import analyze_matchup
+from .move_recommender import recommend_moves, analyze_move_coverage
+from .lazy_results import LazyRecord
+
+DEFAULT_MAX_SIZE = 1024
+
+
+class LRUCache:
+    """Bounded least-recently-used cache with hit/miss counters."""
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, compute):
+        """
+        Get the value for key, computing and storing it on a miss.
+
+        Args:
+            key: Hashable cache key
+            compute (callable): Function taking no arguments that builds the value
+
+        Returns:
+            The cached or newly computed value
+        """
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return entries[key]
+
+        self.misses += 1
+        value = compute()
+        entries[key] = value
+        while len(entries) > self.max_size:
+            entries.popitem(last=False)
+        return value
+
+    def resize(self, max_size):
+        """Change the maximum size, evicting the oldest entries if needed."""
+        self.max_size = max_size
+        while len(self._entries) > max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries (hit/miss counters are kept)."""
+        self._entries.clear()
+
+    def info(self):
+        """Get cache statistics."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'max_size': self.max_size
+        }
+
+
+def freeze(value):
+    """
+    Recursively convert a result into an immutable structure.
+
+    Dicts become read-only mappings and lists become tuples. Lazy records
+    stay lazy behind the read-only mapping; their values are frozen as they
+    are rendered.
+    """
+    if isinstance(value, LazyRecord):
+        return MappingProxyType(value.frozen(freeze))
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value):
+    """
+    Recursively copy a frozen result back into plain dicts and lists.
+
+    Use this when a cached result is stored somewhere that may edit or
+    serialize it, so the shared frozen value stays inside the cache.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    return value
+
+
+_matchup_cache = LRUCache()
+_move_cache = LRUCache()
+
+# Coverage depends only on a species' static move list, so it is kept for
+# every species that has been looked up (bounded by the roster size)
+_coverage_cache = {}
+
+
+def cached_analyze_matchup(your_pokemon_name, opponent_pokemon_name):
+    """
+    Memoized analyze_matchup against POKEMON_DATA.
+
+    Returns:
+        Mapping: Frozen analysis result, or None if either Pokémon is unknown
+    """
+    key = (your_pokemon_name, opponent_pokemon_name, get_data_version())
+    return _matchup_cache.get(
+        key,
+        lambda: freeze(analyze_matchup(your_pokemon_name, opponent_pokemon_name, POKEMON_DATA))
+    )
+
+
+def cached_recommend_moves(attacking_pokemon, defending_pokemon):
+    """
+    Memoized recommend_moves against POKEMON_DATA.
+
+    Returns:
+        Mapping: Frozen recommendation result, or None if either Pokémon is unknown
+    """
+    key = (attacking_pokemon, defending_pokemon, get_data_version())
+    return _move_cache.get(
+        key,
+        lambda: freeze(recommend_moves(attacking_pokemon, defending_pokemon, POKEMON_DATA))
+    )
+
+
+def get_move_coverage(pokemon_name):
+    """
+    Memoized analyze_move_coverage for one species.
+
+    Returns:
+        Mapping: Frozen coverage profile
+    """
+    coverage = _coverage_cache.get(pokemon_name)
+    if coverage is None:
+        coverage = freeze(analyze_move_coverage(pokemon_name, POKEMON_DATA))
+        _coverage_cache[pokemon_name] = coverage
+    return coverage
+
+
+def precompute_move_coverage():
+    """Build coverage profiles for every species in POKEMON_MOVES up front."""
+    for pokemon_name in POKEMON_MOVES:
+        get_move_coverage(pokemon_name)
+
+
+def configure_result_cache(max_size):
+    """Set the maximum number of entries kept by each result cache."""
+    _matchup_cache.resize(max_size)
+    _move_cache.resize(max_size)
+
+
+@register_invalidation_hook
+def clear_result_cache():
+    """Drop every cached result (runs automatically when the data changes)."""
+    _matchup_cache.clear()
+    _move_cache.clear()
+    _coverage_cache.clear()
+
+
+def result_cache_info():
+    """
+    Get hit/miss statistics for the result caches.
+
+    Returns:
+        dict: Statistics for the 'matchup' and 'moves' caches
+    """
+    return {
+        'matchup': _matchup_cache.info(),
+        'moves': _move_cache.info(),
+        'coverage': {'size': len(_coverage_cache)}
+    }
@@ -0,0 +1,160 @@
+"""
+All-pairs synergy matrix for the Pokémon roster.
+This module computes the pair synergy score used by team analysis for every
+ordered pair of species once, so team analysis and team search index into a
+table instead of recomputing type interactions and move coverage per pair.
+"""
+
+from array import array
+
+from ..data.pokemon_data import POKEMON_DATA
+from ..data.versioning import register_invalidation_hook
+from .learnset_store import get_compiled_learnset
+from .matrix_cache import load_or_build, read_matrix_file, write_matrix_file
+from .type_masks import type_mask, popcount
+from .team_metrics import type_mask_pair_synergy
+
+_FILE_MAGIC = b"PKSYv2\n"
+
+
+class SynergyMatrix:
+    """
+    Dense N×N pair synergy table over a list of Pokémon names.
+
+    values[i * N + j] is calculate_pair_synergy of species i with species j.
+    The score is directional (it counts the types of i that species j
+    resists), so values[i * N + j] and values[j * N + i] can differ.
+    """
+
+    def __init__(self, names, values):
+        """
+        Initialize the matrix.
+
+        Args:
+            names (list): Pokémon names, in row/column order
+            values (array): Flat double array of size N*N
+        """
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.values = values
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def synergy(self, pokemon1, pokemon2):
+        """Get the synergy score of pokemon1 with pokemon2."""
+        return self.values[self.index[pokemon1] * len(self.names) + self.index[pokemon2]]
+
+    def row(self, pokemon):
+        """
+        Get one Pokémon's synergy with the whole roster.
+
+        Returns:
+            array: Synergy scores in name order
+        """
+        size = len(self.names)
+        start = self.index[pokemon] * size
+        return self.values[start:start + size]
+
+    def save(self, path, key=None):
+        """Write the matrix to a binary file, recording the data key (data_key() by default)."""
+        write_matrix_file(path, _FILE_MAGIC, self.names, [self.values], key)
+
+    @classmethod
+    def load(cls, path, key=None):
+        """Read a matrix previously written with save(), optionally requiring a data key."""
+        names, (values,) = read_matrix_file(path, _FILE_MAGIC, 'd', key)
+        return cls(names, values)
+
+
+def build_synergy_matrix(pokemon_data=None):
+    """
+    Compute the pair synergy of every ordered roster pair.
+
+    The type part of the score only depends on the two type combinations
+    and the move part only on the two move-type masks, so each is computed
+    once per distinct combination and species rows are copied from their
+    class's row.
+
+    Args:
+        pokemon_data (dict): Pokémon type data (defaults to POKEMON_DATA)
+
+    Returns:
+        SynergyMatrix: The all-pairs matrix
+    """
+    if pokemon_data is None:
+        pokemon_data = POKEMON_DATA
+
+    names = [name for name, types in pokemon_data.items() if types]
+
+    # Group species by type combination, then by (type combination, move mask)
+    typing_of = {}
+    typing_masks = []
+    class_of = {}
+    class_keys = []
+    species_class = []
+    for name in names:
+        typing = type_mask(pokemon_data[name])
+        if typing not in typing_of:
+            typing_of[typing] = len(typing_masks)
+            typing_masks.append(typing)
+        key = (typing_of[typing], get_compiled_learnset(name).type_mask)
+        if key not in class_of:
+            class_of[key] = len(class_keys)
+            class_keys.append(key)
+        species_class.append(class_of[key])
+
+    typing_synergy = [
+        [type_mask_pair_synergy(typing1, typing2) for typing2 in typing_masks]
+        for typing1 in typing_masks
+    ]
+
+    # Expand each class row to species columns once; species rows copy it
+    class_rows = []
+    for typing1, move_mask1 in class_keys:
+        type_row = typing_synergy[typing1]
+        class_row = [
+            min(type_row[typing2] + popcount(move_mask1 | move_mask2) * 0.1, 1.0)
+            for typing2, move_mask2 in class_keys
+        ]
+        class_rows.append(array('d', [class_row[c] for c in species_class]))
+
+    values = array('d')
+    for c in species_class:
+        values.extend(class_rows[c])
+    return SynergyMatrix(names, values)
+
+
+_roster_matrix = None
+
+
+def get_synergy_matrix(cache_path=None):
+    """
+    Get the roster-wide synergy matrix, building it on first use.
+
+    Args:
+        cache_path (str): Optional file to load the matrix from, or to write
+            it to after building; a file written for different data is
+            rebuilt
+
+    Returns:
+        SynergyMatrix: The matrix for POKEMON_DATA
+    """
+    global _roster_matrix
+
+    if _roster_matrix is None:
+        if cache_path is not None:
+            _roster_matrix = load_or_build(cache_path, SynergyMatrix.load, build_synergy_matrix)
+        else:
+            _roster_matrix = build_synergy_matrix()
+    return _roster_matrix
+
+
+@register_invalidation_hook
+def clear_synergy_matrix():
+    """Drop the cached roster matrix so it is rebuilt on next use."""
+    global _roster_matrix
+    _roster_matrix = None
@@ -4,9 +4,15 @@ This module provides team analysis, coverage checking, weakness identification,
 """
 
 from ..data.pokemon_data import POKEMON_DATA, TYPE_CHART, ALL_TYPES
-from ..data.move_data import get_moves_for_pokemon, get_move_info
-from ..utils.move_recommender import analyze_move_coverage
-from collections import defaultdict, Counter
+from ..data.versioning import get_data_version
+from .result_cache import get_move_coverage, thaw
+from .defensive_profiles import get_defensive_profile
+from .learnset_store import get_compiled_learnset
+from .type_masks import ALL_TYPES_MASK, coverage_mask, neutral_coverage_mask, mask_to_types
+from .team_metrics import calculate_pair_synergy
+from .synergy_matrix import get_synergy_matrix
+from .team_optimizer import find_best_teams, find_good_teams, rank_additions
+from collections import Counter
 
 
 class TeamBuilder:
@@ -15,6 +21,10 @@ class TeamBuilder:
     def __init__(self):
         self.team = []
         self.team_analysis = {}
+        # Bumped on every team change; analysis is reused while it matches
+        self._team_version = 0
+        self._analysis_key = None
+        self._reset_aggregates()
     
     def add_pokemon(self, pokemon_name):
         """Add a Pokémon to the team."""
@@ -30,11 +40,13 @@ class TeamBuilder:
         pokemon_types = POKEMON_DATA[pokemon_name]
         pokemon_data = {
             'name': pokemon_name,
-            'types': pokemon_types,
-            'move_coverage': analyze_move_coverage(pokemon_name, POKEMON_DATA)
+            'types': list(pokemon_types),
+            'move_coverage': thaw(get_move_coverage(pokemon_name))
         }
         
         self.team.append(pokemon_data)
+        self._add_to_aggregates(pokemon_data)
+        self._team_version += 1
         return True, f"{pokemon_name} added to team."
     
     def remove_pokemon(self, pokemon_name):
@@ -42,47 +54,157 @@ class TeamBuilder:
         for i, pokemon in enumerate(self.team):
             if pokemon['name'] == pokemon_name:
                 removed = self.team.pop(i)
+                if self._aggregates_version != get_data_version():
+                    # The aggregates were built from older data than the
+                    # removed member's current learnset, so start over
+                    self._rebuild_aggregates()
+                else:
+                    self._remove_from_aggregates(removed)
+                self._team_version += 1
                 return True, f"{removed['name']} removed from team."
         return False, f"{pokemon_name} not found in team."
     
     def clear_team(self):
         """Clear the entire team."""
         self.team.clear()
+        self._reset_aggregates()
+        self._team_version += 1
         return True, "Team cleared."
     
+    def _rebuild_aggregates(self):
+        """Recompute the running aggregates from scratch after a data change."""
+        team = self.team
+        self.team = []
+        self._reset_aggregates()
+        for pokemon in team:
+            self.team.append(pokemon)
+            self._add_to_aggregates(pokemon)
+    
+    def _reset_aggregates(self):
+        """Reset the running team aggregates to the empty-team state."""
+        self._aggregates_version = get_data_version()
+        # Team position of each member, used to order aggregate keys
+        self._positions = {}
+        self._type_counts = Counter()
+        # Per attacking type index: member names in team order
+        self._weak_members = [[] for _ in ALL_TYPES]
+        self._resistant_members = [[] for _ in ALL_TYPES]
+        self._immune_members = [[] for _ in ALL_TYPES]
+        # Move type -> (member name, move name) entries in team order
+        self._move_entries = {}
+    
+    def _add_to_aggregates(self, pokemon):
+        """Fold a newly appended team member into the running aggregates."""
+        pokemon_name = pokemon['name']
+        self._positions[pokemon_name] = len(self.team) - 1
+        self._type_counts.update(pokemon['types'])
+        
+        multipliers = get_defensive_profile(pokemon['types']).multipliers
+        for type_index, effectiveness in enumerate(multipliers):
+            if effectiveness > 1.0:
+                self._weak_members[type_index].append(pokemon_name)
+            elif effectiveness < 1.0:
+                self._resistant_members[type_index].append(pokemon_name)
+            if effectiveness == 0.0:
+                self._immune_members[type_index].append(pokemon_name)
+        
+        learnset = get_compiled_learnset(pokemon_name)
+        for move_name, move_info in zip(learnset.move_names, learnset.move_info):
+            self._move_entries.setdefault(move_info[0], []).append((pokemon_name, move_name))
+    
+    def _remove_from_aggregates(self, pokemon):
+        """
+        Take a removed team member out of the running aggregates.
+        
+        The aggregates must have been built from the current data version,
+        since the member's move entries are found through its learnset.
+        """
+        pokemon_name = pokemon['name']
+        self._positions = {p['name']: i for i, p in enumerate(self.team)}
+        self._type_counts.subtract(pokemon['types'])
+        for pokemon_type in pokemon['types']:
+            if self._type_counts[pokemon_type] <= 0:
+                del self._type_counts[pokemon_type]
+        
+        for members in (self._weak_members, self._resistant_members, self._immune_members):
+            for type_members in members:
+                if pokemon_name in type_members:
+                    type_members.remove(pokemon_name)
+        
+        for move_type in get_compiled_learnset(pokemon_name).move_types:
+            entries = [entry for entry in self._move_entries[move_type] if entry[0] != pokemon_name]
+            if entries:
+                self._move_entries[move_type] = entries
+            else:
+                del self._move_entries[move_type]
+    
+    def _ordered_type_indices(self, members_by_type):
+        """
+        Get type indices with members, ordered as a scan of the team would
+        first encounter them (earliest member first, then type order).
+        """
+        positions = self._positions
+        return sorted(
+            (i for i, members in enumerate(members_by_type) if members),
+            key=lambda i: (positions[members_by_type[i][0]], i)
+        )
+    
     def get_team(self):
         """Get the current team."""
         return self.team.copy()
     
     def analyze_team(self):
-        """Perform comprehensive team analysis."""
+        """
+        Perform comprehensive team analysis.
+        
+        Each section is computed once per team state and shared with the
+        recommendations; repeated calls without a team or data change return
+        the stored analysis.
+        """
         if not self.team:
             return {
                 'status': 'empty',
                 'message': 'No Pokémon in team to analyze.'
             }
         
+        analysis_key = (self._team_version, get_data_version())
+        if self._analysis_key == analysis_key:
+            return self.team_analysis
+        if self._aggregates_version != analysis_key[1]:
+            self._rebuild_aggregates()
+        
+        type_analysis = self._analyze_team_types()
+        coverage_analysis = self._analyze_team_coverage()
+        weakness_analysis = self._analyze_team_weaknesses()
+        
         analysis = {
             'team_size': len(self.team),
             'pokemon_list': [p['name'] for p in self.team],
-            'type_analysis': self._analyze_team_types(),
-            'coverage_analysis': self._analyze_team_coverage(),
-            'weakness_analysis': self._analyze_team_weaknesses(),
+            'type_analysis': type_analysis,
+            'coverage_analysis': coverage_analysis,
+            'weakness_analysis': weakness_analysis,
             'synergy_analysis': self._analyze_team_synergy(),
-            'recommendations': self._generate_team_recommendations()
+            'recommendations': self._generate_team_recommendations(
+                type_analysis, coverage_analysis, weakness_analysis
+            )
         }
         
         self.team_analysis = analysis
+        self._analysis_key = analysis_key
         return analysis
     
     def _analyze_team_types(self):
         """Analyze the type distribution in the team."""
+        # Counts come from the running aggregate; the team scan only fixes
+        # the key order so ties rank by first appearance
         type_counts = Counter()
         type_combinations = []
         
         for pokemon in self.team:
             types = pokemon['types']
-            type_counts.update(types)
+            for pokemon_type in types:
+                if pokemon_type not in type_counts:
+                    type_counts[pokemon_type] = self._type_counts[pokemon_type]
             type_combinations.append(f"{pokemon['name']}: {'/'.join(types)}")
         
         # Find most and least common types
@@ -105,19 +227,20 @@ class TeamBuilder:
     
     def _analyze_team_coverage(self):
         """Analyze the offensive coverage of the team."""
-        team_moves = defaultdict(list)
-        coverage_by_type = defaultdict(list)
+        # Order move types as a scan of the team's learnsets would find them
+        positions = self._positions
+        move_entries = self._move_entries
         
-        for pokemon in self.team:
-            pokemon_name = pokemon['name']
-            available_moves = get_moves_for_pokemon(pokemon_name)
-            
-            for move_name in available_moves:
-                move_info = get_move_info(move_name)
-                if move_info:
-                    move_type = move_info[0]
-                    team_moves[move_type].append(f"{pokemon_name}: {move_name}")
-                    coverage_by_type[move_type].append(pokemon_name)
+        def first_seen(move_type):
+            first_member = move_entries[move_type][0][0]
+            return positions[first_member], get_compiled_learnset(first_member).move_types.index(move_type)
+        
+        team_moves = {}
+        coverage_by_type = {}
+        for move_type in sorted(move_entries, key=first_seen):
+            entries = move_entries[move_type]
+            team_moves[move_type] = [f"{pokemon_name}: {move_name}" for pokemon_name, move_name in entries]
+            coverage_by_type[move_type] = [pokemon_name for pokemon_name, _ in entries]
         
         # Calculate coverage effectiveness against each type
         coverage_effectiveness = {}
@@ -130,7 +253,7 @@ class TeamBuilder:
                     type_effectiveness = TYPE_CHART[attacking_type][defending_type]
                     if type_effectiveness > effectiveness:
                         effectiveness = type_effectiveness
-                        best_attackers = attackers
+                        best_attackers = list(attackers)
                     elif type_effectiveness == effectiveness:
                         best_attackers.extend(attackers)
             
@@ -139,13 +262,16 @@ class TeamBuilder:
                 'attackers': list(set(best_attackers))
             }
         
-        # Find coverage gaps
-        coverage_gaps = [t for t, data in coverage_effectiveness.items() if data['effectiveness'] < 1.0]
-        excellent_coverage = [t for t, data in coverage_effectiveness.items() if data['effectiveness'] >= 2.0]
+        # Find coverage gaps (types no team move hits at least neutrally)
+        team_move_mask = 0
+        for pokemon in self.team:
+            team_move_mask |= get_compiled_learnset(pokemon['name']).type_mask
+        coverage_gaps = mask_to_types(ALL_TYPES_MASK & ~neutral_coverage_mask(team_move_mask))
+        excellent_coverage = mask_to_types(coverage_mask(team_move_mask))
         
         return {
-            'team_moves': dict(team_moves),
-            'coverage_by_type': dict(coverage_by_type),
+            'team_moves': team_moves,
+            'coverage_by_type': coverage_by_type,
             'coverage_effectiveness': coverage_effectiveness,
             'coverage_gaps': coverage_gaps,
             'excellent_coverage': excellent_coverage,
@@ -154,37 +280,32 @@ class TeamBuilder:
     
     def _analyze_team_weaknesses(self):
         """Analyze defensive weaknesses in the team."""
-        team_weaknesses = defaultdict(list)
-        team_resistances = defaultdict(list)
-        team_immunities = defaultdict(list)
-        
-        for pokemon in self.team:
-            pokemon_name = pokemon['name']
-            pokemon_types = pokemon['types']
-            
-            for attacking_type in ALL_TYPES:
-                effectiveness = 1.0
-                for defending_type in pokemon_types:
-                    if attacking_type in TYPE_CHART and defending_type in TYPE_CHART[attacking_type]:
-                        effectiveness *= TYPE_CHART[attacking_type][defending_type]
-                
-                if effectiveness > 1.0:
-                    team_weaknesses[attacking_type].append(pokemon_name)
-                elif effectiveness < 1.0:
-                    team_resistances[attacking_type].append(pokemon_name)
-                if effectiveness == 0.0:
-                    team_immunities[attacking_type].append(pokemon_name)
+        team_weaknesses = {
+            ALL_TYPES[i]: list(self._weak_members[i])
+            for i in self._ordered_type_indices(self._weak_members)
+        }
+        team_resistances = {
+            ALL_TYPES[i]: list(self._resistant_members[i])
+            for i in self._ordered_type_indices(self._resistant_members)
+        }
+        team_immunities = {
+            ALL_TYPES[i]: list(self._immune_members[i])
+            for i in self._ordered_type_indices(self._immune_members)
+        }
         
         # Find critical weaknesses (affecting multiple team members)
         critical_weaknesses = {t: pokemon for t, pokemon in team_weaknesses.items() if len(pokemon) >= 2}
         
         # Find defensive gaps (no resistance to certain types)
-        defensive_gaps = [t for t in ALL_TYPES if t not in team_resistances and t not in team_immunities]
+        team_resist_mask = 0
+        for pokemon in self.team:
+            team_resist_mask |= get_defensive_profile(pokemon['types']).resist_mask
+        defensive_gaps = mask_to_types(ALL_TYPES_MASK & ~team_resist_mask)
         
         return {
-            'team_weaknesses': dict(team_weaknesses),
-            'team_resistances': dict(team_resistances),
-            'team_immunities': dict(team_immunities),
+            'team_weaknesses': team_weaknesses,
+            'team_resistances': team_resistances,
+            'team_immunities': team_immunities,
             'critical_weaknesses': critical_weaknesses,
             'defensive_gaps': defensive_gaps,
             'weakness_score': len(critical_weaknesses) / 18
@@ -195,9 +316,13 @@ class TeamBuilder:
         synergy_pairs = []
         anti_synergy_pairs = []
         
+        matrix = get_synergy_matrix()
         for i, pokemon1 in enumerate(self.team):
             for j, pokemon2 in enumerate(self.team[i+1:], i+1):
-                synergy_score = self._calculate_pair_synergy(pokemon1, pokemon2)
+                if pokemon1['name'] in matrix and pokemon2['name'] in matrix:
+                    synergy_score = matrix.synergy(pokemon1['name'], pokemon2['name'])
+                else:
+                    synergy_score = self._calculate_pair_synergy(pokemon1, pokemon2)
                 
                 if synergy_score > 0.7:
                     synergy_pairs.append({
@@ -226,43 +351,10 @@ class TeamBuilder:
     
     def _calculate_pair_synergy(self, pokemon1, pokemon2):
         """Calculate synergy score between two Pokémon."""
-        score = 0.0
-        
-        # Type synergy (resistances and immunities)
-        types1 = set(pokemon1['types'])
-        types2 = set(pokemon2['types'])
-        
-        # Check if they cover each other's weaknesses
-        for type1 in types1:
-            for type2 in types2:
-                if type1 in TYPE_CHART and type2 in TYPE_CHART[type1]:
-                    if TYPE_CHART[type1][type2] < 1.0:  # Resistance
-                        score += 0.2
-                    elif TYPE_CHART[type1][type2] == 0.0:  # Immunity
-                        score += 0.4
-        
-        # Move coverage synergy
-        moves1 = get_moves_for_pokemon(pokemon1['name'])
-        moves2 = get_moves_for_pokemon(pokemon2['name'])
-        
-        move_types1 = set()
-        move_types2 = set()
-        
-        for move in moves1:
-            move_info = get_move_info(move)
-            if move_info:
-                move_types1.add(move_info[0])
-        
-        for move in moves2:
-            move_info = get_move_info(move)
-            if move_info:
-                move_types2.add(move_info[0])
-        
-        # Different move types = better coverage
-        unique_types = len(move_types1.union(move_types2))
-        score += unique_types * 0.1
-        
-        return min(score, 1.0)
+        return calculate_pair_synergy(
+            pokemon1['types'], get_compiled_learnset(pokemon1['name']).type_mask,
+            pokemon2['types'], get_compiled_learnset(pokemon2['name']).type_mask
+        )
     
     def _get_synergy_reason(self, pokemon1, pokemon2):
         """Get reason for good synergy between two Pokémon."""
@@ -304,26 +396,23 @@ class TeamBuilder:
         
         return "; ".join(reasons)
     
-    def _generate_team_recommendations(self):
-        """Generate recommendations for improving the team."""
+    def _generate_team_recommendations(self, type_analysis, coverage_analysis, weakness_analysis):
+        """Generate recommendations for improving the team from its analysis sections."""
         recommendations = []
         
         if len(self.team) < 6:
             recommendations.append(f"Add {6 - len(self.team)} more Pokémon to complete your team.")
         
         # Coverage recommendations
-        coverage_analysis = self._analyze_team_coverage()
         if coverage_analysis['coverage_gaps']:
             recommendations.append(f"Add moves to cover: {', '.join(coverage_analysis['coverage_gaps'][:3])}")
         
         # Weakness recommendations
-        weakness_analysis = self._analyze_team_weaknesses()
         if weakness_analysis['critical_weaknesses']:
             weak_types = list(weakness_analysis['critical_weaknesses'].keys())[:3]
             recommendations.append(f"Add resistance to: {', '.join(weak_types)}")
         
         # Type diversity recommendations
-        type_analysis = self._analyze_team_types()
         if type_analysis['diversity_score'] < 0.5:
             recommendations.append("Consider adding more diverse Pokémon types for better coverage.")
         
@@ -345,30 +434,83 @@ class TeamBuilder:
         if not self.team:
             return self._suggest_balanced_starters()
         
-        analysis = self.analyze_team()
-        suggestions = []
-        
-        # Suggest based on coverage gaps
-        coverage_gaps = analysis['coverage_analysis']['coverage_gaps']
-        if coverage_gaps:
-            for gap_type in coverage_gaps[:2]:
-                suggestions.extend(self._find_pokemon_with_type(gap_type))
-        
-        # Suggest based on weaknesses
-        critical_weaknesses = analysis['weakness_analysis']['critical_weaknesses']
-        if critical_weaknesses:
-            for weak_type in list(critical_weaknesses.keys())[:2]:
-                suggestions.extend(self._find_pokemon_resistant_to(weak_type))
-        
-        # Remove duplicates and already in team
-        unique_suggestions = []
-        team_names = [p['name'] for p in self.team]
-        
-        for suggestion in suggestions:
-            if suggestion not in unique_suggestions and suggestion not in team_names:
-                unique_suggestions.append(suggestion)
+        return [suggestion['name'] for suggestion in self.rank_suggestions(top_k=5)]
+    
+    def _search_core(self):
+        """Get the names of team members the optimizer can score (those with types)."""
+        return [p['name'] for p in self.team if p['types']]
+    
+    def rank_suggestions(self, top_k=5, objective=None):
+        """
+        Rank every Pokémon by how much adding it would improve the team.
         
-        return unique_suggestions[:5]  # Return top 5 suggestions
+        Args:
+            top_k (int): Number of suggestions to return (None for all)
+            objective: Custom objective (TeamObjective by default)
+            
+        Returns:
+            list: Suggestion dicts with name, types, score (change in team
+            score) and breakdown (change in each score component), best first
+        """
+        additions = rank_additions(
+            core=self._search_core(),
+            top_k=top_k,
+            objective=objective
+        )
+        return [
+            {
+                'name': addition.name,
+                'types': list(POKEMON_DATA[addition.name]),
+                'score': addition.score,
+                'breakdown': addition.breakdown
+            }
+            for addition in additions
+        ]
+    
+    def complete_team(self, time_budget=1.0, progress=None, top_k=3, objective=None):
+        """
+        Find good completions of the current team within a time budget.
+        
+        Unlike find_best_teams this does not search exhaustively, so it stays
+        interactive on large rosters; the best teams found when the budget
+        runs out are returned.
+        
+        Args:
+            time_budget (float): Seconds to spend searching
+            progress (callable): Called as progress(result, elapsed) with the
+                best TeamResult so far each time it improves
+            top_k (int): Number of teams to return
+            objective: Custom objective (TeamObjective by default)
+            
+        Returns:
+            list: TeamResult entries, best first
+        """
+        return find_good_teams(
+            core=self._search_core(),
+            time_budget=time_budget,
+            top_k=top_k,
+            objective=objective,
+            progress=progress
+        )
+    
+    def find_best_teams(self, top_k=5, objective=None, parallel=False):
+        """
+        Find the best full teams that keep the current members.
+        
+        Args:
+            top_k (int): Number of teams to return
+            objective: Custom objective (TeamObjective by default)
+            parallel (bool): Whether to search with a process pool
+            
+        Returns:
+            list: TeamResult entries, best first
+        """
+        return find_best_teams(
+            core=self._search_core(),
+            top_k=top_k,
+            objective=objective,
+            parallel=parallel
+        )
     
     def _suggest_balanced_starters(self):
         """Suggest a balanced starter team."""
@@ -380,28 +522,6 @@ class TeamBuilder:
             "Machamp",    # Fighting
             "Gengar"      # Ghost/Poison
         ]
-    
-    def _find_pokemon_with_type(self, target_type):
-        """Find Pokémon that have a specific type."""
-        pokemon_with_type = []
-        for pokemon_name, types in POKEMON_DATA.items():
-            if target_type in types:
-                pokemon_with_type.append(pokemon_name)
-        return pokemon_with_type[:3]  # Return top 3
-    
-    def _find_pokemon_resistant_to(self, target_type):
-        """Find Pokémon that resist a specific type."""
-        resistant_pokemon = []
-        for pokemon_name, types in POKEMON_DATA.items():
-            effectiveness = 1.0
-            for defending_type in types:
-                if target_type in TYPE_CHART and defending_type in TYPE_CHART[target_type]:
-                    effectiveness *= TYPE_CHART[target_type][defending_type]
-            
-            if effectiveness < 1.0:
-                resistant_pokemon.append(pokemon_name)
-        
-        return resistant_pokemon[:3]  # Return top 3
 
 
 def analyze_team_from_list(pokemon_list):
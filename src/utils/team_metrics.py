@@ -0,0 +1,62 @@
+"""
+Team scoring primitives shared by team analysis and team search.
+These functions work on plain type lists and move-type bitmasks so they can
+be used both on live TeamBuilder members and on compiled roster tables.
+"""
+
+from .type_masks import type_mask, mask_indices, popcount, resisted_mask
+
+
+def type_pair_synergy(types1, types2):
+    """
+    Score the type interaction part of pair synergy.
+
+    Args:
+        types1 (list): Types of the first Pokémon
+        types2 (list): Types of the second Pokémon
+
+    Returns:
+        float: Type synergy contribution (not capped)
+    """
+    return type_mask_pair_synergy(type_mask(types1), type_mask(types2))
+
+
+def type_mask_pair_synergy(type_mask1, type_mask2):
+    """
+    Score the type interaction part of pair synergy from type bitmasks.
+
+    Each type of the first Pokémon that a type of the second resists (or
+    is immune to) adds 0.2.
+
+    Args:
+        type_mask1 (int): Type bitmask of the first Pokémon
+        type_mask2 (int): Type bitmask of the second Pokémon
+
+    Returns:
+        float: Type synergy contribution (not capped)
+    """
+    resisted_pairs = 0
+    for attacking_index in mask_indices(type_mask1):
+        resisted_pairs += popcount(resisted_mask(attacking_index) & type_mask2)
+    return resisted_pairs * 0.2
+
+
+def calculate_pair_synergy(types1, move_mask1, types2, move_mask2):
+    """
+    Calculate the synergy score between two Pokémon.
+
+    Args:
+        types1 (list): Types of the first Pokémon
+        move_mask1 (int): Move-type bitmask of the first Pokémon
+        types2 (list): Types of the second Pokémon
+        move_mask2 (int): Move-type bitmask of the second Pokémon
+
+    Returns:
+        float: Synergy score between 0.0 and 1.0
+    """
+    score = type_pair_synergy(types1, types2)
+    
+    # Different move types = better coverage
+    score += popcount(move_mask1 | move_mask2) * 0.1
+    
+    return min(score, 1.0)
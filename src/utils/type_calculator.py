@@ -3,7 +3,10 @@ Type effectiveness calculation utilities.
 This module contains functions for calculating Pokémon type matchups.
 """
 
-from ..data.pokemon_data import TYPE_CHART
+from functools import partial
+
+from .defensive_profiles import defensive_multiplier
+from .lazy_results import LazyRecord
 
 
 def calculate_type_effectiveness(attacking_type, defending_types):
@@ -18,10 +21,7 @@ def calculate_type_effectiveness(attacking_type, defending_types):
     Returns:
         float: The effectiveness multiplier (0.0, 0.5, 1.0, or 2.0)
     """
-    multiplier = 1.0
-    for d_type in defending_types:
-        multiplier *= TYPE_CHART.get(attacking_type, {}).get(d_type, 1.0)
-    return multiplier
+    return defensive_multiplier(attacking_type, defending_types)
 
 
 def analyze_matchup(your_pokemon_name, opponent_pokemon_name, pokemon_data):
@@ -34,7 +34,8 @@ def analyze_matchup(your_pokemon_name, opponent_pokemon_name, pokemon_data):
         pokemon_data (dict): Dictionary containing Pokémon type data
         
     Returns:
-        dict: Dictionary containing analysis results
+        dict: Dictionary containing analysis results. Each offensive detail
+        renders its 'description' text only when it is first read.
     """
     your_pokemon_types = pokemon_data.get(your_pokemon_name, [])
     opponent_pokemon_types = pokemon_data.get(opponent_pokemon_name, [])
@@ -50,11 +51,10 @@ def analyze_matchup(your_pokemon_name, opponent_pokemon_name, pokemon_data):
         effectiveness = calculate_type_effectiveness(your_atk_type, opponent_pokemon_types)
         your_offensive_multiplier = max(your_offensive_multiplier, effectiveness)
         
-        detail = {
-            'type': your_atk_type,
-            'effectiveness': effectiveness,
-            'description': _get_effectiveness_description(effectiveness, your_atk_type, opponent_pokemon_name)
-        }
+        detail = LazyRecord(
+            {'type': your_atk_type, 'effectiveness': effectiveness},
+            {'description': partial(_get_effectiveness_description, effectiveness, your_atk_type, opponent_pokemon_name)}
+        )
         your_offensive_details.append(detail)
     
     # Opponent Pokémon's offensive capability
@@ -65,11 +65,10 @@ def analyze_matchup(your_pokemon_name, opponent_pokemon_name, pokemon_data):
         effectiveness = calculate_type_effectiveness(opp_atk_type, your_pokemon_types)
         opponent_offensive_multiplier = max(opponent_offensive_multiplier, effectiveness)
         
-        detail = {
-            'type': opp_atk_type,
-            'effectiveness': effectiveness,
-            'description': _get_defensive_description(effectiveness, opp_atk_type, your_pokemon_name)
-        }
+        detail = LazyRecord(
+            {'type': opp_atk_type, 'effectiveness': effectiveness},
+            {'description': partial(_get_defensive_description, effectiveness, opp_atk_type, your_pokemon_name)}
+        )
         opponent_offensive_details.append(detail)
     
     # Overall matchup summary
@@ -78,13 +77,13 @@ def analyze_matchup(your_pokemon_name, opponent_pokemon_name, pokemon_data):
     return {
         'your_pokemon': {
             'name': your_pokemon_name,
-            'types': your_pokemon_types,
+            'types': list(your_pokemon_types),
             'offensive_multiplier': your_offensive_multiplier,
             'offensive_details': your_offensive_details
         },
         'opponent_pokemon': {
             'name': opponent_pokemon_name,
-            'types': opponent_pokemon_types,
+            'types': list(opponent_pokemon_types),
             'offensive_multiplier': opponent_offensive_multiplier,
             'offensive_details': opponent_offensive_details
         },
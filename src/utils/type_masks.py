@@ -0,0 +1,137 @@
+"""
+Bitmask-encoded type sets.
+With 18 types, any set of types fits in an int where bit i stands for
+ALL_TYPES[i], so union, intersection and size are single integer operations
+instead of building sets of type-name strings.
+"""
+
+from ..data.pokemon_data import ALL_TYPES
+from .type_matrix import NUM_TYPES, TYPE_INDEX, get_type_matrix
+
+# Mask with every type set
+ALL_TYPES_MASK = (1 << NUM_TYPES) - 1
+
+# Per attacking type index: masks of single defending types it hits
+# super effectively, hits at neutral or better, and is resisted by
+_SUPER_EFFECTIVE = ()
+_NOT_RESISTED = ()
+_RESISTED = ()
+
+# Matrix the tables were built from, used to detect TYPE_CHART rebuilds
+_built_from = None
+
+
+def type_mask(types):
+    """
+    Encode type names as a bitmask.
+
+    Unknown type names are dropped, as in encode_types().
+
+    Args:
+        types (iterable): Type names
+
+    Returns:
+        int: Type bitmask
+    """
+    mask = 0
+    for type_name in types:
+        type_index = TYPE_INDEX.get(type_name)
+        if type_index is not None:
+            mask |= 1 << type_index
+    return mask
+
+
+def indices_mask(type_indices):
+    """Encode type indices as a bitmask."""
+    mask = 0
+    for type_index in type_indices:
+        mask |= 1 << type_index
+    return mask
+
+
+def mask_indices(mask):
+    """Get the type indices set in a bitmask, in ascending order."""
+    return [type_index for type_index in range(NUM_TYPES) if mask >> type_index & 1]
+
+
+def mask_to_types(mask):
+    """Get the type names set in a bitmask, in ALL_TYPES order."""
+    return [ALL_TYPES[type_index] for type_index in range(NUM_TYPES) if mask >> type_index & 1]
+
+
+def popcount(mask):
+    """Count the types set in a bitmask."""
+    return bin(mask).count("1")
+
+
+if hasattr(int, 'bit_count'):
+    # Python 3.10+ has a native popcount
+    popcount = int.bit_count
+
+
+def _ensure_built():
+    """Build (or rebuild after a TYPE_CHART change) the per-type masks."""
+    global _SUPER_EFFECTIVE, _NOT_RESISTED, _RESISTED, _built_from
+
+    matrix = get_type_matrix()
+    if _built_from is matrix:
+        return
+
+    _SUPER_EFFECTIVE = tuple(
+        indices_mask(d for d in range(NUM_TYPES) if row[d] >= 2.0) for row in matrix
+    )
+    _NOT_RESISTED = tuple(
+        indices_mask(d for d in range(NUM_TYPES) if row[d] >= 1.0) for row in matrix
+    )
+    _RESISTED = tuple(
+        indices_mask(d for d in range(NUM_TYPES) if row[d] < 1.0) for row in matrix
+    )
+    _built_from = matrix
+
+
+def super_effective_mask(attacking_index):
+    """Get the single defending types an attacking type index hits super effectively."""
+    _ensure_built()
+    return _SUPER_EFFECTIVE[attacking_index]
+
+
+def resisted_mask(attacking_index):
+    """Get the single defending types that resist (or are immune to) an attacking type index."""
+    _ensure_built()
+    return _RESISTED[attacking_index]
+
+
+def coverage_mask(move_mask):
+    """
+    Get the single defending types hit super effectively by a set of move types.
+
+    Args:
+        move_mask (int): Bitmask of attacking move types
+
+    Returns:
+        int: Bitmask of defending types
+    """
+    _ensure_built()
+    covered = 0
+    for attacking_index in range(NUM_TYPES):
+        if move_mask >> attacking_index & 1:
+            covered |= _SUPER_EFFECTIVE[attacking_index]
+    return covered
+
+
+def neutral_coverage_mask(move_mask):
+    """
+    Get the single defending types hit at neutral or better by a set of move types.
+
+    Args:
+        move_mask (int): Bitmask of attacking move types
+
+    Returns:
+        int: Bitmask of defending types
+    """
+    _ensure_built()
+    covered = 0
+    for attacking_index in range(NUM_TYPES):
+        if move_mask >> attacking_index & 1:
+            covered |= _NOT_RESISTED[attacking_index]
+    return covered
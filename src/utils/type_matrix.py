@@ -0,0 +1,146 @@
+"""
+Index-based type effectiveness engine.
+This module encodes the 18 standard types as small integers and keeps the
+type chart as a dense 18x18 matrix, so hot loops can score attacks with plain
+integer indexing instead of nested string-keyed dict lookups.
+"""
+
+from ..data.pokemon_data import ALL_TYPES, TYPE_CHART
+from ..data.versioning import register_invalidation_hook
+
+NUM_TYPES = len(ALL_TYPES)
+
+# Maps type names to their row/column in the effectiveness matrix
+TYPE_INDEX = {type_name: index for index, type_name in enumerate(ALL_TYPES)}
+
+# Dense matrix rows: _MATRIX[attacking_index][defending_index] -> multiplier
+_MATRIX = ()
+
+# Same rows keyed by attacking type name, for callers that start from strings
+_ROWS_BY_NAME = {}
+
+
+def rebuild_type_matrix():
+    """
+    Rebuild the dense matrix from TYPE_CHART.
+
+    Runs automatically from notify_data_changed() after TYPE_CHART has
+    been modified at runtime.
+    """
+    global _MATRIX, _ROWS_BY_NAME
+
+    _MATRIX = tuple(
+        tuple(TYPE_CHART.get(attacking_type, {}).get(defending_type, 1.0) for defending_type in ALL_TYPES)
+        for attacking_type in ALL_TYPES
+    )
+    _ROWS_BY_NAME = {attacking_type: _MATRIX[index] for attacking_type, index in TYPE_INDEX.items()}
+
+
+def get_type_matrix():
+    """Get the dense effectiveness matrix as a tuple of 18 row tuples."""
+    return _MATRIX
+
+
+def encode_types(types):
+    """
+    Encode a list of type names as a tuple of type indices.
+
+    Unknown type names are dropped, matching the neutral 1.0 multiplier
+    they receive in TYPE_CHART lookups.
+
+    Args:
+        types (list): List of type names
+
+    Returns:
+        tuple: Type indices
+    """
+    return tuple(TYPE_INDEX[t] for t in types if t in TYPE_INDEX)
+
+
+def effectiveness(attacking_index, defending_indices):
+    """
+    Calculate the combined multiplier of one attacking type index against
+    a tuple of defending type indices.
+    """
+    row = _MATRIX[attacking_index]
+    multiplier = 1.0
+    for defending_index in defending_indices:
+        multiplier *= row[defending_index]
+    return multiplier
+
+
+def effectiveness_by_name(attacking_type, defending_types):
+    """
+    Calculate the combined multiplier of an attacking type name against a
+    list of defending type names.
+
+    Args:
+        attacking_type (str): The type of the attacking move
+        defending_types (list): List of defending Pokémon's types
+
+    Returns:
+        float: The effectiveness multiplier
+    """
+    row = _ROWS_BY_NAME.get(attacking_type)
+    if row is None:
+        return 1.0
+
+    multiplier = 1.0
+    for defending_type in defending_types:
+        defending_index = TYPE_INDEX.get(defending_type)
+        if defending_index is not None:
+            multiplier *= row[defending_index]
+    return multiplier
+
+
+def score_against_many(attacking_type, defenders):
+    """
+    Score one attacking type against many defenders in one call.
+
+    Args:
+        attacking_type (str or int): Attacking type name or index
+        defenders (list): List of defending type lists (names) or index tuples
+
+    Returns:
+        list: One multiplier per defender, in input order
+    """
+    if isinstance(attacking_type, int):
+        row = _MATRIX[attacking_type]
+    else:
+        row = _ROWS_BY_NAME.get(attacking_type)
+        if row is None:
+            return [1.0] * len(defenders)
+
+    scores = []
+    for defender in defenders:
+        multiplier = 1.0
+        for defending_type in defender:
+            if isinstance(defending_type, str):
+                defending_type = TYPE_INDEX.get(defending_type)
+                if defending_type is None:
+                    continue
+            multiplier *= row[defending_type]
+        scores.append(multiplier)
+    return scores
+
+
+def score_matrix(attacking_types, defenders):
+    """
+    Score many attacking types against many defenders.
+
+    Args:
+        attacking_types (list): Attacking type names or indices
+        defenders (list): List of defending type lists (names) or index tuples
+
+    Returns:
+        list: One row per attacking type, one column per defender
+    """
+    encoded_defenders = [
+        encode_types(defender) if any(isinstance(t, str) for t in defender) else tuple(defender)
+        for defender in defenders
+    ]
+    return [score_against_many(attacking_type, encoded_defenders) for attacking_type in attacking_types]
+
+
+rebuild_type_matrix()
+register_invalidation_hook(rebuild_type_matrix)